@@ -30,6 +30,8 @@ class MonsterCard(Card):
         self.is_alive = True
         self.has_attack = has_attack
         self.type = monster_type  # Monster type (Scholar, Conqueror, etc.)
+        # Bumped by EffectTracker on every stat change
+        self.stats_version = 0
 
     def __str__(self):
         return f"Name: {self.name} \
@@ -49,8 +49,12 @@ class CardRegistry:
             raise ValueError("Unsupported JSON format")
 
     @classmethod
-    def create(cls, card_type: str, owner, name=None):
-        """Return a card instance for a player, optionally by name."""
+    def create(cls, card_type: str, owner, name=None, rng=None):
+        """Return a card instance for a player, optionally by name.
+
+        rng: random.Random used for unnamed picks, defaults to the
+        global `random` module.
+        """
         if card_type not in cls._registry:
             raise RuntimeError(f"Card type {card_type} not built yet")
         if not cls._registry[card_type]:
@@ -61,7 +65,8 @@ class CardRegistry:
             if not prototype:
                 return None
         else:
-            prototype = random.choice(list(cls._registry[card_type].values()))
+            prototype = (rng or random).choice(
+                list(cls._registry[card_type].values()))
 
         # Dynamically create card instance
         from core.cards.monster_card import MonsterCard
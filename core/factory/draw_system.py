@@ -8,7 +8,10 @@ logger = logging.getLogger(__name__)
 
 
 class DrawSystem:
-    def __init__(self):
+    def __init__(self, rng=None):
+        # random.Random for this draw system, global `random` if None
+        self.rng = rng or random
+
         # Weighted probabilities for each card category
         self.generic_draw = {
             'monster': 50,
@@ -17,11 +20,11 @@ class DrawSystem:
         }
 
         # Initialize factories
-        self.monster_factory = MonsterFactory()
+        self.monster_factory = MonsterFactory(rng)
         self.monster_factory.build()
-        self.spell_factory = SpellFactory()
+        self.spell_factory = SpellFactory(rng)
         self.spell_factory.build()
-        self.trap_factory = TrapFactory()
+        self.trap_factory = TrapFactory(rng)
         self.trap_factory.build()
 
         # Weighted tables for specific cards (or monster levels)
@@ -70,9 +73,9 @@ class DrawSystem:
         if total <= 0:
             logger.warning(
                 "All weights are zero or invalid, falling back to uniform choice.")
-            return random.choice(keys)
+            return self.rng.choice(keys)
 
-        return random.choices(keys, weights=weights, k=1)[0]
+        return self.rng.choices(keys, weights=weights, k=1)[0]
 
     # -------------------------------
     # Core: Draw a single card
@@ -84,7 +87,7 @@ class DrawSystem:
 
         try:
             if card_type == 'monster':
-                monster_type = random.choice(
+                monster_type = self.rng.choice(
                     ["Scholar", "Conqueror", "Forest Monster",
                         "Demon", "Forest Guard"]
                 )
@@ -93,7 +96,7 @@ class DrawSystem:
                 if not card:
                     logger.warning(f"Missing monster L{card_key} for {
                                    monster_type}, using fallback.")
-                    fallback_key = random.choice(
+                    fallback_key = self.rng.choice(
                         list(self.monster_factory.get_cards().keys()))
                     card = self.monster_factory.load(player, fallback_key)
 
@@ -126,7 +129,7 @@ class DrawSystem:
             card = None
             try:
                 if card_type == 'monster':
-                    monster_type = random.choice(
+                    monster_type = self.rng.choice(
                         ["Scholar", "Conqueror", "Forest Monster",
                             "Demon", "Forest Guard"]
                     )
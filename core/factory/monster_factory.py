@@ -15,8 +15,12 @@ class MonsterFactory:
             type_field="type"
         )
 
+    def __init__(self, rng=None):
+        self.rng = rng
+
     def load(self, player, name=None):
-        return CardRegistry.create("monster", owner=player, name=name)
+        return CardRegistry.create("monster", owner=player, name=name,
+                                   rng=self.rng)
 
     def load_by_type_and_level(self, player, monster_type: str, level_star: int):
         # Filter by type and level
@@ -26,7 +30,7 @@ class MonsterFactory:
         ]
         if not candidates:
             return None
-        selected_name = random.choice(candidates)
+        selected_name = (self.rng or random).choice(candidates)
         return self.load(player, name=selected_name)
 
     def get_cards(self):
@@ -13,8 +13,12 @@ class TrapFactory:
             CardClass=TrapCard
         )
 
+    def __init__(self, rng=None):
+        self.rng = rng
+
     def load(self, player, name=None):
-        return CardRegistry.create("trap", owner=player, name=name)
+        return CardRegistry.create("trap", owner=player, name=name,
+                                   rng=self.rng)
 
     def get_cards(self):
         return CardRegistry.list_cards("trap")
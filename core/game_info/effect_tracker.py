@@ -54,7 +54,7 @@ class EffectTracker:
         """Apply a one-time effect like destroy or heal"""
         if effect_type == EffectType.INSTANT:
             if stat and hasattr(target, stat):
-                setattr(target, stat, getattr(target, stat) + value)
+                self._change_stat(target, stat, value)
             # here you could expand: destroy, heal player LP, draw card, etc.
 
     def update_round(self):
@@ -71,25 +71,28 @@ class EffectTracker:
             self._remove_effect(effect)
             self.active_effects.remove(effect)
 
+    @staticmethod
+    def _change_stat(target, stat: str, delta: int):
+        """Add `delta` to a stat and bump the target's stats version, so
+        views caching anything derived from the stats refresh"""
+        setattr(target, stat, getattr(target, stat) + delta)
+        target.stats_version = getattr(target, "stats_version", 0) + 1
+
     def _apply_effect(self, effect: Effect):
         """Apply the effect to the target"""
         if hasattr(effect.target, effect.stat):
             if effect.effect_type == EffectType.BUFF:
-                setattr(effect.target, effect.stat,
-                        getattr(effect.target, effect.stat) + effect.value)
+                self._change_stat(effect.target, effect.stat, effect.value)
             elif effect.effect_type == EffectType.DEBUFF:
-                setattr(effect.target, effect.stat,
-                        getattr(effect.target, effect.stat) - effect.value)
+                self._change_stat(effect.target, effect.stat, -effect.value)
 
     def _remove_effect(self, effect: Effect):
         """Revert the effect when it expires"""
         if hasattr(effect.target, effect.stat):
             if effect.effect_type == EffectType.BUFF:
-                setattr(effect.target, effect.stat,
-                        getattr(effect.target, effect.stat) - effect.value)
+                self._change_stat(effect.target, effect.stat, -effect.value)
             elif effect.effect_type == EffectType.DEBUFF:
-                setattr(effect.target, effect.stat,
-                        getattr(effect.target, effect.stat) + effect.value)
+                self._change_stat(effect.target, effect.stat, effect.value)
 
     def get_effects_on_target(self, target: MonsterCard) -> List[Effect]:
         """Get all active effects on a monster"""
@@ -1,16 +1,19 @@
 from typing import Tuple, List, Optional, Literal
-from random import choice
+import random
 from core.player import Player
 from core.cards.card import Card
 from gui.gui_info.hand import CollectionInfo
+from core.utils import next_version
 import logging
 
 ModifyMode = Literal["add", "remove"]
 
 
 class GameState:
-    def __init__(self, players: List[Player], rows: int = 4, cols: int = 5):
+    def __init__(self, players: List[Player], rows: int = 4, cols: int = 5,
+                 rng=None):
         self.players: List[Player] = players
+        self.rng = rng or random
         self.game_over: bool = False
         self.max_cards: int = 10
 
@@ -55,6 +58,18 @@ class GameState:
         # Track which cards each player has on the field
         self._player_cards: dict[Player, List[Card]] = {
             player: [] for player in self.players}
+        self.touch()
+
+    def touch(self):
+        """Mark the field as changed, see `state_version`."""
+        self.version = next_version()
+
+    def state_version(self) -> Tuple[int, ...]:
+        """Changes whenever the field or a hand changes, so views only
+        resync with the state when it did."""
+        return (self.version,) + tuple(
+            self.player_info[player]["held_cards"].version
+            for player in self.players)
 
     def is_game_over(self) -> bool:
         """Check if any player's life points reached 0 and mark the game as over."""
@@ -102,6 +117,7 @@ class GameState:
             self.field_matrix[row][col] = card
             self._player_cards[card.owner].append(card)
             card.pos_in_matrix = pos
+            self.touch()
 
             self.logger.info(f"  ➕ Field modified: {card.name} placed at {
                              pos} by {card.owner.name}")
@@ -128,6 +144,7 @@ class GameState:
                     f"⚠️ FIELD MODIFY WARNING: Attempted to remove card from empty position {pos}")
 
             self.field_matrix[row][col] = None
+            self.touch()
 
     def get_player_cards(self, player: Player) -> List[Card]:
         """Return all cards a player currently has on the field."""
@@ -148,7 +165,7 @@ class GameState:
                 f"⚠️ No empty slots available for {player.name}")
             return None
 
-        slot = choice(empty_slots)
+        slot = self.rng.choice(empty_slots)
         self.logger.debug(f"Random empty slot selected for {player.name}: {
                           slot} (from {len(empty_slots)} available)")
         return slot
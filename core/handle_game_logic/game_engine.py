@@ -13,7 +13,10 @@ from core.handle_game_logic.turn_manager import TurnManager
 from core.game_info.effect_tracker import EffectTracker, EffectType
 from core.game_info.events import EventLogger, AttackEvent, TrapTriggerEvent, ToggleEvent, SpellActiveEvent, MergeEvent
 
+import io
 import logging
+import pickle
+import random
 from datetime import datetime
 import builtins
 
@@ -46,27 +49,60 @@ def setup_silent_logger(log_path: str = "logs/game_engine.log", level=logging.DE
     return logger
 
 
+class _SnapshotPickler(pickle.Pickler):
+    """Pickles engine state, keeping players and the RNG by reference."""
+
+    def __init__(self, file, engine):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.engine = engine
+
+    def persistent_id(self, obj):
+        if isinstance(obj, Player):
+            return ("player", self.engine.players.index(obj))
+        if obj is self.engine.rng:
+            return ("rng", 0)
+        return None
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+    def __init__(self, file, engine):
+        super().__init__(file)
+        self.engine = engine
+
+    def persistent_load(self, pid):
+        kind, idx = pid
+        if kind == "player":
+            return self.engine.players[idx]
+        if kind == "rng":
+            return self.engine.rng
+        raise pickle.UnpicklingError(f"Unknown persistent id {pid}")
+
+
 class GameEngine:
     def __init__(self,
                  players: List[Player],
                  verbose=True,
-                 log_to_file: bool = False):
-        self.game_state = GameState(players)
+                 log_to_file: bool = False,
+                 seed=None):
+        # One RNG stream per engine, shared by all game components
+        self.rng = random.Random(seed)
+
+        self.game_state = GameState(players, rng=self.rng)
         self.effect_tracker = EffectTracker()
         self.turn_manager = TurnManager(self.game_state, self.effect_tracker)
         self.rule_engine = RuleEngine(self.game_state, self.turn_manager)
-        self.draw_system = DrawSystem()
+        self.draw_system = DrawSystem(self.rng)
         self.event_logger = EventLogger()
 
         self.players = players
 
-        self.monster_factory = MonsterFactory()
+        self.monster_factory = MonsterFactory(self.rng)
         self.monster_factory.build()
 
-        self.spell_factory = SpellFactory()
+        self.spell_factory = SpellFactory(self.rng)
         self.spell_factory.build()
 
-        self.trap_factory = TrapFactory()
+        self.trap_factory = TrapFactory(self.rng)
         self.trap_factory.build()
 
         self.start_hand_count = 5
@@ -84,14 +120,55 @@ class GameEngine:
         # Action counter for tracking
         self.action_counter = 0
 
-    def reset(self):
+    def seed(self, seed):
+        """Reseed the engine RNG, e.g. with core.utils.derive_seed."""
+        self.rng.seed(seed)
+
+    def reset(self, seed=None):
+        if seed is not None:
+            self.seed(seed)
         self.effect_tracker.clear_all_effects()
         self.event_logger.clear_events()
         self.game_state.reset()
+        self.turn_manager.reset()
         self.action_counter = 0
         for player in self.players:
             player.reset()
 
+    def snapshot(self) -> bytes:
+        """
+        Serialize the mutable game state (board, hands, effects, turn,
+        life points and RNG state) so it can be restored with `restore`.
+        """
+        state = {
+            "game_state": self.game_state.__dict__,
+            "effect_tracker": self.effect_tracker.__dict__,
+            "event_logger": self.event_logger.__dict__,
+            "turn": (self.turn_manager.current_player_index,
+                     self.turn_manager.turn_count),
+            "players": [player.__dict__ for player in self.players],
+            "rng": self.rng.getstate(),
+            "action_counter": self.action_counter,
+        }
+        buffer = io.BytesIO()
+        _SnapshotPickler(buffer, self).dump(state)
+        return buffer.getvalue()
+
+    def restore(self, snapshot: bytes):
+        """Restore a state produced by `snapshot` on an engine with the
+        same players. The snapshot itself can be restored again later."""
+        state = _SnapshotUnpickler(io.BytesIO(snapshot), self).load()
+        self.game_state.__dict__.update(state["game_state"])
+        self.effect_tracker.__dict__.update(state["effect_tracker"])
+        self.event_logger.__dict__.update(state["event_logger"])
+        (self.turn_manager.current_player_index,
+         self.turn_manager.turn_count) = state["turn"]
+        for player, fields in zip(self.players, state["players"]):
+            player.__dict__.update(fields)
+        self.rng.setstate(state["rng"])
+        self.action_counter = state["action_counter"]
+        self.game_state.touch()
+
     def _log_action(self, action_type: str, player: Player, details: dict, success: bool):
         """Central logging method for all game actions"""
         self.action_counter += 1
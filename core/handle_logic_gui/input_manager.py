@@ -150,6 +150,9 @@ class InputManager:
                 self.matrix.areas["preview_card_table"].set_card(card_ui)
                 return
 
+    def drawables(self):
+        return [self.drag_arrow] if self.drag_arrow else []
+
     def draw(self, screen):
         if self.drag_arrow:
             self.drag_arrow.draw(screen)
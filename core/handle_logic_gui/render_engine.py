@@ -1,4 +1,3 @@
-import pygame
 from collections import defaultdict
 from gui.cards_gui.card_gui import CardGUI
 from gui.cards_gui.monster_card import MonsterCardGUI
@@ -25,18 +24,45 @@ class RenderEngine:
         self.exisiting_colors = defaultdict(dict)
         self.pending_merges = []
         self.animation_mgr = AnimationManager(train_mode=train_mode)
+        # GameState.state_version the sprites were last synced with
+        self.synced_version = None
 
     def reset(self):
         for value in self.sprites.values():
             value.clear()
         self.exisiting_colors = defaultdict(dict)
         self.pending_merges.clear()
+        self.synced_version = None
 
     def update(self, game_engine, game_state, matrix, events):
-        self.handle_events(matrix, events)
-        self.register_cards(game_state, matrix)
-        self.handle_merge(game_engine, game_state)
-        self.process_pending_merges()
+        """Play new events and resync sprites, merge highlights and hand
+        alignment, only when the field or a hand changed."""
+        if events.get_events():
+            self.handle_events(matrix, events)
+
+        version = game_state.state_version()
+        if version != self.synced_version:
+            retiring = self.register_cards(game_state, matrix)
+            self.handle_merge(game_engine, game_state)
+            # Keep syncing every frame while removed cards animate out
+            self.synced_version = None if retiring else version
+
+        if self.pending_merges:
+            self.process_pending_merges()
+
+    def rebind_cards(self, game_state):
+        """Point sprites at the cards of `game_state`, after a
+        `GameEngine.restore` replaced the card objects (ids are kept)."""
+        cards = {card.id: card
+                 for row in game_state.field_matrix for card in row if card}
+        for player in game_state.players:
+            for card in game_state.player_info[player]["held_cards"].cards:
+                cards[card.id] = card
+        for sprite_dict in self.sprites.values():
+            for cid, sprite in sprite_dict.items():
+                card = cards.get(cid)
+                if card is not None:
+                    sprite.logic_card = card
 
     def handle_merge(self, game_engine, game_state):
         for player in game_state.players:
@@ -65,9 +91,11 @@ class RenderEngine:
                 extc.pop(key, None)
 
     def register_cards(self, game_state, matrix):
-        self.register_hand(game_state, matrix)
-        self.register_matrix(game_state, matrix,
-                             self.animation_mgr.create_place_animation)
+        """Sync hand and field sprites, True while removed ones remain."""
+        hand = self.register_hand(game_state, matrix)
+        field = self.register_matrix(
+            game_state, matrix, self.animation_mgr.create_place_animation)
+        return hand or field
 
     def handle_events(self, matrix, events):
         try:
@@ -170,6 +198,9 @@ class RenderEngine:
                 if not self.is_pending_merge(cid):
                     add_animation(sprite_dict[cid])
 
+        # Removed sprites stay until their death or merge animation ends
+        return bool(to_remove)
+
     @staticmethod
     def create_gui_card(card, matrix):
         if card.ctype == "monster":
@@ -206,7 +237,7 @@ class RenderEngine:
         def make_hand_sprite(card):
             return self.create_gui_card(card, matrix)
 
-        self.sync_sprites(
+        return self.sync_sprites(
             desired_set=current_cards,
             sprite_dict=self.sprites["hand"],
             create_sprite=make_hand_sprite,
@@ -229,22 +260,19 @@ class RenderEngine:
             if isinstance(sprite, TrapCardGUI):
                 if card.owner.is_opponent:
                     sprite.is_face_down = True
-                    sprite.card_surface = pygame.transform.smoothscale(
-                        sprite.image_face_down.copy(), sprite.display_size)
+                    sprite.card_surface = sprite.get_face(face_up=False)
                 else:
                     sprite.is_face_down = False
-                    sprite._render_card_with_text()
+                    sprite.card_surface = sprite.get_face()
                 sprite.update()
             else:
                 sprite.is_face_down = False
-                sprite._render_card_with_text()
-                if card.owner.is_opponent:
-                    sprite.card_surface = pygame.transform.flip(
-                        sprite.card_surface, False, True)
+                sprite.card_surface = sprite.get_face(
+                    flipped=card.owner.is_opponent)
                 sprite.update()
             return sprite
 
-        self.sync_sprites(
+        return self.sync_sprites(
             desired_set=current_cards,
             sprite_dict=self.sprites["matrix"],
             add_animation=animation,
@@ -255,7 +283,11 @@ class RenderEngine:
         for hand in matrix.hands:
             hand.align(self.sprites["hand"], check=check)
 
+    def drawables(self):
+        """Card sprites in draw order."""
+        return [sprite for group in self.sprites.values()
+                for sprite in group.values()]
+
     def draw(self):
-        for group in self.sprites.values():
-            for sprite in group.values():
-                sprite.draw(self.screen)
+        for sprite in self.drawables():
+            sprite.draw(self.screen)
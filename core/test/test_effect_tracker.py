@@ -0,0 +1,23 @@
+from core.cards.monster_card import MonsterCard
+from core.game_info.effect_tracker import EffectTracker, EffectType
+from core.player import Player
+
+
+def test_stat_changes_bump_stats_version():
+    monster = MonsterCard("Tester", "", Player(0, "Tester"),
+                          attack_points=500, defense_points=400)
+    tracker = EffectTracker()
+    assert monster.stats_version == 0
+
+    tracker.add_effect(EffectType.BUFF, monster, "atk", 100, duration=1)
+    assert monster.atk == 600
+    assert monster.stats_version == 1
+
+    # Expiring the effect reverts the stat and bumps the version again
+    tracker.update_round()
+    assert monster.atk == 500
+    assert monster.stats_version == 2
+
+    tracker.apply_instant_effect(EffectType.INSTANT, monster, "defend", -100)
+    assert monster.defend == 300
+    assert monster.stats_version == 3
@@ -0,0 +1,67 @@
+from core.handle_game_logic.game_engine import GameEngine
+from core.player import Player
+
+
+def make_engine(seed=3):
+    engine = GameEngine([Player(0, "p1"), Player(1, "p2")],
+                        verbose=False, seed=seed)
+    engine.reset()
+    engine.start_game()
+    return engine
+
+
+def hands(engine):
+    return [
+        [card.name
+         for card in engine.game_state.player_info[p]["held_cards"].cards]
+        for p in engine.players
+    ]
+
+
+def test_restore_rewinds_state_and_rng():
+    engine = make_engine()
+    snapshot = engine.snapshot()
+    before = (hands(engine), engine.turn_manager.turn_count)
+
+    engine.end_turn()
+    engine.end_turn()
+    engine.players[0].life_points = 100
+    after = (hands(engine), engine.turn_manager.turn_count)
+
+    engine.restore(snapshot)
+    assert (hands(engine), engine.turn_manager.turn_count) == before
+    assert engine.players[0].life_points == engine.players[0].max_life_points
+
+    # Same RNG state, so the same cards are drawn again
+    engine.end_turn()
+    engine.end_turn()
+    assert (hands(engine), engine.turn_manager.turn_count) == after
+
+
+def test_restored_cards_keep_live_owners():
+    engine = make_engine()
+    engine.restore(engine.snapshot())
+    for player in engine.players:
+        for card in engine.game_state.player_info[player]["held_cards"]:
+            assert card.owner is player
+
+
+def test_state_version_tracks_hand_field_and_restore():
+    engine = make_engine()
+    state = engine.game_state
+    player = engine.players[0]
+    snapshot = engine.snapshot()
+    version = state.state_version()
+    assert state.state_version() == version
+
+    engine.draw_card(player, check=False)
+    assert state.state_version() != version
+    version = state.state_version()
+
+    card = state.player_info[player]["held_cards"].cards[0]
+    state.modify_field("add", card, state.get_random_empty_slot(player))
+    assert state.state_version() != version
+    version = state.state_version()
+
+    engine.restore(snapshot)
+    assert state.state_version() != version
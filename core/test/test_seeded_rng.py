@@ -0,0 +1,67 @@
+import random
+
+from core.factory.draw_system import DrawSystem
+from core.handle_game_logic.game_engine import GameEngine
+from core.player import Player
+from core.utils import derive_seed
+
+
+class DummyPlayer:
+    """Minimal dummy player object to satisfy factory calls."""
+
+    def __init__(self, name="TestPlayer"):
+        self.name = name
+
+
+def draw_names(draw_system, n=200):
+    player = DummyPlayer()
+    return [draw_system.rate_card_draw(player).name for _ in range(n)]
+
+
+def hand_names(engine):
+    return [
+        [card.name
+         for card in engine.game_state.player_info[p]["held_cards"].cards]
+        for p in engine.game_state.players
+    ]
+
+
+def test_draw_system_same_seed_same_draws():
+    first = draw_names(DrawSystem(random.Random(7)))
+    second = draw_names(DrawSystem(random.Random(7)))
+    assert first == second
+
+
+def test_draw_system_ignores_global_random():
+    draw_system = DrawSystem(random.Random(7))
+    random.seed(1)
+    first = draw_names(draw_system)
+
+    draw_system = DrawSystem(random.Random(7))
+    random.seed(2)
+    second = draw_names(draw_system)
+    assert first == second
+
+
+def test_engine_reset_with_seed_replays_game_start():
+    engine = GameEngine([Player(0, "p1"), Player(1, "p2")], verbose=False)
+
+    engine.reset(seed=derive_seed(42, 0, 3))
+    engine.start_game()
+    first = hand_names(engine)
+    for _ in range(3):
+        engine.end_turn()
+
+    engine.reset(seed=derive_seed(42, 0, 3))
+    engine.start_game()
+    assert hand_names(engine) == first
+    # Every game starts on turn 1 with the first player
+    assert engine.turn_manager.turn_count == 1
+    assert engine.turn_manager.current_player_index == 0
+
+
+def test_derive_seed_differs_per_key():
+    seeds = {derive_seed(42, worker, episode)
+             for worker in range(4) for episode in range(4)}
+    assert len(seeds) == 16
+    assert derive_seed(42, 1, 2) == derive_seed(42, 1, 2)
@@ -1,11 +1,36 @@
 import logging
 import builtins
+import itertools
+
+import numpy as np
+
+_versions = itertools.count(1)
 
 
 def disable_print():
     builtins.print = lambda *a, **k: None
 
 
+def next_version() -> int:
+    """
+    Process-wide increasing number that mutable game objects stamp
+    themselves with on every change. Values are never reused, so views
+    can compare versions across resets and snapshot restores.
+    """
+    return next(_versions)
+
+
+def derive_seed(base_seed: int, *keys: int) -> int:
+    """
+    Derive an independent seed from a base seed and integer keys.
+
+    e.g. derive_seed(cfg.SEED, worker_id, episode) gives every worker and
+    episode its own reproducible stream.
+    """
+    seq = np.random.SeedSequence([base_seed, *keys])
+    return int(seq.generate_state(1, np.uint64)[0])
+
+
 def setup_silent_logger(log_path: str = "logs/game_engine.log", level=logging.DEBUG):
     """Redirect all print() calls to a file-based logger instead of stdout."""
     import os
@@ -15,3 +15,4 @@ class DeathAnimation(Animation):
         super().update(dt)
         if self.is_finished and self.on_finish:
             self.on_finish()
+        return self.is_finished
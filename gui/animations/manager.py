@@ -1,4 +1,3 @@
-from collections import defaultdict
 from .animation import Animation
 from .attack import AttackAnimation
 from .death import DeathAnimation
@@ -15,8 +14,18 @@ from gui.audio_manager import AudioManager
 
 
 class AnimationManager:
+    """
+    Runs animations, one at a time per sprite.
+
+    Each sprite has a queue of the animations locking it; an animation
+    is ready once it heads the queues of all its locks. Ready animations
+    are kept in `ready`, and only the queues of a finished animation are
+    rechecked, so a frame costs O(running animations).
+    """
+
     def __init__(self, train_mode=False):
-        self.queues = defaultdict(AnimationQueue)
+        self.queues = {}
+        self.ready = {}  # ordered set of runnable animations
         self.train_mode = train_mode
         EffectManager.set_train_mode(train_mode)
         AudioManager.set_train_mode(train_mode)
@@ -29,26 +38,41 @@ class AnimationManager:
         return 0 if self.train_mode else value
 
     def add_animation(self, animation):
+        # A sprite about to die takes no more animations; queuing this one
+        # on its other sprites only would block them forever
+        if any(sprite in self.queues and self.queues[sprite].closed()
+               for sprite in animation.locks):
+            return
         for sprite in animation.locks:
-            self.queues[sprite].add(animation)
+            queue = self.queues.get(sprite)
+            if queue is None:
+                queue = self.queues[sprite] = AnimationQueue()
+            queue.add(animation)
+        self._unlock(animation)
+
+    def _unlock(self, animation):
+        """Mark `animation` ready if it heads the queues of all its locks."""
+        for sprite in animation.locks:
+            queue = self.queues.get(sprite)
+            if queue is None or queue.peek() is not animation:
+                return
+        self.ready[animation] = None
 
     def update(self, dt):
-        finished_anims = []
-        candidates = {q.peek() for q in self.queues.values() if q.peek()}
-
-        for anim in candidates:
-            if all(self.queues[sprite].peek() is anim for sprite in anim.locks):
-                if anim.update(dt):
-                    finished_anims.append(anim)
+        # Animations unlocked during this frame start on the next one
+        finished_anims = [anim for anim in list(self.ready) if anim.update(dt)]
 
         for anim in finished_anims:
+            del self.ready[anim]
             for sprite in anim.locks:
-                q = self.queues[sprite]
-                if q.peek() is anim:
-                    q.pop()
-            for sprite in list(self.queues.keys()):
-                if len(self.queues[sprite]) == 0:
-                    self.queues.pop(sprite)
+                q = self.queues.get(sprite)
+                if q is None or q.peek() is not anim:
+                    continue
+                q.pop()
+                if q:
+                    self._unlock(q.peek())
+                else:
+                    del self.queues[sprite]
 
     # Convenience creators
     def create_death_animation(self, card, sprite_dict, duration=0.2):
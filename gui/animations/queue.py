@@ -1,12 +1,17 @@
+from collections import deque
 from .death import DeathAnimation
 
 
 class AnimationQueue:
     def __init__(self):
-        self.queue = []
+        self.queue = deque()
+
+    def closed(self):
+        """True once a DeathAnimation is queued, later ones are dropped."""
+        return bool(self.queue) and isinstance(self.queue[-1], DeathAnimation)
 
     def add(self, animation):
-        if self.queue and isinstance(self.queue[-1], DeathAnimation):
+        if self.closed():
             return
         self.queue.append(animation)
 
@@ -14,7 +19,7 @@ class AnimationQueue:
         return self.queue[0] if self.queue else None
 
     def pop(self):
-        return self.queue.pop(0) if self.queue else None
+        return self.queue.popleft() if self.queue else None
 
     def __len__(self):
         return len(self.queue)
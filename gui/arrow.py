@@ -20,6 +20,18 @@ class DragArrow:
             # self.dragging = False
             # self.end_pos = event.pos
 
+    def bounds(self):
+        """Screen rect covered by `draw`, None when nothing is drawn"""
+        if not self.start_pos or not self.end_pos:
+            return None
+        # Room for the line width and the arrowhead around both ends
+        margin = 16 + self.stripe_width
+        return pygame.Rect(self.start_pos, (0, 0)).union(
+            pygame.Rect(self.end_pos, (0, 0))).inflate(margin * 2, margin * 2)
+
+    def draw_key(self):
+        return (tuple(self.start_pos), tuple(self.end_pos), self.dragging)
+
     def draw(self, surface):
         if not self.start_pos or not self.end_pos:
             return
@@ -1,17 +1,108 @@
+import logging
+from pathlib import Path
+
 import pygame
 
+from gui.cache import resolve_asset
+
+SOUND_DIRECTORY = "assets/sounds"
+SOUND_EXTENSIONS = (".mp3", ".ogg", ".wav")
+
+# Mixer channels reserved per category, also its cap on concurrent voices
+CHANNELS = {"card": 2, "combat": 3, "magic": 3, "misc": 1}
+# Category per sound file name, others play as "misc"
+SOUND_CATEGORIES = {
+    "card-draw": "card",
+    "card-disappear": "card",
+    "merge": "card",
+    "sword-clash": "combat",
+    "sword-slice": "combat",
+    "shield-guard": "combat",
+    "player-hurt": "combat",
+    "spell-activate": "magic",
+    "trap-reveal": "magic",
+}
+
 
 class AudioManager:
+    """
+    Plays sound effects from a bank of decoded sounds.
+
+    Sounds are decoded once, by `preload()` at startup or on first play.
+    Each category plays on its own reserved mixer channels; when all of
+    them are busy the oldest voice is cut, so bursts (e.g. trap chains)
+    never queue up more than `CHANNELS[category]` voices.
+    """
     train_mode = False
+    sounds = {}    # resolved path -> Sound, None when it failed to load
+    channels = {}  # category -> channels, least recently started first
+    logger = logging.getLogger("AudioManager")
+    _mixer_ready = None
 
     @classmethod
     def set_train_mode(cls, value: bool):
         cls.train_mode = value
 
+    @classmethod
+    def _init_mixer(cls) -> bool:
+        """Reserve the category channels, False when there is no audio."""
+        if cls._mixer_ready is None:
+            try:
+                if not pygame.mixer.get_init():
+                    pygame.mixer.init()
+            except pygame.error as e:
+                cls.logger.warning(f"Audio disabled: {e}")
+                cls._mixer_ready = False
+                return False
+
+            total = sum(CHANNELS.values())
+            if pygame.mixer.get_num_channels() < total:
+                pygame.mixer.set_num_channels(total)
+            pygame.mixer.set_reserved(total)
+            index = 0
+            for category, count in CHANNELS.items():
+                cls.channels[category] = [pygame.mixer.Channel(i) for i in
+                                          range(index, index + count)]
+                index += count
+            cls._mixer_ready = True
+        return cls._mixer_ready
+
+    @classmethod
+    def preload(cls, directory=SOUND_DIRECTORY) -> int:
+        """Decode every sound in `directory`, returns how many loaded."""
+        if not cls._init_mixer():
+            return 0
+        directory = Path(resolve_asset(directory))
+        paths = [path for path in sorted(directory.iterdir())
+                 if path.suffix.lower() in SOUND_EXTENSIONS]
+        loaded = sum(cls.get_sound(path) is not None for path in paths)
+        cls.logger.debug(f"Preloaded {loaded} sounds")
+        return loaded
+
+    @classmethod
+    def get_sound(cls, file):
+        """Decoded sound of `file`, loaded once; None if it can't load."""
+        path = resolve_asset(file)
+        if path not in cls.sounds:
+            try:
+                cls.sounds[path] = pygame.mixer.Sound(path)
+            except (pygame.error, FileNotFoundError) as e:
+                cls.logger.warning(f"Could not load sound {file}: {e}")
+                cls.sounds[path] = None
+        return cls.sounds[path]
+
     @classmethod
     def play_sound(cls, file: str):
         # Skip audio if in train mode
-        if cls.train_mode:
+        if cls.train_mode or not cls._init_mixer():
+            return
+        sound = cls.get_sound(file)
+        if sound is None:
             return
-        sound = pygame.mixer.Sound(file)
-        sound.play()
+
+        category = SOUND_CATEGORIES.get(Path(file).stem, "misc")
+        channels = cls.channels[category]
+        channel = next((c for c in channels if not c.get_busy()), channels[0])
+        channel.play(sound)
+        channels.remove(channel)
+        channels.append(channel)
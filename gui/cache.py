@@ -1,9 +1,26 @@
+import logging
+import os
+import threading
+import numpy as np
 import pygame
+from collections import OrderedDict
 from functools import lru_cache
+from pathlib import Path
 from pygame.image import load
+from pygame.transform import scale, smoothscale
+
+ROOT_PATH = Path(os.path.dirname(__file__)).parent
+CARD_BACK_PATH = "assets/card-back.png"
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
 
 _font_cache = {}
 
+# Rendered card faces and text, least recently used first
+CARD_FACE_CACHE_SIZE = 256
+_card_face_cache = OrderedDict()
+TEXT_CACHE_SIZE = 512
+_text_cache = OrderedDict()
+
 
 def get_font(size):
     """Cache pygame font objects by size"""
@@ -12,6 +29,146 @@ def get_font(size):
     return _font_cache[size]
 
 
+def resolve_asset(path) -> str:
+    """Absolute asset path, relative paths resolve against the project root."""
+    return str(Path(ROOT_PATH, path).resolve())
+
+
 @lru_cache(maxsize=512)
-def load_image(path: str):
+def _load_image(path: str):
     return load(path).convert_alpha()
+
+
+@lru_cache(maxsize=1024)
+def _load_scaled(path: str, size, smooth: bool):
+    transform = smoothscale if smooth else scale
+    return transform(_load_image(path), size)
+
+
+def load_image(path):
+    """Decoded, display-converted image, loaded once per file.
+
+    The surface is shared, copy before drawing on it.
+    """
+    return _load_image(resolve_asset(path))
+
+
+def get_scaled_image(path, size, smooth=False):
+    """`load_image` scaled to `size`, cached per file, size and filter.
+
+    The surface is shared, copy before drawing on it.
+    """
+    return _load_scaled(resolve_asset(path), tuple(size), smooth)
+
+
+def _get_cached(cache, limit, key, render):
+    value = cache.get(key)
+    if value is None:
+        value = cache[key] = render()
+        if len(cache) > limit:
+            cache.popitem(last=False)
+    else:
+        cache.move_to_end(key)
+    return value
+
+
+def get_card_face(key, render):
+    """Cache rendered card faces, `render()` builds a missing one.
+
+    Faces are shared between sprites, copy before drawing on them.
+    """
+    return _get_cached(_card_face_cache, CARD_FACE_CACHE_SIZE, key, render)
+
+
+def get_text(text, size, color, outline=None):
+    """Cache rendered text by (text, font size, color, outline color).
+
+    With an `outline` color the text is composed once over a 1px outline,
+    the surface is then 2px wider and taller than the text. Surfaces are
+    shared, copy before drawing on them.
+    """
+    key = (text, size, tuple(color), outline and tuple(outline))
+    return _get_cached(_text_cache, TEXT_CACHE_SIZE, key,
+                       lambda: _render_text(text, size, color, outline))
+
+
+def _render_text(text, size, color, outline):
+    font = get_font(size)
+    text_surf = font.render(text, True, color)
+    if outline is None:
+        return text_surf
+
+    # Layers are composed with the "over" operator on straight alpha, so
+    # one blit of the result matches blitting them one after another
+    w, h = text_surf.get_size()
+    outline_surf = font.render(text, True, outline)
+    layers = [(outline_surf, pos) for pos in [(0, 1), (2, 1), (1, 0), (1, 2)]]
+    layers.append((text_surf, (1, 1)))
+
+    rgb = np.zeros((w + 2, h + 2, 3))
+    alpha = np.zeros((w + 2, h + 2, 1))
+    for layer, (x, y) in layers:
+        src_rgb = pygame.surfarray.array3d(layer)
+        src_a = pygame.surfarray.array_alpha(layer)[..., None] / 255.0
+        dst_rgb = rgb[x:x + w, y:y + h]
+        dst_a = alpha[x:x + w, y:y + h]
+        out_a = src_a + dst_a * (1 - src_a)
+        rgb[x:x + w, y:y + h] = np.divide(
+            src_rgb * src_a + dst_rgb * dst_a * (1 - src_a), out_a,
+            out=np.zeros_like(dst_rgb), where=out_a > 0)
+        alpha[x:x + w, y:y + h] = out_a
+
+    surface = pygame.Surface((w + 2, h + 2), pygame.SRCALPHA)
+    pygame.surfarray.pixels3d(surface)[...] = np.rint(rgb)
+    pygame.surfarray.pixels_alpha(surface)[...] = np.rint(alpha[..., 0] * 255)
+    return surface
+
+
+class AssetPreloader:
+    """
+    Decodes image assets on a background thread, so the first draw of a
+    card finds its surfaces in the cache instead of stalling a frame.
+
+    Needs a display mode set, `convert_alpha` converts to its format.
+
+    Args:
+        sizes: Sizes every image is also scaled to, e.g. card sprite sizes
+        directory: Folder searched recursively for images
+    """
+
+    def __init__(self, sizes=(), directory="assets/images"):
+        self.sizes = [tuple(size) for size in sizes]
+        self.directory = Path(resolve_asset(directory))
+        self.logger = logging.getLogger("AssetPreloader")
+        self.loaded = 0
+        self._thread = None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self.run, name="AssetPreloader", daemon=True)
+            self._thread.start()
+        return self
+
+    def run(self):
+        paths = [path for path in sorted(self.directory.rglob("*"))
+                 if path.suffix.lower() in IMAGE_EXTENSIONS]
+        paths.append(Path(resolve_asset(CARD_BACK_PATH)))
+        for path in paths:
+            try:
+                load_image(path)
+                for size in self.sizes:
+                    get_scaled_image(path, size)
+            except pygame.error as e:
+                self.logger.warning(f"Could not preload {path}: {e}")
+                continue
+            self.loaded += 1
+        self.logger.debug(f"Preloaded {self.loaded} images")
+
+    @property
+    def done(self) -> bool:
+        return self._thread is not None and not self._thread.is_alive()
+
+    def wait(self, timeout=None):
+        if self._thread is not None:
+            self._thread.join(timeout)
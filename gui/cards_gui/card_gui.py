@@ -3,7 +3,7 @@ from pygame.draw import rect
 from typing import Tuple
 from gui.sprite import Sprite
 from gui.draggable import Draggable
-from gui.cache import get_font
+from gui.cache import get_font, get_card_face, load_image, CARD_BACK_PATH
 
 
 class CardGUI(Sprite, Draggable):
@@ -32,29 +32,44 @@ class CardGUI(Sprite, Draggable):
         self.name_font = get_font(max(8, int(14 * self.scale_y)))
         self.desc_font = get_font(max(6, int(12 * self.scale_y)))
 
-        self.card_surface = None
-        self._render_card_with_text()
+        self.card_surface = self.get_face()
         self.annotated_image = self.card_surface
 
         '''Opponenet check'''
-        self.image_face_down = pygame.image.load("assets/card-back.png")
+        self.image_face_down = load_image(CARD_BACK_PATH)
         self.is_face_down = False
         self.show_text = False
 
         if self.logic_card.owner.is_opponent:
             self.is_face_down = True
-            self.card_surface = self.image_face_down
-            self.card_surface = pygame.transform.smoothscale(
-                self.card_surface, self.display_size)
-            self.card_surface = pygame.transform.flip(
-                self.card_surface, False, True)
+            self.card_surface = self.get_face(face_up=False, flipped=True)
 
         self.update()
 
-    def _render_card_with_text(self, padding=4):
+    def get_face(self, face_up=True, flipped=False):
+        """Shared card face surface, rendered once per card prototype,
+        size, side and orientation."""
+        card = self.logic_card
+        key = (card.name, card.image_path,
+               getattr(card, "description", ""),
+               getattr(card, "level_star", None),
+               getattr(card, "type", None),
+               tuple(self.display_size), face_up, flipped)
+        return get_card_face(key, lambda: self._build_face(face_up, flipped))
+
+    def _build_face(self, face_up, flipped):
+        if flipped:
+            return pygame.transform.flip(
+                self.get_face(face_up), False, True)
+        if face_up:
+            return self._render_face()
+        return pygame.transform.smoothscale(
+            self.image_face_down, self.display_size)
+
+    def _render_face(self, padding=4):
         w, h = self.display_size
         # padding = h * padding
-        self.card_surface = pygame.transform.smoothscale(
+        surface = pygame.transform.smoothscale(
             self.original_image, (w, h))
 
         # Textbox dimensions relative to card size
@@ -89,7 +104,7 @@ class CardGUI(Sprite, Draggable):
         else:
             description = f"Description: {description}"
         if description:
-            self._render_wrapped_text(description, inner_textbox)
+            self._render_wrapped_text(surface, description, inner_textbox)
 
         # Draw name above textbox (with horizontal padding)
         name = getattr(self.logic_card, "name", "Unknown")
@@ -113,10 +128,11 @@ class CardGUI(Sprite, Draggable):
         shadow_rect = shadow_surface.get_rect(
             centerx=w // 2 + 1, bottom=name_rect.bottom + 1
         )
-        self.card_surface.blit(shadow_surface, shadow_rect)
-        self.card_surface.blit(name_surface, name_rect)
+        surface.blit(shadow_surface, shadow_rect)
+        surface.blit(name_surface, name_rect)
+        return surface
 
-    def _render_wrapped_text(self, text, rect):
+    def _render_wrapped_text(self, surface, text, rect):
         """Render description inside textbox dynamically"""
         paragraphs = text.splitlines()
         font = self.desc_font
@@ -160,7 +176,7 @@ class CardGUI(Sprite, Draggable):
         y_offset = rect.top
         for line in lines[:max_lines]:
             text_surface = font.render(line, True, (0, 0, 0))
-            self.card_surface.blit(text_surface, (rect.left + 1, y_offset))
+            surface.blit(text_surface, (rect.left + 1, y_offset))
             y_offset += font.get_height()
 
     def update(self):
@@ -169,6 +185,16 @@ class CardGUI(Sprite, Draggable):
         if self.is_selected:
             rect(self.image, self.highlight_color, self.image.get_rect(), 2)
 
+    def bounds(self):
+        """Screen rect covered by `draw`; animations swap in rotated or
+        scaled images without resizing `rect`."""
+        return self.rect.union(self.image.get_rect(topleft=self.rect.topleft))
+
+    def draw_key(self):
+        """What `draw` puts on screen, for dirty-rect rendering."""
+        return (id(self.image), self.image.get_alpha(), tuple(self.rect),
+                self.highlight and self.highlight_color)
+
     def draw(self, surface):
         surface.blit(self.image, self.rect)
         if self.highlight:
@@ -189,8 +215,6 @@ class CardGUI(Sprite, Draggable):
         self.is_selected = False
 
     def refresh_stats(self):
-        self._render_card_with_text()
-        if self.logic_card.owner.is_opponent:
-            self.card_surface = pygame.transform.flip(
-                self.card_surface, False, True)
+        self.card_surface = self.get_face(
+            flipped=self.logic_card.owner.is_opponent)
         self.update()
@@ -1,10 +1,17 @@
-from gui.cache import get_font
+from gui.cache import get_font, get_text
 
 
 class CardStatOverlay:
+    TEXT_COLOR = (255, 255, 255)
+    OUTLINE_COLOR = (0, 0, 0)
+
     def __init__(self, card_gui, font_size=20):
         self._card = card_gui
+        self._font_size = font_size
         self.font = get_font(font_size)
+        self._stats_version = None
+        self._stat_text = None
+        self._stat_surface = None
 
     def __getattr__(self, name):
         """
@@ -19,28 +26,43 @@ class CardStatOverlay:
         else:
             setattr(self._card, name, value)
 
-    def draw(self, surface):
-        # First draw the card itself
-        self._card.draw(surface)
-
-        # Then draw the ATK/DEF overlay
-        atk = getattr(self._card.logic_card, "atk", 0)
-        defe = getattr(self._card.logic_card, "defend", 0)
-        star = getattr(self._card.logic_card, "level_star", 0)
-
-        stat_text = f"{atk}/{defe}/{star}*"
-        text_surf = self.font.render(stat_text, True, (255, 255, 255))
+    def stat_label(self):
+        """Outlined ATK/DEF/star text, re-rendered only after the card's
+        stats changed (see `EffectTracker`)"""
+        logic_card = self._card.logic_card
+        version = getattr(logic_card, "stats_version", None)
+        if self._stat_surface is None or version != self._stats_version:
+            atk = getattr(logic_card, "atk", 0)
+            defe = getattr(logic_card, "defend", 0)
+            star = getattr(logic_card, "level_star", 0)
+            self._stat_text = f"{atk}/{defe}/{star}*"
+            self._stat_surface = get_text(
+                self._stat_text, self._font_size,
+                self.TEXT_COLOR, outline=self.OUTLINE_COLOR)
+            self._stats_version = version
+        return self._stat_surface
 
+    def _label_rect(self):
+        label = self.stat_label()
+        # The label has a 1px outline margin around the text
+        x = self._card.rect.centerx - (label.get_width() - 2) // 2
         if self._card.logic_card.owner.is_opponent:
-            x = self._card.rect.centerx - text_surf.get_width() // 2
             y = self._card.rect.top - 2
         else:
-            x = self._card.rect.centerx - text_surf.get_width() // 2
             y = self._card.rect.bottom + 2
+        return label.get_rect(topleft=(x - 1, y - 1))
 
-        # Outline
-        outline = self.font.render(stat_text, True, (0, 0, 0))
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            surface.blit(outline, (x + dx, y + dy))
+    def bounds(self):
+        """Screen rect covered by the card and its stat text"""
+        return self._card.bounds().union(self._label_rect())
+
+    def draw_key(self):
+        self.stat_label()
+        return self._card.draw_key(), self._stat_text
+
+    def draw(self, surface):
+        # First draw the card itself
+        self._card.draw(surface)
 
-        surface.blit(text_surf, (x, y))
+        # Then the ATK/DEF overlay
+        surface.blit(self.stat_label(), self._label_rect())
@@ -0,0 +1,160 @@
+import pygame
+
+
+def merge_rects(rects):
+    """Union overlapping rects until none of the results overlap."""
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        i = 0
+        while i < len(merged):
+            if rect.colliderect(merged[i]):
+                rect.union_ip(merged.pop(i))
+                i = 0
+            else:
+                i += 1
+        merged.append(rect)
+    return merged
+
+
+def draw_bounds(item):
+    """Screen rect an item draws into, None when it draws nothing.
+
+    Grown by 1px on each side: rects truncate fractional positions and
+    sizes, while what is drawn there may round up.
+    """
+    bounds = getattr(item, "bounds", None)
+    if bounds is not None:
+        rect = bounds()
+    else:
+        rect = getattr(item, "rect", None)
+    return pygame.Rect(rect).inflate(2, 2) if rect is not None else None
+
+
+def draw_key(item):
+    """Hashable summary of what an item draws, a change repaints it."""
+    key = getattr(item, "draw_key", None)
+    if key is not None:
+        return key()
+    image = getattr(item, "image", None)
+    return (id(image), image.get_alpha() if image else None,
+            tuple(item.rect))
+
+
+def draw_item(item, surface):
+    if hasattr(item, "draw"):
+        item.draw(surface)
+    else:  # plain pygame sprite
+        surface.blit(item.image, item.rect)
+
+
+class DirtyRenderer:
+    """
+    Repaints only the screen regions that changed since the last frame.
+
+    The board (background, tiles, areas) is drawn once into an offscreen
+    layer and redrawn when `board_state` reports a change. Each frame the
+    regions covered by items that moved, changed or disappeared, plus
+    changed board areas, are restored from the layer, the items
+    overlapping them are redrawn clipped, and only those regions are
+    pushed with `pygame.display.update(rects)`.
+
+    Items need `draw(surface)` (or `image` and `rect`), and `bounds()`
+    (None when nothing is drawn) or `rect`; `draw_key()` summarizes what
+    they draw, the default is the image identity, its alpha and the rect.
+
+    Args:
+        screen: Display surface
+        draw_board: Callable drawing the static board onto a surface
+        board_state: Callable returning {name: (rect, value)} for the
+            board parts that can change, e.g. `Matrix.draw_state`
+        full_ratio: Repaint the whole screen once the dirty area covers
+            this fraction of it
+    """
+
+    def __init__(self, screen, draw_board, board_state=None,
+                 full_ratio=0.5):
+        self.screen = screen
+        self.draw_board = draw_board
+        self.board_state = board_state or dict
+        self.full_ratio = full_ratio
+        self.board = None
+        self._board_state = {}
+        self._items = {}
+        self._full = True
+
+    def invalidate(self):
+        """Repaint the whole screen next frame, e.g. after an expose."""
+        self._full = True
+
+    def render(self, items, always=()):
+        """
+        Draw one frame and update the changed parts of the display.
+
+        Args:
+            items: Drawables in draw order, on top of the board
+            always: Drawables repainted every frame (effects that change
+                their image in place), drawn after `items`
+
+        Returns:
+            The updated screen rects
+        """
+        screen_rect = self.screen.get_rect()
+        if self.board is None or self.board.get_size() != screen_rect.size:
+            self.board = pygame.Surface(screen_rect.size).convert()
+            self._full = True
+
+        dirty = []
+        state = self.board_state()
+        if self._full or state != self._board_state:
+            for name, (rect, value) in state.items():
+                if self._board_state.get(name) != (rect, value):
+                    dirty.append(rect)
+            self.draw_board(self.board)
+            self._board_state = state
+
+        current = {}
+        drawables = []
+        for item in items:
+            bounds = draw_bounds(item)
+            if bounds is None:
+                continue
+            drawables.append((item, bounds))
+            current[id(item)] = (bounds, draw_key(item))
+            previous = self._items.get(id(item))
+            if previous != current[id(item)]:
+                dirty.append(bounds)
+                if previous is not None:
+                    dirty.append(previous[0])
+        for item in always:
+            bounds = draw_bounds(item)
+            if bounds is not None:
+                drawables.append((item, bounds))
+                current[id(item)] = (bounds, None)
+                dirty.append(bounds)
+        # Last frame bounds of repainted-every-frame and removed items
+        for key, (bounds, _) in self._items.items():
+            if key not in current or current[key][1] is None:
+                dirty.append(bounds)
+        self._items = current
+
+        dirty = [rect.clip(screen_rect) for rect in merge_rects(dirty)]
+        dirty = [rect for rect in dirty if rect.w and rect.h]
+        area = sum(rect.w * rect.h for rect in dirty)
+        screen_area = screen_rect.w * screen_rect.h
+        if self._full or area >= self.full_ratio * screen_area:
+            dirty = [screen_rect]
+        self._full = False
+        if not dirty:
+            return []
+
+        for rect in dirty:
+            self.screen.set_clip(rect)
+            self.screen.blit(self.board, rect, rect)
+            for item, bounds in drawables:
+                if bounds.colliderect(rect):
+                    draw_item(item, self.screen)
+        self.screen.set_clip(None)
+
+        pygame.display.update(dirty)
+        return dirty
@@ -0,0 +1,40 @@
+import pygame
+
+
+class CanvasEffect(pygame.sprite.Sprite):
+    """
+    Timed effect drawn into a scratch canvas allocated once at its
+    largest size.
+
+    Each frame, `frame(size)` clears a region of the canvas and makes it
+    the sprite image, so growing effects don't allocate a surface per
+    frame.
+    """
+
+    def __init__(self, pos, duration, max_size):
+        super().__init__()
+        self.pos = pos
+        self.duration = duration
+        self.start_time = pygame.time.get_ticks()
+        self.canvas = pygame.Surface((max_size, max_size), pygame.SRCALPHA)
+        self.image = self.canvas.subsurface((0, 0, 1, 1))  # start tiny
+        self.rect = self.image.get_rect(center=pos)
+
+    def progress(self):
+        """Elapsed fraction of the duration, None once over (and killed)."""
+        elapsed = (pygame.time.get_ticks() - self.start_time) / 1000.0
+        t = elapsed / self.duration
+        if t >= 1:
+            self.kill()
+            return None
+        return t
+
+    def frame(self, size):
+        """Clear a size x size canvas region, centered on `pos`, and
+        return it as the new image."""
+        size = min(size, *self.canvas.get_size())
+        area = pygame.Rect(0, 0, size, size)
+        self.canvas.fill((0, 0, 0, 0), area)
+        self.image = self.canvas.subsurface(area)
+        self.rect = self.image.get_rect(center=self.pos)
+        return self.image
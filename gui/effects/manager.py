@@ -1,13 +1,15 @@
 import pygame
 from .impact import ImpactEffect
 from .trap_glow import TrapGlowEffect
-from .spell_glow import SpellGlowEffect
+from .spell_glow import emit_spell_glow
 from .merge import MergeEffect
 from .player_hit import HitPlayerEffect
+from .particles import ParticleSystem
 
 
 class EffectManager:
     effects_group = pygame.sprite.Group()
+    particles = ParticleSystem()
     train_mode = False
 
     def __init__(self, train_mode=False):
@@ -28,7 +30,7 @@ class EffectManager:
         elif effect_type == "trap-glow":
             cls.effects_group.add(TrapGlowEffect(arg))
         elif effect_type == "spell-glow":
-            cls.effects_group.add(SpellGlowEffect(arg))
+            emit_spell_glow(cls.particles, arg)
         elif effect_type == "merge":
             cls.effects_group.add(MergeEffect(arg))
         elif effect_type == "hit_player":
@@ -39,7 +41,14 @@ class EffectManager:
     @classmethod
     def update(cls):
         cls.effects_group.update()
+        cls.particles.update()
 
     @classmethod
     def draw(cls, screen):
         cls.effects_group.draw(screen)
+        cls.particles.draw(screen)
+
+    @classmethod
+    def drawables(cls):
+        """Effects in draw order, for `DirtyRenderer`."""
+        return cls.effects_group.sprites() + [cls.particles]
@@ -0,0 +1,152 @@
+"""
+Pooled particle system.
+
+Particles live in fixed-capacity NumPy arrays (origin, velocity, emit
+time, life, radius, color), alive ones packed at the front. Motion is
+closed-form from the emit time, so `update` is one vectorized pass over
+the pool: expired particles are compacted away and positions and fade
+alphas are recomputed for the rest. Alphas are quantized to
+`ALPHA_STEP`, so `draw` blits precomputed circle sprites, one per
+(radius, color, alpha), in a single `Surface.blits` call.
+"""
+import math
+from functools import lru_cache
+
+import numpy as np
+import pygame
+
+ALPHA_STEP = 8
+
+
+@lru_cache(maxsize=2048)
+def circle_sprite(radius, color, alpha):
+    """Shared filled circle of `radius` on a (2r+1)² transparent surface."""
+    size = 2 * radius + 1
+    sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, (*color, alpha), (radius, radius), radius)
+    return sprite
+
+
+class ParticleSystem:
+    """
+    Fixed-size pool of fading circle particles.
+
+    Emits past the capacity are dropped. Item protocol of
+    `DirtyRenderer`: `draw(surface)` and `bounds()`.
+
+    Args:
+        capacity: Maximum number of live particles
+        seed: Seed of the emit RNG
+    """
+
+    def __init__(self, capacity=1024, seed=None):
+        self.capacity = capacity
+        self.count = 0
+        self.origin = np.zeros((capacity, 2), dtype=np.float32)
+        self.velocity = np.zeros((capacity, 2), dtype=np.float32)
+        self.born = np.zeros(capacity, dtype=np.float64)
+        self.life = np.ones(capacity, dtype=np.float32)
+        self.radius = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros(capacity, dtype=np.int32)
+        # Scratch outputs of update(), read by draw()
+        self.pos = np.zeros((capacity, 2), dtype=np.int32)
+        self.alpha = np.zeros(capacity, dtype=np.int32)
+        self.palette = []
+        self._palette_index = {}
+        self.rng = np.random.default_rng(seed)
+
+    @staticmethod
+    def _now():
+        return pygame.time.get_ticks() / 1000.0
+
+    def _color_index(self, color):
+        color = tuple(color)
+        index = self._palette_index.get(color)
+        if index is None:
+            index = self._palette_index[color] = len(self.palette)
+            self.palette.append(color)
+        return index
+
+    def emit(self, pos, count, speed, life, radius, color):
+        """
+        Burst `count` particles from `pos` in random directions.
+
+        Args:
+            pos: Emit point
+            count: Number of particles
+            speed: (min, max) speed in pixels per second
+            life: Lifetime in seconds
+            radius: (min, max) radius in pixels, inclusive
+            color: RGB color
+        """
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return
+        rng = self.rng
+        start, end = self.count, self.count + count
+        angle = rng.uniform(0, 2 * math.pi, count)
+        speeds = rng.uniform(speed[0], speed[1], count)
+
+        self.origin[start:end] = (pos[0], pos[1])
+        self.velocity[start:end, 0] = np.cos(angle) * speeds
+        self.velocity[start:end, 1] = np.sin(angle) * speeds
+        self.born[start:end] = self._now()
+        self.life[start:end] = life
+        self.radius[start:end] = rng.integers(radius[0], radius[1] + 1, count)
+        self.color[start:end] = self._color_index(color)
+        self.count = end
+        self._update(self._now())
+
+    def clear(self):
+        self.count = 0
+
+    def update(self, now=None):
+        """Drop expired particles and advance the rest to `now` (seconds,
+        defaults to the pygame clock)."""
+        self._update(self._now() if now is None else now)
+
+    def _update(self, now):
+        n = self.count
+        if not n:
+            return
+        age = now - self.born[:n]
+        alive = age < self.life[:n]
+        if not alive.all():
+            n = int(alive.sum())
+            for array in (self.origin, self.velocity, self.born, self.life,
+                          self.radius, self.color):
+                array[:n] = array[:self.count][alive]
+            age = age[alive]
+            self.count = n
+        if not n:
+            return
+        age = age.astype(np.float32)
+        np.rint(self.origin[:n] + self.velocity[:n] * age[:, None],
+                out=self.pos[:n], casting="unsafe")
+        fade = 255 * (1 - age / self.life[:n])
+        np.floor_divide(fade.astype(np.int32), ALPHA_STEP, out=self.alpha[:n])
+        self.alpha[:n] *= ALPHA_STEP
+
+    def bounds(self):
+        """Screen rect covering all live particles, None when empty."""
+        n = self.count
+        if not n:
+            return None
+        pos, radius = self.pos[:n], self.radius[:n, None]
+        left, top = (pos - radius).min(axis=0).tolist()
+        right, bottom = (pos + radius).max(axis=0).tolist()
+        return pygame.Rect(left, top, right - left + 1, bottom - top + 1)
+
+    def draw(self, surface):
+        n = self.count
+        if not n:
+            return
+        palette = self.palette
+        surface.blits(
+            [(circle_sprite(r, palette[c], a), (x - r, y - r))
+             for (x, y), r, c, a in zip(self.pos[:n].tolist(),
+                                        self.radius[:n].tolist(),
+                                        self.color[:n].tolist(),
+                                        self.alpha[:n].tolist())
+             if a > 0],
+            doreturn=False)
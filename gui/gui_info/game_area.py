@@ -23,6 +23,9 @@ class GameAreaConfig:
 
 class GameArea:
     """Represents a rectangular game area with position and dimensions"""
+    # Drawing only changes with the layout, so Matrix composes it into
+    # its static board layer
+    static = True
 
     def __init__(self, x, y, width, height, color=None, border_width=2):
         self.rect = pygame.Rect(x, y, width, height)
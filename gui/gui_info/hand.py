@@ -1,12 +1,13 @@
-import pygame
 from gui.gui_info.game_area import GameArea
-from gui.cache import load_image
+from gui.cache import get_scaled_image
+from core.utils import next_version
 
 
 class CollectionInfo:
     def __init__(self, cards, player):
         self.cards = cards
         self.player = player
+        self.version = next_version()
 
     def __len__(self):
         return len(self.cards)
@@ -16,9 +17,11 @@ class CollectionInfo:
 
     def add(self, card):
         self.cards.append(card)
+        self.version = next_version()
 
     def remove(self, card):
         self.cards.remove(card)
+        self.version = next_version()
 
 
 class HandUI(GameArea):
@@ -29,8 +32,7 @@ class HandUI(GameArea):
         self.last_count = len(self.hand_info.cards)
 
         image_path = "assets/deck.png"
-        self.image = load_image(image_path).convert_alpha()
-        self.image = pygame.transform.scale(self.image, self.rect.size)
+        self.image = get_scaled_image(image_path, self.rect.size)
 
     def draw(self, screen):
         screen.blit(self.image, self.rect)
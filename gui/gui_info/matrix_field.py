@@ -4,7 +4,7 @@ from gui.gui_info.hand import HandUI
 from gui.gui_info.text_area import TextArea
 from gui.gui_info.preview_card_table import CardPreview
 from gui.gui_info.deck_area import DeckArea
-from gui.cache import load_image
+from gui.cache import get_scaled_image
 
 
 class TileSpriteManager:
@@ -24,10 +24,8 @@ class TileSpriteManager:
 
         for name, path in self.sprite_paths.items():
             try:
-                sprite = load_image(path)
-                self.sprites[name] = pygame.transform.scale(
-                    sprite, (slot_width, slot_height)
-                )
+                self.sprites[name] = get_scaled_image(
+                    path, (slot_width, slot_height))
             except pygame.error as e:
                 print(f"Warning: Could not load sprite '{
                       name}' from {path}: {e}")
@@ -124,6 +122,8 @@ class Matrix:
 
         self.areas = {}
         self.sprite_manager = TileSpriteManager()
+        self.background = None
+        self._static_layer = None
 
         self._setup_default_sprites()
         self.set_game_state(game_state)
@@ -182,14 +182,49 @@ class Matrix:
             self.grid['slot_width'],
             self.grid['slot_height']
         )
+        self.invalidate_static()
 
     def set_tile_mapping(self, tile_map):
         """Update the tile mapping"""
         self.tile_renderer.set_tile_mapping(tile_map)
+        self.invalidate_static()
 
     def toggle_grid_lines(self):
         """Toggle grid line visibility"""
         self.tile_renderer.toggle_grid_lines()
+        self.invalidate_static()
+
+    def set_background(self, image):
+        """Full-screen image composed under the board, None for none"""
+        self.background = image
+        self.invalidate_static()
+
+    def invalidate_static(self):
+        """Rebuild the static board layer on the next draw"""
+        self._static_layer = None
+
+    def get_static_layer(self):
+        """Background, tiles, grid lines and static area frames composed
+        into one screen-sized surface, rebuilt after layout changes"""
+        size = self.screen.get_size()
+        layer = self._static_layer
+        if layer is None or layer.get_size() != size:
+            if self.background is None:
+                layer = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            else:
+                layer = pygame.Surface(size).convert()
+                layer.blit(self.background, (0, 0))
+            self.tile_renderer.draw_tiles(layer)
+            self.tile_renderer.draw_grid_lines(
+                layer,
+                self.config.GRID_COLOR,
+                self.config.GRID_LINE_WIDTH
+            )
+            for area in self.areas.values():
+                if getattr(area, "static", True):
+                    area.draw(layer)
+            self._static_layer = layer
+        return layer
 
     def update_dimensions(self):
         """Calculate all dimensions and create game areas"""
@@ -200,6 +235,7 @@ class Matrix:
 
         self.grid = grid_info
         self._create_game_areas(screen_width, screen_height, margins)
+        self.invalidate_static()
 
         if hasattr(self, 'sprite_manager'):
             self.sprite_manager.load_sprites(
@@ -304,21 +340,37 @@ class Matrix:
             ),
         }
 
-    def draw(self):
-        """Draw the entire game matrix"""
-        self.tile_renderer.draw_tiles(self.screen)
-        self.tile_renderer.draw_grid_lines(
-            self.screen,
-            self.config.GRID_COLOR,
-            self.config.GRID_LINE_WIDTH
-        )
-        self._draw_areas()
-        self.areas["preview_card_table"].draw(self.screen)
-
-    def _draw_areas(self):
+    def draw(self, surface=None):
+        """Draw the entire game matrix, on the screen by default: the
+        static layer in one blit, then the areas with changing content"""
+        if surface is None:
+            surface = self.screen
+        surface.blit(self.get_static_layer(), (0, 0))
+        for area in self.areas.values():
+            if not getattr(area, "static", True):
+                area.draw(surface)
+
+    def draw_state(self):
+        """{name: (rect, value)} of the parts whose drawing can change"""
+        state = {
+            name: (area.rect, area.draw_key())
+            for name, area in self.areas.items()
+            if hasattr(area, "draw_key")
+        }
+        state["grid_lines"] = (
+            pygame.Rect(self.grid['origin_x'], self.grid['origin_y'],
+                        self.grid['width'], self.grid['height']).inflate(
+                self.config.GRID_LINE_WIDTH * 2,
+                self.config.GRID_LINE_WIDTH * 2),
+            self.tile_renderer.show_grid_lines)
+        return state
+
+    def _draw_areas(self, surface=None):
         """Draw all game areas except hands"""
+        if surface is None:
+            surface = self.screen
         for area in self.areas.values():
-            area.draw(self.screen)
+            area.draw(surface)
 
     def _draw_hands(self):
         """Draw player hands"""
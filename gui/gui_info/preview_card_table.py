@@ -1,12 +1,14 @@
 import pygame
-from gui.cache import load_image
+from gui.cache import get_scaled_image
 
 
 class CardPreview:
+    # Drawn every frame, not part of the static board layer
+    static = False
+
     def __init__(self, x, y, width, height, border_color=(0, 0, 0), border_width=2):
         image_path = "assets/card-preview.png"
-        self.image = load_image(image_path)
-        self.image = pygame.transform.scale(self.image, (width, height))
+        self.image = get_scaled_image(image_path, (width, height))
         self.rect = pygame.Rect(x, y, width, height)
         self.border_color = border_color
         self.border_width = border_width
@@ -26,6 +28,9 @@ class CardPreview:
         )
         self.card_gui.image = self.card_gui.annotated_image
 
+    def draw_key(self):
+        return id(self.card_gui)
+
     def draw(self, screen):
         if self.card_gui:
             self.card_gui.rect.center = self.rect.center
@@ -3,11 +3,16 @@ from gui.cache import get_font
 
 
 class TextArea(GameArea):
+    static = False
+
     def __init__(self, player, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.player = player
         self.font = get_font(80)
 
+    def draw_key(self):
+        return self.player.life_points
+
     def draw(self, screen):
         super().draw(screen)
 
@@ -1,12 +1,7 @@
-import os
 from pathlib import Path
 from pygame.sprite import Sprite as PySprite
-from pygame.transform import scale
 from typing import Tuple
-from gui.cache import load_image
-
-
-ROOT_PATH = Path(os.path.dirname(__file__)).parent
+from gui.cache import ROOT_PATH, CARD_BACK_PATH, get_scaled_image
 
 
 class Sprite(PySprite):
@@ -18,15 +13,15 @@ class Sprite(PySprite):
 
         # Resolve image path relative to project root
         abs_image_path = Path(ROOT_PATH, image_path).resolve()
-        fallback_path = Path(ROOT_PATH, "assets", "card-back.png").resolve()
+        fallback_path = Path(ROOT_PATH, CARD_BACK_PATH).resolve()
 
         if not abs_image_path.exists():
             abs_image_path = fallback_path
 
         # Now pygame gets a full absolute path that always works
-        self.image = load_image(str(abs_image_path))
-        self.image = scale(self.image, size)
-        self.original_image = self.image.copy()
-        self.base_image = self.image.copy()
+        # Scaled image is shared through the cache, only read from it
+        self.original_image = get_scaled_image(abs_image_path, size)
+        self.base_image = self.original_image
+        self.image = self.original_image.copy()
 
         self.rect = self.image.get_rect(topleft=(int(pos[0]), int(pos[1])))
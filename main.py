@@ -9,7 +9,11 @@ from core.handle_logic_gui.input_manager import InputManager
 from gui.gui_info.matrix_field import Matrix
 from core.handle_logic_gui.render_engine import RenderEngine
 from gui.effects.manager import EffectManager
-from gui.cache import load_image
+from gui.dirty_renderer import DirtyRenderer
+from gui.cache import get_scaled_image, AssetPreloader
+from gui.audio_manager import AudioManager
+from ml.storage import EpisodeRecorder
+from ml.serving import InferenceService, ServedAIOpponent
 
 config = Config()
 
@@ -28,19 +32,43 @@ game_engine = GameEngine([player1, player2], verbose=True, log_to_file=False)
 env = GameEnv(engine=game_engine, render=False)
 game_engine.start_game()
 
-
-ai = AIOpponent(env, config, config.CHECKPOINT_PATH,
-                agent_id=0, device=config.DEVICE)
+# Record AI turns for offline training
+recorder = None
+if config.RECORD_EPISODES:
+    recorder = EpisodeRecorder(config.EPISODES_PATH,
+                               env.state_dim, env.num_actions)
+    env.set_recorder(recorder)
+
+
+if config.SERVE_AI:
+    # Same checkpoint, answered by a batched service on its own thread
+    service = InferenceService.from_checkpoint(
+        env, config, config.CHECKPOINT_PATH, agent_id=0)
+    service.start_background()
+    ai = ServedAIOpponent(env, service)
+else:
+    ai = AIOpponent(env, config, config.CHECKPOINT_PATH,
+                    agent_id=0, device=config.DEVICE)
 ai_manager = HumanVsAIManager(game_engine, env, ai, human_player_idx=0)
 
 field_matrix = Matrix(screen, game_engine.game_state)
+AssetPreloader(sizes=[
+    (field_matrix.grid["slot_width"] / 2, field_matrix.grid["slot_height"]),
+    field_matrix.areas["preview_card_table"].rect.size,
+]).start()
+AudioManager.preload()
 render_engine = RenderEngine(field_matrix, screen)
 
 input_manager = InputManager(field_matrix, game_engine, render_engine)
 
 image_path = "assets/background.png"
-background = load_image(image_path)
-background = pygame.transform.scale(background, screen_size)
+background = get_scaled_image(image_path, screen_size)
+field_matrix.set_background(background)
+
+dirty_renderer = None
+if config.DIRTY_RECTS:
+    dirty_renderer = DirtyRenderer(screen, field_matrix.draw,
+                                   board_state=field_matrix.draw_state)
 
 ai_state = {"running": False}
 ai_thread = None
@@ -50,6 +78,8 @@ while running:
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             running = False
+        elif event.type == pygame.WINDOWEXPOSED and dirty_renderer:
+            dirty_renderer.invalidate()
 
         input_manager.handle_event(event)
 
@@ -68,24 +98,23 @@ while running:
         )
         ai_thread.start()
 
-    screen.blit(background, background.get_rect())
-
-    field_matrix.areas["preview_card_table"].draw(screen)
-    field_matrix.draw()
-
-    input_manager.draw(screen)
-
     render_engine.update(game_engine,
                          game_engine.game_state,
                          field_matrix,
                          game_engine.event_logger)
     render_engine.animation_mgr.update(dt)
-    render_engine.draw()
-
     EffectManager.update()
-    EffectManager.draw(screen)
 
-    pygame.display.flip()
+    if dirty_renderer:
+        dirty_renderer.render(
+            input_manager.drawables() + render_engine.drawables(),
+            always=EffectManager.drawables())
+    else:
+        field_matrix.draw()
+        input_manager.draw(screen)
+        render_engine.draw()
+        EffectManager.draw(screen)
+        pygame.display.flip()
 
     # Delta time for rate limit
     dt = clock.tick(60) / 1000
@@ -94,4 +123,11 @@ while running:
         pygame.time.wait(1000)  # pause to show message
         running = False
 
+if recorder is not None:
+    if ai_thread is not None:
+        ai_thread.join()
+    if game_engine.game_state.is_game_over():
+        env.terminal_rewards()
+    recorder.close()
+
 pygame.quit()
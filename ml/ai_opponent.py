@@ -162,7 +162,8 @@ class HumanVsAIManager:
         Args:
             game_engine: GameEngine instance
             game_env: GameEnv instance
-            ai_opponent: AIOpponent instance
+            ai_opponent: AIOpponent, or a ServedAIOpponent sharing an
+                InferenceService
             human_player_idx: Which player is human (0 or 1)
         """
         self.game_engine = game_engine
@@ -0,0 +1,293 @@
+"""Headless arena for checkpoint-vs-checkpoint evaluation.
+
+Entrants are "random", "heuristic" or a checkpoint path with an optional
+agent id suffix (e.g. ml/saves/checkpoint.pth:1). Every pair of entrants
+plays N games, split across worker processes, with seats alternating.
+
+Usage:
+  python -m ml.arena ml/saves/checkpoint.pth:0 ml/saves/checkpoint.pth:1 random
+  python -m ml.arena ml/saves/checkpoint.pth heuristic --games 200 --workers 8
+"""
+import argparse
+import itertools
+import logging
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import torch
+
+
+MAX_TURNS = 200
+MAX_ACTIONS_PER_TURN = 10
+
+# Preferred action order for the heuristic bot
+HEURISTIC_PRIORITY = (
+    "attack",
+    "combine",
+    "summon",
+    "cast_spell",
+    "set_trap",
+    "end_turn",
+)
+
+
+class RandomBot:
+    """Uniformly random legal action, default parameters."""
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+
+    def act(self, env, player, player_idx):
+        legal, params = env._get_legal_actions(player)
+        candidate = self.rng.choice(legal)
+        return (env.ACTIONS.index(candidate),
+                env._pick_params_for_action(candidate, params))
+
+
+class HeuristicBot:
+    """Greedy bot that attacks first, then develops its board."""
+
+    def act(self, env, player, player_idx):
+        legal, params = env._get_legal_actions(player)
+        for name in HEURISTIC_PRIORITY:
+            if name in legal:
+                return (env.ACTIONS.index(name),
+                        env._pick_params_for_action(name, params))
+        return env.ACTIONS.index("end_turn"), None
+
+
+class CheckpointBot:
+    """Trained agent loaded through `AIOpponent`."""
+
+    def __init__(self, env, checkpoint_path, agent_id=0):
+        from ml.ai_opponent import AIOpponent
+        from ml.config import Config
+
+        self.opponent = AIOpponent(env, Config(), Path(checkpoint_path),
+                                   agent_id=agent_id, device="cpu")
+
+    def act(self, env, player, player_idx):
+        return self.opponent.get_action(player, player_idx,
+                                        deterministic=True)
+
+
+def make_bot(spec: str, env, seed=None):
+    """Build a bot from its command line spec."""
+    if spec == "random":
+        return RandomBot(seed)
+    if spec == "heuristic":
+        return HeuristicBot()
+
+    path, _, agent_id = spec.rpartition(":")
+    if not path or not agent_id.isdigit():
+        path, agent_id = spec, "0"
+    return CheckpointBot(env, path, int(agent_id))
+
+
+def play_game(env, bots, max_turns=MAX_TURNS,
+              seed=None) -> Tuple[Optional[int], int]:
+    """
+    Play one game with `bots[i]` controlling player i.
+
+    `seed` reseeds the game RNG so the game can be replayed exactly.
+
+    Returns:
+        (winner index or None for a draw, number of turns played)
+    """
+    env.reset(seed)
+    engine = env.engine
+    players = engine.game_state.players
+    turns = 0
+
+    while not engine.game_state.is_game_over() and turns < max_turns:
+        player = engine.turn_manager.get_current_player()
+        idx = players.index(player)
+
+        for _ in range(MAX_ACTIONS_PER_TURN):
+            if not env._get_legal_actions(player)[0]:
+                break
+            action_idx, params = bots[idx].act(env, player, idx)
+            _, _, done = env.step_single(
+                player, [(action_idx, params)], max_actions_per_turn=1)
+            if done or env.ACTIONS[action_idx] == "end_turn":
+                break
+
+        if engine.game_state.is_game_over():
+            break
+        if engine.turn_manager.get_current_player() == player:
+            engine.end_turn()
+        turns += 1
+
+    return env.get_winner(), turns
+
+
+def _run_match(task) -> List[Tuple[Optional[int], int]]:
+    """Worker entry point: play `num_games` between two entrants."""
+    spec_a, spec_b, num_games, seed, max_turns = task
+
+    from core.handle_game_logic.game_engine import GameEngine
+    from ml.environment.environment import GameEnv
+    from ml.main import new_players
+    from ml.utils import set_global_seeds
+    from core.utils import derive_seed
+
+    logging.disable(logging.CRITICAL)
+    set_global_seeds(seed)
+    # One intra-op thread per worker, the pool provides the parallelism
+    torch.set_num_threads(1)
+
+    engine = GameEngine(players=new_players(), verbose=False)
+    env = GameEnv(engine=engine, render=False)
+    bot_a = make_bot(spec_a, env, seed)
+    bot_b = make_bot(spec_b, env, seed + 1)
+
+    results = []
+    for game in range(num_games):
+        # Alternate seats so neither entrant always moves first
+        swap = game % 2 == 1
+        winner, turns = play_game(
+            env, (bot_b, bot_a) if swap else (bot_a, bot_b), max_turns,
+            seed=derive_seed(seed, game))
+        if winner is not None and swap:
+            winner = 1 - winner
+        # winner is now 0 for entrant a, 1 for entrant b
+        results.append((winner, turns))
+    return results
+
+
+def wilson_interval(score, n, z=1.96):
+    """Wilson score interval for a win rate."""
+    if n == 0:
+        return 0.0, 1.0
+    p = score / n
+    denom = 1 + z ** 2 / n
+    center = (p + z ** 2 / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denom
+    return max(0.0, center - half), min(1.0, center + half)
+
+
+def fit_elo(names, pair_scores, iters=200, base=1500.0):
+    """
+    Bradley-Terry ratings on the Elo scale from pairwise scores.
+
+    Args:
+        names: Entrant names
+        pair_scores: Dict (i, j) -> (score of i against j, games played)
+        iters: MM iterations
+        base: Rating of the average entrant
+
+    Returns:
+        List of ratings in `names` order
+    """
+    n = len(names)
+    wins = np.full(n, 0.5)  # small prior keeps unbeaten entrants finite
+    games = np.zeros((n, n))
+    for (i, j), (score, played) in pair_scores.items():
+        wins[i] += score
+        wins[j] += played - score
+        games[i, j] += played
+        games[j, i] += played
+
+    strength = np.ones(n)
+    for _ in range(iters):
+        denom = (games / (strength[:, None] + strength[None, :])).sum(axis=1)
+        strength = np.where(denom > 0, wins / np.maximum(denom, 1e-12), 1.0)
+        strength /= np.exp(np.log(strength).mean())
+
+    return list(base + 400.0 * np.log10(strength))
+
+
+def run_arena(specs, games=100, workers=4, seed=42, max_turns=MAX_TURNS):
+    """
+    Play a round robin between `specs` and summarize the results.
+
+    Returns:
+        Dict with per-pair win rates, Elo ratings, game length and speed
+    """
+    pairs = list(itertools.combinations(range(len(specs)), 2))
+    tasks, owners = [], []
+    for pair_idx, (i, j) in enumerate(pairs):
+        chunk = math.ceil(games / workers)
+        for start in range(0, games, chunk):
+            count = min(chunk, games - start)
+            tasks.append((specs[i], specs[j], count,
+                          seed + pair_idx * 100_003 + start, max_turns))
+            owners.append((i, j))
+
+    start_time = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        outcomes = list(pool.map(_run_match, tasks))
+    duration = time.perf_counter() - start_time
+
+    pair_scores: Dict[Tuple[int, int], Tuple[float, int]] = {}
+    lengths = []
+    matchups = []
+    for (i, j), results in zip(owners, outcomes):
+        score, played = pair_scores.get((i, j), (0.0, 0))
+        for winner, turns in results:
+            score += 0.5 if winner is None else float(winner == 0)
+            lengths.append(turns)
+        pair_scores[(i, j)] = (score, played + len(results))
+
+    for (i, j), (score, played) in pair_scores.items():
+        low, high = wilson_interval(score, played)
+        matchups.append({
+            "a": specs[i],
+            "b": specs[j],
+            "games": played,
+            "win_rate": score / played if played else 0.0,
+            "ci": (low, high),
+        })
+
+    return {
+        "matchups": matchups,
+        "elo": dict(zip(specs, fit_elo(specs, pair_scores))),
+        "mean_game_length": float(np.mean(lengths)) if lengths else 0.0,
+        "games": len(lengths),
+        "games_per_sec": len(lengths) / duration if duration > 0 else 0.0,
+    }
+
+
+def format_report(report):
+    lines = ["Matchups:"]
+    for m in report["matchups"]:
+        low, high = m["ci"]
+        lines.append(f"  {m['a']} vs {m['b']}: {m['win_rate']:.1%} "
+                     f"[{low:.1%}, {high:.1%}] over {m['games']} games")
+    lines.append("Elo:")
+    for name, rating in sorted(report["elo"].items(),
+                               key=lambda kv: -kv[1]):
+        lines.append(f"  {rating:7.1f}  {name}")
+    lines.append(f"Mean game length: {report['mean_game_length']:.1f} turns")
+    lines.append(f"Throughput: {report['games']} games, "
+                 f"{report['games_per_sec']:.2f} games/sec")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("entrants", nargs="+",
+                        help="random, heuristic or checkpoint[:agent_id]")
+    parser.add_argument("--games", type=int, default=100,
+                        help="games per pair of entrants")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--max-turns", type=int, default=MAX_TURNS)
+    args = parser.parse_args(argv)
+
+    if len(args.entrants) < 2:
+        parser.error("need at least two entrants")
+
+    report = run_arena(args.entrants, args.games, args.workers,
+                       args.seed, args.max_turns)
+    print(format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -36,11 +36,59 @@ class Config:
     # Logging & evaluation
     EVALUATION_INTERVAL = 1000    # log every 1000 frames
     RENDER = False                 # turn on only for debugging
+    VISUALIZE = False              # draw games in a separate process
+    VISUALIZE_FPS = 30             # frames sent to the visualizer per second
+    VISUALIZE_HEADLESS = False     # offscreen, SDL dummy video driver
+    VISUALIZE_VIDEO = None         # capture to a video file or frame folder
+    DIRTY_RECTS = True             # repaint only changed screen regions
+    PROFILE = True                 # per-phase timings every interval
+    SERVE_AI = False               # main.py AI through an InferenceService
+
+    # Episode recording for offline analysis / training
+    RECORD_EPISODES = False
+    RECORD_ROW_GROUP_SIZE = 4096
+
+    # Compact seed + action replays of every game (see game_replay)
+    RECORD_REPLAYS = False
+
+    # Offline training from recordings (CQL + behavior cloning)
+    OFFLINE_EPOCHS = 10
+    OFFLINE_BATCH_SIZE = 512
+    OFFLINE_WORKERS = 4
+    OFFLINE_LR = 3e-4
+    OFFLINE_TARGET_UPDATE = 500   # updates between target syncs
+    CQL_ALPHA = 1.0
     SEED = 42                      # reproducibility
 
+    # League self-play (historical opponent pool)
+    LEAGUE_ENABLED = False
+    LEAGUE_SNAPSHOT_INTERVAL = 20_000   # frames between pool snapshots
+    LEAGUE_OPPONENT_PROB = 0.5          # episodes played against the pool
+    LEAGUE_PFSP_WEIGHTING = "hard"      # hard | variance | uniform
+    LEAGUE_MAX_SIZE = 50
+    LEAGUE_WORKERS = 2
+    LEAGUE_EVAL_GAMES = 20
+    LEAGUE_EVAL_MAX_TURNS = 200
+
+    # Full training checkpoints (resumable)
+    CHECKPOINT_KEEP_LAST = 3
+    CHECKPOINT_SAVE_BUFFERS = True
+
     CHECKPOINT_PATH = Path(BASE_PATH, "ml/saves/checkpoint.pth")
+    CHECKPOINT_DIR = Path(BASE_PATH, "ml/saves/checkpoints")
+    LEAGUE_PATH = Path(BASE_PATH, "ml/saves/league")
+    EPISODES_PATH = Path(BASE_PATH, "ml/saves/episodes")
+    REPLAYS_PATH = Path(BASE_PATH, "ml/saves/replays")
+    OFFLINE_CHECKPOINT_PATH = Path(BASE_PATH, "ml/saves/offline.pth")
     RUNS_PATH = Path(BASE_PATH, "mlruns")
 
+    # Metrics: "mlflow" (tracking server), "jsonl" (local file) or "none"
+    METRICS_BACKEND = os.getenv("METRICS_BACKEND", "mlflow")
+    MLFLOW_TRACKING_URI = os.getenv(
+        "MLFLOW_TRACKING_URI", "http://localhost:5000")
+    METRICS_PATH = Path(BASE_PATH, "ml/saves/metrics.jsonl")
+    METRICS_FLUSH_INTERVAL = 5.0   # seconds between background writes
+
     # Database
     USER = os.getenv("POSTGRES_USER")
     PASSWORD = os.getenv("POSTGRES_PASSWORD")
@@ -1,4 +1,4 @@
-from .utils import safe_index
+from .utils import safe_index, STATE_PARTS
 from core.player import Player
 from core.cards.monster_card import MonsterCard
 from core.cards.spell_card import SpellCard
@@ -14,6 +14,9 @@ class ActionHandler:
     Returns True if action was successful, False otherwise.
     """
 
+    # State parts a successful action may change, see utils.STATE_PARTS
+    modifies = STATE_PARTS
+
     def __init__(self):
         self.logger = logging.getLogger("GameEngine")
 
@@ -23,6 +26,9 @@ class ActionHandler:
 
 
 class SummonHandler(ActionHandler):
+    modifies = frozenset({"hand", "my_monsters", "my_slots", "summon_flag",
+                          "opp_traps"})
+
     def perform(self, env, player: Player, params: Optional[Dict]) -> bool:
         """Summon a monster from hand to field."""
         if not params:
@@ -57,6 +63,9 @@ class SummonHandler(ActionHandler):
 
 
 class AttackHandler(ActionHandler):
+    modifies = frozenset({"my_monsters", "my_slots", "opp_monsters",
+                          "opp_traps"})
+
     def perform(self, env, player: Player, params: Optional[Dict]) -> bool:
         """Perform an attack with a monster."""
         if not params:
@@ -114,6 +123,8 @@ class AttackHandler(ActionHandler):
 
 
 class CastSpellHandler(ActionHandler):
+    modifies = frozenset({"hand", "opp_traps", "summon_flag"})
+
     def perform(self, env, player: Player, params: Optional[Dict]) -> bool:
         """Cast a spell card."""
         if not params:
@@ -173,6 +184,8 @@ class CastSpellHandler(ActionHandler):
 
 
 class SetTrapHandler(ActionHandler):
+    modifies = frozenset({"hand", "my_slots", "trap_flag"})
+
     def perform(self, env, player: Player, params: Optional[Dict]) -> bool:
         """Set a trap card face-down."""
         if not params:
@@ -208,6 +221,8 @@ class SetTrapHandler(ActionHandler):
 
 
 class ToggleHandler(ActionHandler):
+    modifies = frozenset({"my_monsters", "toggle_flag"})
+
     def perform(self, env, player: Player, params: Optional[Dict]) -> bool:
         """Toggle a monster's position (attack/defense)."""
         if not params:
@@ -248,6 +263,8 @@ class ToggleHandler(ActionHandler):
 
 
 class CombineHandler(ActionHandler):
+    modifies = frozenset({"my_monsters", "my_slots"})
+
     def perform(self, env, player: Player, params: Optional[Dict]) -> bool:
         """Combine two monsters to create a higher-level monster."""
         if not params:
@@ -3,14 +3,20 @@ from core.cards.monster_card import MonsterCard
 from core.cards.spell_card import SpellCard
 from core.cards.trap_card import TrapCard
 from typing import Tuple, List, Dict, Any
+from .utils import STATE_PARTS
 
 
 class LegalActionResolver:
+    # State parts the result depends on, see utils.STATE_PARTS
+    depends_on = STATE_PARTS
+
     def resolve(self, env, player: Player) -> Tuple[List[str], Dict[str, Any]]:
         raise NotImplementedError
 
 
 class SummonResolver(LegalActionResolver):
+    depends_on = frozenset({"hand", "summon_flag", "my_slots"})
+
     def resolve(self, env, player: Player) -> Tuple[List[str], Dict[str, Any]]:
         gs = env.engine.game_state
         cards = gs.player_info[player]["held_cards"].cards
@@ -24,6 +30,8 @@ class SummonResolver(LegalActionResolver):
 
 
 class AttackResolver(LegalActionResolver):
+    depends_on = frozenset({"my_monsters", "opp_monsters"})
+
     def resolve(self, env, player: Player) -> Tuple[List[str], Dict[str, Any]]:
         gs = env.engine.game_state
         tm = env.engine.turn_manager
@@ -46,6 +54,8 @@ class AttackResolver(LegalActionResolver):
 
 
 class CastSpellResolver(LegalActionResolver):
+    depends_on = frozenset({"hand", "my_monsters", "opp_traps"})
+
     def resolve(self, env, player: Player) -> Tuple[List[str], Dict[str, Any]]:
         gs = env.engine.game_state
         cards = gs.player_info[player]["held_cards"].cards
@@ -88,6 +98,8 @@ class CastSpellResolver(LegalActionResolver):
 
 
 class SetTrapResolver(LegalActionResolver):
+    depends_on = frozenset({"hand", "trap_flag", "my_slots"})
+
     def resolve(self, env, player: Player) -> Tuple[List[str], Dict[str, Any]]:
         gs = env.engine.game_state
         cards = gs.player_info[player]["held_cards"].cards
@@ -101,6 +113,8 @@ class SetTrapResolver(LegalActionResolver):
 
 
 class ToggleResolver(LegalActionResolver):
+    depends_on = frozenset({"my_monsters", "toggle_flag"})
+
     def resolve(self, env, player: Player) -> Tuple[List[str], Dict[str, Any]]:
         gs = env.engine.game_state
         my_monsters = [c for c in gs.get_player_cards(
@@ -113,6 +127,8 @@ class ToggleResolver(LegalActionResolver):
 
 
 class CombineResolver(LegalActionResolver):
+    depends_on = frozenset({"my_monsters"})
+
     def resolve(self, env, player: Player) -> Tuple[List[str], Dict[str, Any]]:
         mergeable_groups = env.engine.get_mergeable_groups(player)
         combine_pairs: List[Tuple[int, int]] = []
@@ -122,10 +138,17 @@ class CombineResolver(LegalActionResolver):
                     for j in range(i + 1, len(group)):
                         combine_pairs.append((group[i].id, group[j].id))
         if combine_pairs:
+            # Field order, the order LegalParams.combine lists them in
+            positions = {card.id: pos for pos, card in enumerate(
+                env.engine.game_state.get_player_cards(player))}
+            combine_pairs.sort(
+                key=lambda pair: (positions[pair[0]], positions[pair[1]]))
             return ["combine"], {"combine": {"pairs": combine_pairs}}
         return [], {}
 
 
 class EndTurnResolver(LegalActionResolver):
+    depends_on = frozenset()
+
     def resolve(self, env, player: Player) -> Tuple[List[str], Dict[str, Any]]:
         return ["end_turn"], {"end_turn": {}}
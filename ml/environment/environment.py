@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import time
 import random
+import secrets
+import time
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
@@ -29,14 +30,18 @@ from ml.environment.utils import (
     ability_to_float,
     card_type_to_int,
 )
+from ml.environment.legal_params import LegalParams
 from ml.environment.renderer import Renderer
 from ml.environment.reward_system import (
     RewardCalculator,
     RewardConfig,
+    Snapshot,
     create_enhanced_snapshot
 )
 from core.handle_game_logic.game_engine import GameEngine
+from ml.profiler import profiler
 from core.player import Player
+from core.utils import derive_seed
 import logging
 
 # Constants
@@ -71,13 +76,29 @@ class GameEnv:
     def __init__(self,
                  engine: GameEngine,
                  render: bool = False,
-                 reward_config: Optional[RewardConfig] = None) -> None:
+                 reward_config: Optional[RewardConfig] = None,
+                 compiled_turns: bool = True) -> None:
         self.render = render
+        # Resolve legal actions incrementally within a turn, see step_single
+        self.compiled_turns = compiled_turns
         self.engine: GameEngine = engine
         self.logger = logging.getLogger("GameEngine")
 
+        # Picks the random filler actions in step_single, kept apart from
+        # the engine RNG so replays only need the recorded actions
+        self.rng = random.Random()
+
         # Initialize reward calculator
         self.reward_calculator = RewardCalculator(config=reward_config)
+        self.last_breakdown = None
+        self.last_snapshot = None
+
+        # Optional EpisodeRecorder, see set_recorder
+        self.recorder = None
+        # Optional ReplayRecorder, see set_replay_recorder
+        self.replay_recorder = None
+        # Optional Visualizer, see set_visualizer
+        self.visualizer = None
 
         self._init_handlers_and_resolvers()
 
@@ -102,9 +123,19 @@ class GameEnv:
         return len(self._get_state(p1))
 
     # -------------------- engine lifecycle --------------------
-    def reset(self) -> Tuple[np.ndarray, np.ndarray]:
+    def reset(
+            self,
+            seed: Optional[int] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """Start a new game and return initial states for both players.
 
+        Parameters
+        ----------
+        seed
+            Optional seed for this episode. Reseeds the engine RNG and
+            the RNG of the random actions picked in step_single, so the
+            game can be replayed exactly.
+
         Returns
         -------
         tuple
@@ -112,7 +143,14 @@ class GameEnv:
         """
         # Log previous episode summary if exists
         self.reward_calculator.log_episode_summary()
-        self.engine.reset()
+        if seed is None and self.replay_recorder is not None:
+            # Replays are rebuilt from the seed, so always pick one
+            seed = secrets.randbits(63)
+        self.engine.reset(seed)
+        if seed is not None:
+            self.rng.seed(derive_seed(seed, 1))
+        if self.replay_recorder is not None:
+            self.replay_recorder.start_game(self.engine, seed)
         self.engine.start_game()
 
         # Update reward calculator with max stats
@@ -123,6 +161,10 @@ class GameEnv:
         p1, p2 = self.engine.game_state.players
         if hasattr(self, "renderer"):
             self.renderer.reset()
+        if self.recorder is not None:
+            self.recorder.start_episode()
+        if self.visualizer is not None:
+            self.visualizer.submit(self.engine, new_game=True)
 
         return self._get_state(p1), self._get_state(p2)
 
@@ -179,15 +221,8 @@ class GameEnv:
         # Add terminal rewards if game ended
         done = self.engine.game_state.is_game_over()
         if done:
-            for idx, player in enumerate(players):
-                if player.life_points > 0:
-                    terminal_breakdown = self.reward_calculator.calculate_terminal_reward(
-                        player, won=True)
-                    rewards[idx] += terminal_breakdown.total
-                else:
-                    terminal_breakdown = self.reward_calculator.calculate_terminal_reward(
-                        player, won=False)
-                    rewards[idx] += terminal_breakdown.total
+            for idx, breakdown in enumerate(self.terminal_rewards()):
+                rewards[idx] += breakdown.total
 
         states = tuple(self._get_state(p) for p in players)
         return states, rewards, done, info
@@ -197,38 +232,72 @@ class GameEnv:
                     player_actions,
                     max_actions_per_turn: int = 10
                     ):
+        """Play one player's turn: the planned actions, then random ones.
+
+        With `compiled_turns` the legal actions are resolved once at the
+        start of the turn; after each action only the resolvers reading
+        state the action's handler modifies are re-run. Each action's
+        after snapshot is the next one's before snapshot. Actions and
+        rewards are the same either way.
+        """
         total_turn_reward = 0.0
         action_pointer = 0
         actions_taken = 0
+        done = False
+        snapshot = None
+        resolved = [None] * len(self._resolvers) if self.compiled_turns \
+            else None
+        modified = None
 
         while actions_taken < max_actions_per_turn:
 
-            legal, params = self._get_legal_actions(player)
+            legal, params = self._get_legal_actions(player, resolved, modified)
             if not legal:
                 self.logger.info(
                     f"  ℹ️  No legal actions available for {player.name}")
                 break
 
-            if action_pointer < len(player_actions):
+            chosen = action_pointer < len(player_actions)
+            if chosen:
                 action_idx, action_params = player_actions[action_pointer]
                 action_pointer += 1
                 if action_idx >= len(self.ACTIONS):
                     action_idx = self.ACTIONS.index("end_turn")
             else:
-                candidate = random.choice(legal)
+                candidate = self.rng.choice(legal)
                 action_idx = self.ACTIONS.index(candidate)
                 action_params = self._pick_params_for_action(
                     candidate, params)
 
-            # Take snapshot before action
-            before_snapshot = create_enhanced_snapshot(self.engine, player)
+            if self.recorder is not None:
+                state_before = self._get_state(player)
+
+            if self.replay_recorder is not None:
+                self.replay_recorder.record(
+                    self.engine, player, self.ACTIONS[action_idx],
+                    action_idx, action_params)
+
+            # Take snapshot before action, the previous action's after
+            # snapshot is still current within the turn
+            before_snapshot = snapshot if snapshot is not None else \
+                create_enhanced_snapshot(self.engine, player)
 
             # Perform action via handler
             reward, done, success = self._apply_action(
                 player, action_idx, action_params, before_snapshot)
+            snapshot = self.last_snapshot
+            # A failed handler may have left anything changed
+            handler = self._action_handlers[self.ACTIONS[action_idx]]
+            modified = handler.modifies if success else None
+
+            if self.recorder is not None:
+                self._record_action(player, state_before, legal,
+                                    action_idx, action_params, done, chosen)
 
             if hasattr(self, "renderer"):
                 self.renderer.render()
+            if self.visualizer is not None:
+                self.visualizer.submit(self.engine)
 
             total_turn_reward += reward
             actions_taken += 1
@@ -265,24 +334,54 @@ class GameEnv:
         """Return mask and parameters for legal actions."""
         player = self.engine.game_state.players[player_idx]
         legal_actions, params = self._get_legal_actions(player)
+        return self._legal_mask(legal_actions), params
 
-        # Create mask
+    def get_legal_arrays(self, player_idx) -> Tuple[np.ndarray, LegalParams]:
+        """Return the mask and the parameters as fixed-shape arrays."""
+        player = self.engine.game_state.players[player_idx]
+        legal_actions, params = self._get_legal_actions(player)
+        field_ids = [card.id for card in
+                     self.engine.game_state.get_player_cards(player)]
+        return (self._legal_mask(legal_actions),
+                LegalParams.from_dict(params, field_ids))
+
+    def _legal_mask(self, legal_actions: List[str]) -> np.ndarray:
         mask = np.zeros(self.num_actions, dtype=bool)
         for action_name in legal_actions:
             action_idx = self.ACTIONS.index(action_name)
             mask[action_idx] = True
+        return mask
 
-        return mask, params
-
-    def _get_legal_actions(self, player: Player) -> Tuple[List[str], Dict[str, Any]]:
+    def _get_legal_actions(
+        self,
+        player: Player,
+        resolved: Optional[List] = None,
+        modified: Optional[frozenset] = None,
+    ) -> Tuple[List[str], Dict[str, Any]]:
+        """Legal action names and their params.
+
+        Args:
+            player: Acting player
+            resolved: Per-resolver results kept across calls in one turn,
+                updated in place. None resolves everything.
+            modified: State parts changed since `resolved` was filled,
+                None re-runs every resolver
+        """
         legal_actions: List[str] = []
         action_params: Dict[str, Any] = {}
-        for resolver in self._resolvers:
-            names, params = resolver.resolve(self, player)
-            for name in names:
-                if name not in legal_actions:
-                    legal_actions.append(name)
-            action_params.update(params)
+        with profiler.span("legal_actions"):
+            for i, resolver in enumerate(self._resolvers):
+                if resolved is None:
+                    names, params = resolver.resolve(self, player)
+                else:
+                    if modified is None or resolved[i] is None or \
+                            resolver.depends_on & modified:
+                        resolved[i] = resolver.resolve(self, player)
+                    names, params = resolved[i]
+                for name in names:
+                    if name not in legal_actions:
+                        legal_actions.append(name)
+                action_params.update(params)
         return legal_actions, action_params
 
     @staticmethod
@@ -331,7 +430,7 @@ class GameEnv:
         player: Player,
         action_idx: int,
         params: Optional[Dict],
-        before_snapshot: Dict[str, Any]
+        before_snapshot: Snapshot
     ) -> Tuple[float, bool, bool]:
         """Apply action and calculate reward using the new reward system.
 
@@ -353,15 +452,21 @@ class GameEnv:
                 self.logger.warning(
                     f"⚠️  Action '{action_name}' has no handler")
 
-            after_snapshot = create_enhanced_snapshot(self.engine, player)
-            breakdown = self.reward_calculator.calculate_action_reward(
-                action_name, player, params, success, before_snapshot, after_snapshot
-            )
+            # Nothing ran, so the state is unchanged
+            after_snapshot = before_snapshot
+            with profiler.span("reward"):
+                breakdown = self.reward_calculator.calculate_action_reward(
+                    action_name, player, params, success, before_snapshot,
+                    after_snapshot
+                )
+            self.last_breakdown = breakdown
+            self.last_snapshot = after_snapshot
             return breakdown.total, done, success
 
         # Perform the action
         try:
-            _ = handler.perform(self, player, params)
+            with profiler.span("apply_action"):
+                _ = handler.perform(self, player, params)
             success = True
         except Exception as e:
             self.logger.error(
@@ -372,9 +477,13 @@ class GameEnv:
         after_snapshot = create_enhanced_snapshot(self.engine, player)
 
         # Calculate reward using the new reward system
-        breakdown = self.reward_calculator.calculate_action_reward(
-            action_name, player, params, success, before_snapshot, after_snapshot
-        )
+        with profiler.span("reward"):
+            breakdown = self.reward_calculator.calculate_action_reward(
+                action_name, player, params, success, before_snapshot, after_snapshot
+            )
+
+        self.last_breakdown = breakdown
+        self.last_snapshot = after_snapshot
 
         # Check for game over
         if self.engine.game_state.is_game_over():
@@ -382,16 +491,63 @@ class GameEnv:
 
         return breakdown.total, done, success
 
+    # -------------------- recording --------------------
+    def set_recorder(self, recorder) -> None:
+        """Attach an EpisodeRecorder (or None) that logs every action."""
+        self.recorder = recorder
+        if recorder is not None:
+            recorder.start_episode()
+
+    def set_replay_recorder(self, recorder) -> None:
+        """Attach a ReplayRecorder (or None), games start recording on the
+        next reset."""
+        self.replay_recorder = recorder
+
+    def set_visualizer(self, visualizer) -> None:
+        """Attach a Visualizer (or None) that draws the game in its own
+        process at a capped frame rate."""
+        self.visualizer = visualizer
+
+    def terminal_rewards(self):
+        """
+        Victory/defeat reward breakdown of each player for a finished game,
+        also added to the recorder's last row of each player.
+        """
+        breakdowns = []
+        for idx, player in enumerate(self.engine.game_state.players):
+            breakdown = self.reward_calculator.calculate_terminal_reward(
+                player, won=player.life_points > 0)
+            if self.recorder is not None:
+                self.recorder.record_terminal(idx, breakdown)
+            breakdowns.append(breakdown)
+        return breakdowns
+
+    def _record_action(self, player, state, legal, action_idx, params, done,
+                       chosen=True):
+        self.recorder.record(
+            player_idx=self.engine.game_state.players.index(player),
+            turn=self.engine.turn_manager.turn_count,
+            state=state,
+            mask=self._legal_mask(legal),
+            action_idx=action_idx,
+            params=params,
+            breakdown=self.last_breakdown,
+            done=done,
+            chosen=chosen,
+        )
+
     # -------------------- state encoding --------------------
     def _get_state(self, player: Player) -> np.ndarray:
         """Return a flat state vector for a given player.
 
         Layout: [player_features, hand_encoded, board_encoded]
         """
-        player_features = self._encode_player_features(player)
-        hand_encoded = self._encode_hand(player)
-        board_encoded = self._encode_board(player)
-        return np.concatenate([player_features, hand_encoded, board_encoded])
+        with profiler.span("state_encoding"):
+            player_features = self._encode_player_features(player)
+            hand_encoded = self._encode_hand(player)
+            board_encoded = self._encode_board(player)
+            return np.concatenate(
+                [player_features, hand_encoded, board_encoded])
 
     @staticmethod
     def _encode_player_features(player: Player) -> np.ndarray:
@@ -466,17 +622,26 @@ class GameEnv:
                     f"  ℹ️  No legal actions available for {player.name}")
                 break
 
-            if action_pointer < len(player_actions):
+            chosen = action_pointer < len(player_actions)
+            if chosen:
                 action_idx, action_params = player_actions[action_pointer]
                 action_pointer += 1
                 if action_idx >= len(self.ACTIONS):
                     action_idx = self.ACTIONS.index("end_turn")
             else:
-                candidate = random.choice(legal)
+                candidate = self.rng.choice(legal)
                 action_idx = self.ACTIONS.index(candidate)
                 action_params = self._pick_params_for_action(
                     candidate, params)
 
+            if self.recorder is not None:
+                state_before = self._get_state(player)
+
+            if self.replay_recorder is not None:
+                self.replay_recorder.record(
+                    self.engine, player, self.ACTIONS[action_idx],
+                    action_idx, action_params)
+
             # Take snapshot before action
             before_snapshot = create_enhanced_snapshot(self.engine, player)
 
@@ -484,6 +649,10 @@ class GameEnv:
             reward, done, success = self._apply_action(
                 player, action_idx, action_params, before_snapshot)
 
+            if self.recorder is not None:
+                self._record_action(player, state_before, legal,
+                                    action_idx, action_params, done, chosen)
+
             actions_taken += 1
 
             if callback:
@@ -0,0 +1,120 @@
+"""
+Fixed-shape encoding of the legal action parameters.
+
+`GameEnv._get_legal_actions` describes legal params as nested dicts of
+lists. `LegalParams` holds the same information as boolean masks over
+hand and field positions, so a batch of environments stacks into plain
+arrays and `ActionMapper.map_batch` can pick params by array indexing.
+"""
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Sequence
+
+import numpy as np
+
+# Hand positions, room for the unchecked draws of "draw_two_cards" past
+# the 10 card hand limit
+MAX_HAND = 16
+# Cards per side of the field
+MAX_FIELD = 10
+
+
+@dataclass
+class LegalParams:
+    """
+    Legal params of one player, or of a batch when stacked.
+
+    Masks are indexed by the values the resolvers list: hand positions
+    for summon, set_trap and spells, field monster positions for
+    attackers, attack targets and toggle, spell target positions per
+    spell, and (first, second) positions in the player's field cards for
+    combine. Stacked instances add a leading batch dimension.
+    """
+    summon: np.ndarray          # (MAX_HAND,)
+    set_trap: np.ndarray        # (MAX_HAND,)
+    spells: np.ndarray          # (MAX_HAND,)
+    spell_targets: np.ndarray   # (MAX_HAND, MAX_FIELD)
+    attackers: np.ndarray       # (MAX_FIELD,)
+    attack_targets: np.ndarray  # (MAX_FIELD,)
+    direct_attack: np.ndarray   # (), no opponent monster to target
+    toggle: np.ndarray          # (MAX_FIELD,)
+    combine: np.ndarray         # (MAX_FIELD, MAX_FIELD)
+    field_ids: Any              # card id per field position, for combine
+
+    @classmethod
+    def empty(cls) -> "LegalParams":
+        return cls(
+            summon=np.zeros(MAX_HAND, dtype=bool),
+            set_trap=np.zeros(MAX_HAND, dtype=bool),
+            spells=np.zeros(MAX_HAND, dtype=bool),
+            spell_targets=np.zeros((MAX_HAND, MAX_FIELD), dtype=bool),
+            attackers=np.zeros(MAX_FIELD, dtype=bool),
+            attack_targets=np.zeros(MAX_FIELD, dtype=bool),
+            direct_attack=np.zeros((), dtype=bool),
+            toggle=np.zeros(MAX_FIELD, dtype=bool),
+            combine=np.zeros((MAX_FIELD, MAX_FIELD), dtype=bool),
+            field_ids=(),
+        )
+
+    @classmethod
+    def from_dict(cls, params: Dict[str, Dict],
+                  field_ids: Sequence) -> "LegalParams":
+        """
+        Encode the params dict of `GameEnv._get_legal_actions` in one pass.
+
+        Args:
+            params: Legal params dict
+            field_ids: Ids of the player's field cards, in field order
+        """
+        legal = cls.empty()
+        legal.field_ids = tuple(field_ids)
+
+        _set(legal.summon, params.get("summon", {}).get("monsters", ()))
+        _set(legal.set_trap, params.get("set_trap", {}).get("traps", ()))
+        _set(legal.toggle, params.get("toggle", {}).get("toggles", ()))
+
+        spell_info = params.get("cast_spell", {})
+        _set(legal.spells, spell_info.get("spells", ()))
+        for spell, targets in spell_info.get("targets", {}).items():
+            if 0 <= spell < MAX_HAND:
+                _set(legal.spell_targets[spell], targets)
+
+        attack_info = params.get("attack", {})
+        _set(legal.attackers, attack_info.get("attackers", ()))
+        targets = attack_info.get("targets", ())
+        if list(targets) == [-1]:
+            legal.direct_attack[()] = True
+        else:
+            _set(legal.attack_targets, targets)
+
+        positions = {card_id: pos for pos, card_id in enumerate(field_ids)}
+        for first, second in params.get("combine", {}).get("pairs", ()):
+            i, j = positions.get(first), positions.get(second)
+            if i is not None and j is not None \
+                    and i < MAX_FIELD and j < MAX_FIELD:
+                legal.combine[i, j] = True
+        return legal
+
+    @classmethod
+    def stack(cls, items: Sequence["LegalParams"]) -> "LegalParams":
+        """Stack per-environment params into one batch."""
+        arrays = {f.name: np.stack([getattr(item, f.name) for item in items])
+                  for f in fields(cls) if f.name != "field_ids"}
+        return cls(field_ids=[item.field_ids for item in items], **arrays)
+
+    def flatten(self) -> np.ndarray:
+        """All masks as one float32 vector (or (N, LEGAL_PARAMS_DIM) matrix
+        when stacked), e.g. as model input."""
+        batch = self.summon.shape[:-1]
+        return np.concatenate(
+            [getattr(self, f.name).reshape(*batch, -1)
+             for f in fields(self) if f.name != "field_ids"],
+            axis=-1).astype(np.float32)
+
+
+def _set(mask: np.ndarray, indices):
+    for i in indices:
+        if 0 <= i < len(mask):
+            mask[i] = True
+
+
+LEGAL_PARAMS_DIM = LegalParams.empty().flatten().shape[-1]
@@ -2,7 +2,9 @@ import pygame
 from core.handle_logic_gui.render_engine import RenderEngine
 from gui.gui_info.matrix_field import Matrix
 from gui.effects.manager import EffectManager
-from gui.cache import load_image
+from gui.dirty_renderer import DirtyRenderer
+from gui.cache import get_scaled_image, AssetPreloader
+from gui.audio_manager import AudioManager
 
 
 class Renderer:
@@ -11,7 +13,8 @@ class Renderer:
     Supports dynamic engine updates and integration with RenderThread.
     """
 
-    def __init__(self, engine=None, delay=0.0, screen_size=(1280, 720), train_mode=True):
+    def __init__(self, engine=None, delay=0.0, screen_size=(1280, 720),
+                 train_mode=True, dirty_rects=True):
         # Pygame setup
         pygame.init()
         self.screen_size = screen_size
@@ -22,12 +25,12 @@ class Renderer:
         self.engine = engine
         self.train_mode = train_mode
         self.render_delay = delay
+        self.dirty_rects = dirty_rects
+        self.dirty_renderer = None
 
         # Background
         image_path = "assets/background.png"
-        self.background = load_image(image_path)
-        self.background = pygame.transform.scale(
-            self.background, self.screen_size)
+        self.background = get_scaled_image(image_path, self.screen_size)
 
         # Initialize field_matrix and render_engine if engine is provided
         if self.engine is not None:
@@ -39,23 +42,55 @@ class Renderer:
     def _init_render_objects(self):
         """Initialize or update field_matrix and render_engine for the current engine."""
         self.field_matrix = Matrix(self.screen, self.engine.game_state)
+        self.field_matrix.set_background(self.background)
+        grid = self.field_matrix.grid
+        self.preloader = AssetPreloader(sizes=[
+            (grid["slot_width"] / 2, grid["slot_height"]),
+            self.field_matrix.areas["preview_card_table"].rect.size,
+        ]).start()
+        if not self.train_mode:
+            AudioManager.preload()
         self.render_engine = RenderEngine(
             self.field_matrix, self.screen, train_mode=self.train_mode
         )
+        if self.dirty_rects:
+            self.dirty_renderer = DirtyRenderer(
+                self.screen, self.field_matrix.draw,
+                board_state=self.field_matrix.draw_state)
+
+    def _render_dirty(self, components):
+        """Repaint only what changed, see `DirtyRenderer`."""
+        self.render_engine.update(
+            self.engine,
+            self.engine.game_state,
+            self.field_matrix,
+            self.engine.event_logger
+        )
+        self.render_engine.animation_mgr.update(self.dt)
+        EffectManager.update()
+        self.dirty_renderer.render(
+            self.render_engine.drawables() + list(components),
+            always=EffectManager.drawables())
 
     def render(self, components=[]):
-        """Draw the current game state to the screen."""
+        """Draw the current game state to the screen.
+
+        With dirty rects, components need a `rect` or `bounds()`.
+        """
         if self.engine is None:
             return
 
-        # Background
-        self.screen.blit(self.background, (0, 0))
+        if self.dirty_renderer is not None:
+            self._render_dirty(components)
+            pygame.event.pump()
+            self.tick(fps=0 if self.train_mode else 60)
+            return
 
-        # Draw field and preview areas
+        # Background, field and preview areas
         if hasattr(self, "field_matrix"):
-            if "preview_card_table" in self.field_matrix.areas:
-                self.field_matrix.areas["preview_card_table"].draw(self.screen)
             self.field_matrix.draw()
+        else:
+            self.screen.blit(self.background, (0, 0))
 
         # Draw animations via render_engine
         if hasattr(self, "render_engine"):
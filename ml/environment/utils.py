@@ -31,3 +31,18 @@ def card_type_to_int(card: Any) -> int:
     if isinstance(card, TrapCard):
         return 3
     return 0
+
+
+# Parts of the game state, from the acting player's point of view, that
+# legal action resolvers read and action handlers modify. Used to re-run
+# only the affected resolvers within a turn.
+STATE_PARTS = frozenset({
+    "hand",            # cards in hand
+    "my_monsters",     # own monsters, their modes and attack flags
+    "my_slots",        # free field slots
+    "opp_monsters",    # opponent monsters
+    "opp_traps",       # opponent traps
+    "summon_flag",     # has_summoned_monster
+    "trap_flag",       # has_summoned_trap
+    "toggle_flag",     # has_toggled
+})
@@ -0,0 +1,312 @@
+"""
+Live training visualizer running the pygame renderer in its own process.
+
+`GameEnv(render=True)` renders synchronously after every action, so the
+learner runs at GUI speed. A `Visualizer` instead sends engine snapshots
+(`GameEngine.snapshot`, a few KB) to a child process over a queue, at
+most `fps` per second. When the child falls behind, frames are dropped:
+the learner never waits on a full queue, and the child only draws the
+newest snapshot it has. The first state of a game replaces the oldest
+queued snapshot instead, and carries a new game number so the child
+resets its sprites and event playback.
+
+With `headless` the child uses SDL's dummy video driver, and `video`
+captures every drawn frame, to a video file through ffmpeg or as PNG
+files into a directory.
+
+Usage:
+  env.set_visualizer(Visualizer(fps=30))
+  python -m ml.environment.visualizer heuristic random --games 3
+  python -m ml.environment.visualizer --headless --video runs/games.mp4
+"""
+import argparse
+import logging
+import multiprocessing as mp
+import os
+import queue
+import shutil
+import subprocess
+import time
+from pathlib import Path
+
+VIDEO_EXTENSIONS = (".mp4", ".mkv", ".webm", ".avi", ".mov")
+
+
+def _ffmpeg(path) -> str:
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        raise FileNotFoundError(
+            f"ffmpeg is needed to write {path}, "
+            f"pass a directory to save PNG frames instead")
+    return ffmpeg
+
+
+class FrameWriter:
+    """
+    Writes rendered frames to a video file through an ffmpeg pipe, or
+    as numbered PNG files when `path` has no video extension.
+
+    Args:
+        path: Video file or frame directory
+        fps: Playback rate of the video
+        size: Frame size
+    """
+
+    def __init__(self, path, fps, size):
+        self.path = Path(path)
+        self.frames = 0
+        self.process = None
+        if self.path.suffix.lower() in VIDEO_EXTENSIONS:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            width, height = size
+            self.process = subprocess.Popen(
+                [_ffmpeg(self.path), "-y", "-loglevel", "error",
+                 "-f", "rawvideo", "-pix_fmt", "rgb24",
+                 "-s", f"{width}x{height}", "-r", str(fps), "-i", "-",
+                 "-pix_fmt", "yuv420p", str(self.path)],
+                stdin=subprocess.PIPE)
+        else:
+            self.path.mkdir(parents=True, exist_ok=True)
+
+    def write(self, surface):
+        import pygame
+
+        if self.process is not None:
+            self.process.stdin.write(pygame.image.tobytes(surface, "RGB"))
+        else:
+            pygame.image.save(
+                surface, str(self.path / f"frame_{self.frames:06d}.png"))
+        self.frames += 1
+
+    def close(self):
+        if self.process is not None:
+            self.process.stdin.close()
+            self.process.wait()
+            self.process = None
+
+
+def _run(snapshots, players, fps, screen_size, headless, video):
+    """Child process: draw the newest snapshot until the None sentinel."""
+    if headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+    import pygame
+    from core.handle_game_logic.game_engine import GameEngine
+    from core.player import Player
+    from ml.environment.renderer import Renderer
+
+    logger = logging.getLogger("Visualizer")
+    engine = GameEngine(
+        players=[Player(index, name, is_opponent=is_opponent)
+                 for index, name, is_opponent in players],
+        verbose=False)
+    # Train mode: no animation delays, effects or sound
+    renderer = Renderer(engine=engine, screen_size=screen_size,
+                        train_mode=True)
+    writer = FrameWriter(video, fps, screen_size) if video else None
+    game = None
+    events_seen = 0
+
+    try:
+        stop = False
+        while not stop:
+            # Skip to the newest snapshot, dropping the ones behind it
+            latest = None
+            item = snapshots.get()
+            try:
+                while True:
+                    if item is None:
+                        stop = True
+                        break
+                    latest = item
+                    item = snapshots.get_nowait()
+            except queue.Empty:
+                pass
+            if latest is None:
+                break
+
+            snapshot_game, snapshot = latest
+            engine.restore(snapshot)
+            if snapshot_game != game:
+                # New game: no sprites or events carry over
+                game = snapshot_game
+                events_seen = 0
+                renderer.reset()
+            renderer.render_engine.rebind_cards(engine.game_state)
+            # Events accumulate over a game, only play the unseen ones
+            events = engine.event_logger.get_events()
+            unseen = events[events_seen:]
+            events_seen = len(events)
+            engine.event_logger.clear_events()
+            for event in unseen:
+                engine.event_logger.add_event(event)
+
+            renderer.render()
+            if writer is not None:
+                writer.write(renderer.screen)
+            if pygame.event.peek(pygame.QUIT):
+                break
+    finally:
+        if writer is not None:
+            writer.close()
+            logger.info(f"Captured {writer.frames} frames to {writer.path}")
+        renderer.preloader.wait()
+        pygame.quit()
+
+
+class Visualizer:
+    """
+    Renders training games in a separate process without slowing down
+    the learner.
+
+    Attach with `env.set_visualizer(visualizer)`; the process starts on
+    the first submitted state and stops on `close()`.
+
+    Args:
+        fps: Maximum snapshots sent (and frames drawn) per second
+        screen_size: Window size
+        headless: Render offscreen with SDL's dummy video driver
+        video: Capture frames to this video file (needs ffmpeg) or
+            frame directory
+        queue_size: Snapshots in flight before new ones are dropped
+    """
+
+    def __init__(self, fps=30, screen_size=(1280, 720), headless=False,
+                 video=None, queue_size=2):
+        if video and Path(video).suffix.lower() in VIDEO_EXTENSIONS:
+            _ffmpeg(video)
+        self.interval = 1.0 / fps
+        self.fps = fps
+        self.screen_size = tuple(screen_size)
+        self.headless = headless
+        self.video = str(video) if video else None
+        self.logger = logging.getLogger("Visualizer")
+
+        context = mp.get_context("spawn")
+        self._context = context
+        self.snapshots = context.Queue(maxsize=queue_size)
+        self.process = None
+        self.sent = 0
+        self.dropped = 0
+        # Game number sent with each snapshot
+        self.game = 0
+        self._last_sent = float("-inf")
+
+    def _start(self, engine):
+        players = [(p.player_index, p.name, p.is_opponent)
+                   for p in engine.players]
+        self.process = self._context.Process(
+            target=_run, name="Visualizer", daemon=True,
+            args=(self.snapshots, players, self.fps, self.screen_size,
+                  self.headless, self.video))
+        self.process.start()
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+    def submit(self, engine, force=False, new_game=False) -> bool:
+        """
+        Send the engine state if a frame is due, never blocks.
+
+        Args:
+            engine: GameEngine to snapshot
+            force: Ignore the frame rate and make room in a full queue
+                by dropping the oldest queued snapshot
+            new_game: First state of a game, implies `force`
+
+        Returns:
+            True if the snapshot was queued
+        """
+        now = time.perf_counter()
+        force = force or new_game
+        if not force and now - self._last_sent < self.interval:
+            return False
+        if self.process is None:
+            self._start(engine)
+        elif not self.process.is_alive():
+            return False  # window closed
+        if new_game:
+            self.game += 1
+        item = (self.game, engine.snapshot())
+        try:
+            self.snapshots.put_nowait(item)
+        except queue.Full:
+            if not force:
+                self.dropped += 1
+                return False
+            try:
+                self.snapshots.get_nowait()
+                self.dropped += 1
+            except queue.Empty:
+                pass  # the child took it meanwhile
+            try:
+                self.snapshots.put_nowait(item)
+            except queue.Full:
+                self.dropped += 1
+                return False
+        self._last_sent = now
+        self.sent += 1
+        return True
+
+    def close(self, timeout=10.0):
+        """Stop the visualizer after it drew the queued snapshots."""
+        if self.process is None:
+            return
+        try:
+            self.snapshots.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.process = None
+        self.logger.info(
+            f"Visualizer sent {self.sent} frames, dropped {self.dropped}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Watch arena games through the visualizer")
+    parser.add_argument("bots", nargs="*", default=["heuristic", "random"],
+                        help="two arena entrants, see ml.arena")
+    parser.add_argument("--games", type=int, default=1)
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--headless", action="store_true",
+                        help="render offscreen (SDL dummy video driver)")
+    parser.add_argument("--video", type=Path, default=None,
+                        help="capture to a video file or frame directory")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+    if len(args.bots) != 2:
+        parser.error("expected two bots")
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("GameEngine").setLevel(logging.WARNING)
+    from core.handle_game_logic.game_engine import GameEngine
+    from core.player import Player
+    from ml.arena import make_bot, play_game
+    from ml.environment.environment import GameEnv
+
+    engine = GameEngine(players=(Player(0, "p1"),
+                                 Player(1, "p2", is_opponent=True)),
+                        verbose=False)
+    env = GameEnv(engine=engine, render=False)
+    bots = [make_bot(spec, env, seed=args.seed) for spec in args.bots]
+    visualizer = Visualizer(fps=args.fps, headless=args.headless,
+                            video=args.video)
+    env.set_visualizer(visualizer)
+
+    for game in range(args.games):
+        seed = None if args.seed is None else args.seed + game
+        start = time.perf_counter()
+        winner, turns = play_game(env, bots, seed=seed)
+        logging.info(f"Game {game + 1}: winner {winner}, {turns} turns "
+                     f"in {time.perf_counter() - start:.2f}s")
+    visualizer.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,4 @@
+from ml.league.policy_pool import PolicyPool
+from ml.league.league import League, pfsp_weights
+
+__all__ = ['PolicyPool', 'League', 'pfsp_weights']
@@ -0,0 +1,129 @@
+"""
+League self-play: historical opponents sampled with PFSP weights and
+evaluated in a background process pool.
+"""
+import logging
+import multiprocessing
+import random
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from ml.arena import _run_match
+from ml.league.policy_pool import PolicyPool
+
+
+def pfsp_weights(win_rates: Sequence[float],
+                 weighting: str = "hard",
+                 p: float = 2.0) -> np.ndarray:
+    """
+    Prioritized fictitious self-play weights.
+
+    Args:
+        win_rates: Learner win rate against each opponent
+        weighting: "hard" favours opponents the learner loses to,
+            "variance" favours opponents close to 50%, "uniform" ignores
+            the win rates
+        p: Exponent of the "hard" weighting
+
+    Returns:
+        Normalized sampling probabilities
+    """
+    w = np.clip(np.asarray(win_rates, dtype=np.float64), 0.0, 1.0)
+    if weighting == "hard":
+        weights = (1.0 - w) ** p
+    elif weighting == "variance":
+        weights = w * (1.0 - w)
+    elif weighting == "uniform":
+        weights = np.ones_like(w)
+    else:
+        raise ValueError(f"Unknown PFSP weighting: {weighting}")
+
+    # Keep every opponent reachable, even fully beaten ones
+    weights = weights + 1e-3
+    return weights / weights.sum()
+
+
+class League:
+    """
+    Owns the policy pool, picks opponents for the learner and keeps the
+    learner's win rate against each snapshot up to date. Evaluation games
+    run in worker processes so the training loop never waits on them.
+    """
+
+    def __init__(self, config, pool: Optional[PolicyPool] = None):
+        self.cfg = config
+        self.pool = pool or PolicyPool(config.LEAGUE_PATH,
+                                       config.LEAGUE_MAX_SIZE)
+        self.rng = random.Random(config.SEED)
+        self.logger = logging.getLogger("League")
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=config.LEAGUE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"))
+        self._pending: Dict[int, object] = {}
+        self._lock = threading.Lock()
+
+    def snapshot(self, agent, frame_idx: int, agent_id: int = 0) -> Dict:
+        """
+        Add `agent` to the pool and evaluate it against the others once
+        its snapshot is written.
+        """
+        return self.pool.add(agent, frame_idx, agent_id,
+                             on_saved=lambda e: self.evaluate(e["version"]))
+
+    def sample_opponent(self) -> Optional[int]:
+        """Pick a pool version for the next episode, None if empty."""
+        versions = self.pool.versions
+        if not versions:
+            return None
+        probs = pfsp_weights(
+            [self.pool.win_rate(v) for v in versions],
+            self.cfg.LEAGUE_PFSP_WEIGHTING)
+        return self.rng.choices(versions, weights=probs)[0]
+
+    def evaluate(self, learner_version: int):
+        """Queue games of `learner_version` against every older snapshot."""
+        learner_spec = f"{self.pool.path(learner_version)}:0"
+        for version in self.pool.versions:
+            if version == learner_version:
+                continue
+            with self._lock:
+                if version in self._pending:
+                    continue
+                task = (
+                    learner_spec,
+                    f"{self.pool.path(version)}:0",
+                    self.cfg.LEAGUE_EVAL_GAMES,
+                    self.rng.randrange(2 ** 31),
+                    self.cfg.LEAGUE_EVAL_MAX_TURNS,
+                )
+                future = self._executor.submit(_run_match, task)
+                self._pending[version] = future
+            future.add_done_callback(
+                lambda f, v=version: self._on_result(v, f))
+
+    def _on_result(self, version: int, future):
+        with self._lock:
+            self._pending.pop(version, None)
+
+        if future.cancelled():
+            return
+        try:
+            results: List = future.result()
+        except Exception as e:
+            self.logger.warning(f"Evaluation against v{version} failed: {e}")
+            return
+
+        score = sum(0.5 if winner is None else float(winner == 0)
+                    for winner, _ in results)
+        self.pool.record_result(version, score, len(results))
+        self.logger.info(
+            f"Learner vs v{version}: {score}/{len(results)}")
+
+    def close(self, wait: bool = False):
+        # A pending snapshot still queues its evaluation games
+        self.pool.close()
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
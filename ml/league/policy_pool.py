@@ -0,0 +1,197 @@
+"""
+Versioned pool of frozen policy snapshots for league self-play.
+"""
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import torch
+
+
+def _compact_state_dict(module) -> Dict[str, torch.Tensor]:
+    """CPU copy of a state dict with float tensors stored as fp16."""
+    return {
+        key: value.detach().to("cpu", copy=True).half()
+        if value.is_floating_point() else value.detach().to("cpu", copy=True)
+        for key, value in module.state_dict().items()
+    }
+
+
+class PolicyPool:
+    """
+    Snapshots live in `root` as policy_vXXXXX.pth, one file per version,
+    using the same key layout as `save_model` (agent_0_model, agent_0_policy)
+    so they can be loaded by `AIOpponent` and the arena. `index.json` keeps
+    the metadata and the learner's latest score against each snapshot.
+
+    Like `CheckpointManager`, `add` copies the weights on the calling
+    thread and writes them from a background thread; a version only joins
+    the pool once its file is on disk.
+    """
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, root, max_size: int = 50):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.logger = logging.getLogger("PolicyPool")
+        self._lock = threading.Lock()
+        self.entries: List[Dict] = self._load_index()
+        self._next_version = self.entries[-1]["version"] + 1 \
+            if self.entries else 1
+
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+
+    def __len__(self):
+        return len(self.entries)
+
+    @property
+    def versions(self) -> List[int]:
+        with self._lock:
+            return [entry["version"] for entry in self.entries]
+
+    @property
+    def latest(self) -> Optional[Dict]:
+        return self.entries[-1] if self.entries else None
+
+    def path(self, version: int) -> Path:
+        return self.root / f"policy_v{version:05d}.pth"
+
+    def get(self, version: int) -> Optional[Dict]:
+        for entry in self.entries:
+            if entry["version"] == version:
+                return entry
+        return None
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    def add(self, agent, frame_idx: int, agent_id: int = 0,
+            on_saved: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """
+        Snapshot `agent` as a new version and write it in the background.
+
+        Args:
+            on_saved: Called with the entry from the writer thread once
+                the snapshot is in the pool and the oldest ones are evicted
+        """
+        # At most one write in flight, bounds memory to one extra copy
+        self.wait()
+
+        checkpoint = {
+            "agent_0_model": _compact_state_dict(agent.dqn),
+            "agent_0_policy": _compact_state_dict(agent.policy),
+            "frame": frame_idx,
+        }
+        if agent.use_pdqn:
+            checkpoint["agent_0_pdqn"] = _compact_state_dict(agent.pdqn)
+
+        entry = {
+            "version": self._next_version,
+            "frame": frame_idx,
+            "source_agent": agent_id,
+            "games": 0,
+            "learner_score": 0.0,
+        }
+        self._next_version += 1
+
+        self._thread = threading.Thread(
+            target=self._write,
+            args=(checkpoint, entry, on_saved),
+            name="PolicyPoolWriter",
+            daemon=True
+        )
+        self._thread.start()
+        return entry
+
+    def wait(self):
+        """Block until the pending snapshot (if any) is on disk."""
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._error is not None:
+            error, self._error = self._error, None
+            self.logger.error(f"Previous snapshot write failed: {error}")
+
+    def close(self):
+        self.wait()
+
+    def _write(self, checkpoint, entry, on_saved):
+        try:
+            path = self.path(entry["version"])
+            tmp_path = path.with_suffix(".tmp")
+            with open(tmp_path, "wb") as f:
+                torch.save(checkpoint, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+
+            with self._lock:
+                self.entries.append(entry)
+                while len(self.entries) > self.max_size:
+                    old = self.entries.pop(0)
+                    self.path(old["version"]).unlink(missing_ok=True)
+                self._save_index()
+
+            self.logger.info(f"Snapshot v{entry['version']} saved to {path}")
+            if on_saved is not None:
+                on_saved(entry)
+        except BaseException as e:
+            self._error = e
+
+    def load_into(self, version: int, agent):
+        """Load snapshot `version` into an `Agent` (weights cast back)."""
+        checkpoint = torch.load(self.path(version),
+                                map_location=agent.cfg.DEVICE)
+        agent.dqn.load_state_dict(checkpoint["agent_0_model"])
+        agent.policy.load_state_dict(checkpoint["agent_0_policy"])
+        if agent.use_pdqn and "agent_0_pdqn" in checkpoint:
+            agent.pdqn.load_state_dict(checkpoint["agent_0_pdqn"])
+        agent.dqn.eval()
+        agent.policy.eval()
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def record_result(self, version: int, score: float, games: int):
+        """Store the learner's latest score (wins + draws / 2) vs `version`."""
+        with self._lock:
+            entry = self.get(version)
+            if entry is None:
+                return
+            entry["games"] = games
+            entry["learner_score"] = score
+            self._save_index()
+
+    def win_rate(self, version: int, prior: float = 0.5) -> float:
+        """Learner win rate against `version`, `prior` if never evaluated."""
+        entry = self.get(version)
+        if entry is None or entry["games"] == 0:
+            return prior
+        return entry["learner_score"] / entry["games"]
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def _load_index(self) -> List[Dict]:
+        index_path = self.root / self.INDEX_FILE
+        if not index_path.exists():
+            return []
+        with open(index_path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+        return [e for e in entries if self.path(e["version"]).exists()]
+
+    def _save_index(self):
+        index_path = self.root / self.INDEX_FILE
+        tmp_path = index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=2)
+        os.replace(tmp_path, index_path)
@@ -0,0 +1,109 @@
+"""
+Lightweight per-phase timing for the training loop.
+
+Usage:
+    from ml.profiler import profiler
+
+    with profiler.span("legal_actions"):
+        ...
+
+Spans accumulate raw `perf_counter_ns` durations; `format_table` and
+`metrics` summarise the mean and p99 of every phase and `reset` clears the
+accumulators. The shared instance is disabled until a caller (the Trainer,
+from `cfg.PROFILE`) turns it on, so other processes collect nothing.
+"""
+from collections import defaultdict
+from time import perf_counter_ns
+from typing import Dict, List
+
+import numpy as np
+
+
+class _Span:
+    __slots__ = ("samples", "start")
+
+    def __init__(self, samples: List[int]):
+        self.samples = samples
+        self.start = 0
+
+    def __enter__(self):
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        self.samples.append(perf_counter_ns() - self.start)
+        return False
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class PhaseProfiler:
+    """Named timing spans backed by plain lists of nanosecond samples."""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.samples: Dict[str, List[int]] = defaultdict(list)
+
+    def span(self, name: str):
+        """Context manager timing one occurrence of phase `name`.
+
+        Each call gets its own span, so nested or concurrent spans with the
+        same name do not overwrite each other's start time.
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self.samples[name])
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Mean, p99 and total time in milliseconds for each phase."""
+        result = {}
+        for name, samples in self.samples.items():
+            if not samples:
+                continue
+            values = np.asarray(samples, dtype=np.float64) / 1e6
+            result[name] = {
+                "count": len(values),
+                "mean_ms": float(values.mean()),
+                "p99_ms": float(np.percentile(values, 99)),
+                "total_ms": float(values.sum()),
+            }
+        return result
+
+    def reset(self):
+        for samples in self.samples.values():
+            samples.clear()
+
+    def metrics(self) -> Dict[str, float]:
+        """Flat metric dict, e.g. {"Profile/reward/mean_ms": 0.01}."""
+        metrics = {}
+        for name, stats in self.summary().items():
+            metrics[f"Profile/{name}/mean_ms"] = stats["mean_ms"]
+            metrics[f"Profile/{name}/p99_ms"] = stats["p99_ms"]
+        return metrics
+
+    def format_table(self) -> str:
+        summary = self.summary()
+        if not summary:
+            return "no profiling samples"
+        lines = [f"{'phase':<18}{'count':>8}{'mean ms':>10}"
+                 f"{'p99 ms':>10}{'total ms':>11}"]
+        for name, s in sorted(summary.items(),
+                              key=lambda kv: -kv[1]["total_ms"]):
+            lines.append(f"{name:<18}{s['count']:>8}{s['mean_ms']:>10.3f}"
+                         f"{s['p99_ms']:>10.3f}{s['total_ms']:>11.1f}")
+        return "\n".join(lines)
+
+
+# Shared instance used by the environment, agents and training loop
+profiler = PhaseProfiler()
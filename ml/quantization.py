@@ -0,0 +1,277 @@
+"""Post-training quantization and pruning for the MLP based models.
+
+Usage:
+  python -m ml.quantization --checkpoint ml/saves/checkpoint.pth
+  python -m ml.quantization --checkpoint ml/saves/checkpoint.pth --prune 0.3
+"""
+import argparse
+import copy
+import logging
+import time
+from pathlib import Path
+
+import numpy as np
+import torch
+import torch.nn as nn
+import torch.nn.utils.prune as prune
+
+from ml.config import Config
+from ml.models import DuelingDQN, AveragePolicy
+
+
+BATCH_SIZES = (1, 32, 1024)
+
+
+def prune_model(model, amount=0.3):
+    """
+    Apply L1 unstructured pruning to every Linear layer in place.
+
+    The pruning mask is folded into the weights so the module can be
+    saved and quantized like a regular model.
+
+    Args:
+        model: nn.Module to prune
+        amount: Fraction of weights to zero in each layer
+
+    Returns:
+        The pruned model
+    """
+    for module in model.modules():
+        if isinstance(module, nn.Linear):
+            prune.l1_unstructured(module, name="weight", amount=amount)
+            prune.remove(module, "weight")
+    return model
+
+
+def quantize_model(model, dtype=torch.qint8):
+    """
+    Return a dynamically quantized CPU copy of `model`.
+
+    Linear layers get int8 weights, LayerNorm and activations stay float.
+
+    Args:
+        model: Float model (left untouched)
+        dtype: Quantized weight dtype
+
+    Returns:
+        Quantized model in eval mode
+    """
+    model = copy.deepcopy(model).to("cpu").eval()
+    quantized = torch.ao.quantization.quantize_dynamic(
+        model, {nn.Linear}, dtype=dtype)
+    quantized.device = torch.device("cpu")
+    return quantized
+
+
+def save_quantized_model(logging, models, policies, checkpoint_path,
+                         prune_amount=0.0):
+    """
+    Save quantized models using the same key layout as `save_model`.
+
+    Args:
+        logging: Logger instance
+        models: Dict with keys like 'agent_0', 'agent_1', etc.
+        policies: Dict with keys like 'agent_0', 'agent_1', etc.
+        checkpoint_path: Path to the quantized checkpoint file
+        prune_amount: Pruning amount recorded in the checkpoint
+    """
+    checkpoint_path = Path(checkpoint_path)
+    checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+
+    checkpoint = {"quantized": True, "prune_amount": prune_amount}
+    for key, model in models.items():
+        checkpoint[f"{key}_model"] = model.state_dict()
+    for key, policy in policies.items():
+        if policy is not None:
+            checkpoint[f"{key}_policy"] = policy.state_dict()
+
+    torch.save(checkpoint, checkpoint_path)
+    logging.info(f"Quantized models saved to {checkpoint_path}")
+
+
+def load_quantized_agent(logging, agent_id, state_dim, num_actions,
+                         checkpoint_path):
+    """
+    Rebuild the quantized DQN and policy of one agent.
+
+    Args:
+        logging: Logger instance
+        agent_id: Which agent to load (0, 1, etc.)
+        state_dim: Environment state dimension
+        num_actions: Number of discrete actions
+        checkpoint_path: Path to a checkpoint written by `save_quantized_model`
+
+    Returns:
+        Tuple (dqn, policy), policy is None if missing from the checkpoint
+    """
+    checkpoint_path = Path(checkpoint_path)
+    if not checkpoint_path.exists():
+        raise FileNotFoundError(
+            f"Quantized checkpoint not found: {checkpoint_path}")
+
+    checkpoint = torch.load(
+        checkpoint_path, map_location="cpu", weights_only=False)
+    if not checkpoint.get("quantized", False):
+        raise ValueError(f"{checkpoint_path} is not a quantized checkpoint")
+
+    model_key = f"agent_{agent_id}_model"
+    if model_key not in checkpoint:
+        raise ValueError(f"Model key '{model_key}' not found in checkpoint")
+
+    dqn = quantize_model(DuelingDQN(state_dim, num_actions))
+    dqn.load_state_dict(checkpoint[model_key])
+    logging.info(f"Loaded quantized {model_key} from {checkpoint_path}")
+
+    policy = None
+    policy_key = f"agent_{agent_id}_policy"
+    if policy_key in checkpoint:
+        policy = quantize_model(AveragePolicy(state_dim, num_actions))
+        policy.load_state_dict(checkpoint[policy_key])
+        logging.info(f"Loaded quantized {policy_key} from {checkpoint_path}")
+
+    return dqn, policy
+
+
+def collect_states(env, num_states=2048):
+    """
+    Play random moves in `env` and return the visited states.
+
+    Each visited position gives one state per player, with that player's
+    legal action mask.
+
+    Returns:
+        Tuple (states (N, state_dim), masks (N, num_actions))
+    """
+    states, masks = [], []
+
+    def visit(player_states):
+        for player_idx, state in enumerate(player_states):
+            states.append(state)
+            masks.append(env.get_legal_actions(player_idx)[0])
+
+    visit(env.reset())
+    while len(states) < num_states:
+        player_states, _, done, _ = env.step(None)
+        visit(env.reset() if done else player_states)
+    return (torch.as_tensor(np.stack(states[:num_states]),
+                            dtype=torch.float32),
+            torch.as_tensor(np.stack(masks[:num_states])))
+
+
+def measure_latency(model, states, batch_size, iters=50):
+    """Mean wall time in ms of one forward pass at `batch_size`."""
+    idx = torch.randint(0, states.size(0), (batch_size,))
+    batch = states[idx]
+    with torch.no_grad():
+        model(batch)  # warmup
+        start = time.perf_counter()
+        for _ in range(iters):
+            model(batch)
+        duration = time.perf_counter() - start
+    return duration / iters * 1000.0
+
+
+def greedy_actions(model, states, masks=None):
+    """Highest scoring action per state (N,), among legal ones with masks."""
+    with torch.no_grad():
+        scores = model(states)
+    if masks is not None:
+        scores = scores.masked_fill(~masks, float("-inf"))
+    return scores.argmax(dim=-1)
+
+
+def benchmark(float_model, quant_model, states, masks=None,
+              batch_sizes=BATCH_SIZES, iters=50):
+    """
+    Compare a float model and its quantized copy on CPU.
+
+    Args:
+        float_model: Reference model
+        quant_model: Quantized model
+        states: Tensor of states (N, state_dim)
+        masks: Legal action masks (N, num_actions), agreement is measured
+            over legal actions only when given
+        batch_sizes: Batch sizes to time
+        iters: Forward passes per timing
+
+    Returns:
+        Dict with greedy-action agreement and per-batch latency in ms
+    """
+    float_model = float_model.to("cpu").eval()
+    float_actions = greedy_actions(float_model, states, masks)
+    quant_actions = greedy_actions(quant_model, states, masks)
+
+    results = {
+        "agreement": (float_actions == quant_actions).float().mean().item(),
+        "latency": {},
+    }
+    for bs in batch_sizes:
+        float_ms = measure_latency(float_model, states, bs, iters)
+        quant_ms = measure_latency(quant_model, states, bs, iters)
+        results["latency"][bs] = {
+            "float_ms": float_ms,
+            "quant_ms": quant_ms,
+            "speedup": float_ms / quant_ms if quant_ms > 0 else 0.0,
+        }
+    return results
+
+
+def format_report(name, results):
+    lines = [f"{name}: greedy agreement {results['agreement']:.2%}"]
+    for bs, r in results["latency"].items():
+        lines.append(f"  batch {bs:>5}: float {r['float_ms']:.3f} ms | "
+                     f"int8 {r['quant_ms']:.3f} ms | x{r['speedup']:.2f}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    from core.handle_game_logic.game_engine import GameEngine
+    from ml.environment.environment import GameEnv
+    from ml.main import new_players
+    from ml.utils import load_single_agent
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--checkpoint", type=Path,
+                        default=Config.CHECKPOINT_PATH)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--prune", type=float, default=0.0)
+    parser.add_argument("--num-agents", type=int, default=2)
+    parser.add_argument("--states", type=int, default=2048)
+    parser.add_argument("--iters", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    logger = logging.getLogger("Quantization")
+    output = args.output or args.checkpoint.with_name(
+        f"{args.checkpoint.stem}_int8{args.checkpoint.suffix}")
+
+    engine = GameEngine(players=new_players(), verbose=False)
+    env = GameEnv(engine=engine, render=False)
+    states, masks = collect_states(env, args.states)
+
+    models, policies = {}, {}
+    for i in range(args.num_agents):
+        dqn = DuelingDQN(env.state_dim, env.num_actions)
+        policy = AveragePolicy(env.state_dim, env.num_actions)
+        if not load_single_agent(logger, i, dqn, policy, "cpu",
+                                 args.checkpoint):
+            return 1
+
+        for name, model in (("dqn", dqn), ("policy", policy)):
+            target = prune_model(copy.deepcopy(model), args.prune) \
+                if args.prune > 0 else model
+            quantized = quantize_model(target)
+            results = benchmark(model, quantized, states, masks,
+                                iters=args.iters)
+            logger.info(format_report(f"agent_{i} {name}", results))
+            if name == "dqn":
+                models[f"agent_{i}"] = quantized
+            else:
+                policies[f"agent_{i}"] = quantized
+
+    save_quantized_model(logger, models, policies, output, args.prune)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
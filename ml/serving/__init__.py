@@ -0,0 +1,13 @@
+from ml.serving.histogram import Histogram
+from ml.serving.inference_service import (
+    InferenceService,
+    InferenceClient,
+    ServedAIOpponent,
+)
+
+__all__ = [
+    'Histogram',
+    'InferenceService',
+    'InferenceClient',
+    'ServedAIOpponent',
+]
@@ -0,0 +1,318 @@
+"""
+Batched inference service for hosting many AI opponents in one process.
+
+Matches submit (state, mask) requests. Requests arriving within
+`max_delay_ms` of each other are stacked and answered with a single
+forward pass of the DQN (and PDQN actor for continuous params).
+"""
+import asyncio
+import logging
+import random
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import torch
+
+from ml.serving.histogram import Histogram
+from ml.trainer.action_mapper import ActionMapper
+
+
+LATENCY_BOUNDS_MS = (0.25, 0.5, 1, 2, 4, 8, 16, 32, 64, 128, 256)
+BATCH_SIZE_BOUNDS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+
+
+class InferenceService:
+    """
+    Micro-batching inference service around a trained `Agent`.
+
+    Usable in-process (`infer` from coroutines, `submit` from threads)
+    or over a Unix socket (`serve_unix` + `InferenceClient`).
+    """
+
+    def __init__(
+        self,
+        agent,
+        state_dim: int,
+        num_actions: int,
+        param_dim: int,
+        max_batch_size: int = 256,
+        max_delay_ms: float = 2.0
+    ):
+        self.agent = agent
+        self.device = agent.cfg.DEVICE
+        self.state_dim = state_dim
+        self.num_actions = num_actions
+        self.param_dim = param_dim if agent.use_pdqn else 0
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay_ms / 1000.0
+
+        self.latency_ms = Histogram(LATENCY_BOUNDS_MS)
+        self.batch_size = Histogram(BATCH_SIZE_BOUNDS)
+        self.logger = logging.getLogger("InferenceService")
+
+        self.agent.dqn.eval()
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._server = None
+
+    @classmethod
+    def from_checkpoint(cls, env, config, checkpoint_path, agent_id=0,
+                        **kwargs):
+        """Load one agent from a training checkpoint and serve it."""
+        from ml.ai_opponent import AIOpponent
+
+        opponent = AIOpponent(env, config, Path(checkpoint_path),
+                              agent_id=agent_id, device=config.DEVICE)
+        return cls(opponent.agent, env.state_dim, env.num_actions,
+                   env.param_dim, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._batch_loop())
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def start_background(self) -> threading.Thread:
+        """Run the service on its own event loop in a daemon thread."""
+        ready = threading.Event()
+
+        def run():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+            loop.run_until_complete(self.start())
+            ready.set()
+            loop.run_forever()
+
+        thread = threading.Thread(target=run, daemon=True,
+                                  name="InferenceService")
+        thread.start()
+        ready.wait()
+        return thread
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    async def infer(self, state, mask) -> Tuple[int, Optional[np.ndarray]]:
+        """Queue one request and wait for its (action, cont_params)."""
+        future = self._loop.create_future()
+        await self._queue.put((
+            np.asarray(state, dtype=np.float32),
+            np.asarray(mask, dtype=bool),
+            time.perf_counter(),
+            future,
+        ))
+        return await future
+
+    def submit(self, state, mask, timeout: Optional[float] = None):
+        """Thread-safe blocking version of `infer`."""
+        future = asyncio.run_coroutine_threadsafe(
+            self.infer(state, mask), self._loop)
+        return future.result(timeout)
+
+    async def _batch_loop(self):
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + self.max_delay
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(
+                        await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._run_batch(batch)
+
+    async def _run_batch(self, batch):
+        states = np.stack([req[0] for req in batch])
+        masks = np.stack([req[1] for req in batch])
+
+        try:
+            actions, params = await asyncio.to_thread(
+                self._forward, states, masks)
+        except Exception as e:
+            self.logger.exception(f"Batch inference failed: {e}")
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        now = time.perf_counter()
+        for i, (_, _, start, future) in enumerate(batch):
+            if future.done():
+                continue
+            future.set_result((
+                int(actions[i]),
+                params[i] if params is not None else None
+            ))
+            self.latency_ms.observe((now - start) * 1000.0)
+        self.batch_size.observe(len(batch))
+
+    def _forward(self, states: np.ndarray, masks: np.ndarray):
+        """Masked greedy actions and sampled params for a whole batch."""
+        with torch.no_grad():
+            state_tensor = torch.from_numpy(states).to(self.device)
+            mask_tensor = torch.from_numpy(masks).to(self.device)
+
+            q_values = self.agent.dqn(state_tensor)
+            masked_q = q_values.masked_fill(~mask_tensor, float('-inf'))
+            actions = masked_q.argmax(dim=1)
+            # No valid actions: same fallback as select_action_with_mask
+            actions[~mask_tensor.any(dim=1)] = 0
+
+            params = None
+            if self.agent.use_pdqn:
+                params, _, _ = self.agent.pdqn.actor.sample(state_tensor)
+                params = params.cpu().numpy()
+
+        return actions.cpu().numpy(), params
+
+    def stats(self) -> Dict[str, Dict]:
+        return {
+            "latency_ms": self.latency_ms.summary(),
+            "batch_size": self.batch_size.summary(),
+        }
+
+    # ------------------------------------------------------------------
+    # Unix socket transport
+    # ------------------------------------------------------------------
+
+    @property
+    def request_size(self) -> int:
+        return self.state_dim * 4 + self.num_actions
+
+    async def serve_unix(self, path):
+        """Accept fixed-size binary requests on a Unix socket."""
+        path = Path(path)
+        if path.exists():
+            path.unlink()
+        self._server = await asyncio.start_unix_server(
+            self._handle_client, path=str(path))
+        self.logger.info(f"Inference service listening on {path}")
+
+    async def _handle_client(self, reader, writer):
+        state_bytes = self.state_dim * 4
+        try:
+            while True:
+                payload = await reader.readexactly(self.request_size)
+                state = np.frombuffer(payload[:state_bytes], dtype=np.float32)
+                mask = np.frombuffer(payload[state_bytes:], dtype=np.uint8)
+
+                action, params = await self.infer(state, mask.astype(bool))
+                writer.write(encode_response(action, params, self.param_dim))
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            pass
+        finally:
+            writer.close()
+
+
+def encode_response(action, params, param_dim):
+    if params is None:
+        params = np.zeros(param_dim, dtype=np.float32)
+    return struct.pack("<i", action) + \
+        np.asarray(params, dtype=np.float32).tobytes()
+
+
+class InferenceClient:
+    """Async client for `InferenceService.serve_unix`."""
+
+    def __init__(self, path, state_dim: int, num_actions: int,
+                 param_dim: int):
+        self.path = Path(path)
+        self.state_dim = state_dim
+        self.num_actions = num_actions
+        self.param_dim = param_dim
+        self._reader = None
+        self._writer = None
+
+    async def connect(self):
+        self._reader, self._writer = await asyncio.open_unix_connection(
+            str(self.path))
+
+    async def infer(self, state, mask) -> Tuple[int, Optional[np.ndarray]]:
+        self._writer.write(
+            np.asarray(state, dtype=np.float32).tobytes() +
+            np.asarray(mask, dtype=np.uint8).tobytes())
+        await self._writer.drain()
+
+        payload = await self._reader.readexactly(4 + self.param_dim * 4)
+        action = struct.unpack("<i", payload[:4])[0]
+        if self.param_dim == 0:
+            return action, None
+        return action, np.frombuffer(payload[4:], dtype=np.float32)
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._writer = None
+
+
+class ServedAIOpponent:
+    """
+    Drop-in replacement for `AIOpponent` backed by a shared service.
+
+    `get_action` blocks the calling thread (e.g. the match AI thread)
+    until the batched result comes back. The service is always greedy;
+    non-deterministic calls explore with the same epsilon as `AIOpponent`.
+    """
+
+    def __init__(self, env, service: InferenceService):
+        self.env = env
+        self.service = service
+        self.action_mapper = ActionMapper(env)
+        self.logger = logging.getLogger("AIOpponent")
+
+    def get_action(
+        self,
+        player,
+        player_idx: int,
+        deterministic: bool = True
+    ) -> Tuple[int, Optional[Dict]]:
+        state = self.env._get_state(player)
+        mask, legal_params = self.env.get_legal_actions(player_idx)
+
+        discrete_action, cont_params = self.service.submit(state, mask)
+
+        epsilon = 0.0 if deterministic else 0.1
+        if np.any(mask) and random.random() < epsilon:
+            discrete_action = random.choice(np.flatnonzero(mask).tolist())
+
+        action_idx, param_dict = self.action_mapper.map(
+            player_idx,
+            discrete_action,
+            cont_params,
+            legal_params
+        )
+
+        self.logger.info(
+            f"AI selected: {self.env.ACTIONS[action_idx]} "
+            f"with params {param_dict}")
+
+        return int(action_idx), param_dict
@@ -1,4 +1,12 @@
 from ml.storage.replay_buffer import ReplayBuffer
 from ml.storage.reservoir_buffer import ReservoirBuffer
+from ml.storage.episode_recorder import EpisodeRecorder, EpisodeReader
+from ml.storage.offline_dataset import TransitionDataset
 
-__all__ = ['ReplayBuffer', 'ReservoirBuffer']
+__all__ = [
+    'ReplayBuffer',
+    'ReservoirBuffer',
+    'EpisodeRecorder',
+    'EpisodeReader',
+    'TransitionDataset',
+]
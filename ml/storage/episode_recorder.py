@@ -0,0 +1,316 @@
+"""
+Columnar episode recording for offline analysis and training.
+
+Every action applied by `GameEnv` becomes one row: the acting player's
+state and legal-action mask before the action, the chosen action and its
+params, whether the agent chose it (False for the random filler actions
+of `GameEnv.step_single`), the reward total and its components, and the
+done flag. When a game ends, the terminal reward (victory/defeat) is
+added to each player's last row, which is marked done. Rows are buffered
+and written as one Arrow record batch (row group) once `row_group_size`
+rows of finished episodes are buffered, so a row group never splits an
+episode.
+
+pyarrow is optional. Without it the recorder falls back to a directory
+of chunk_XXXXX/ folders holding one .npy file per column, which the
+reader memory-maps the same way.
+"""
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as ipc
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    ipc = None
+
+
+# Known RewardBreakdown component names, anything else goes to "other"
+REWARD_COMPONENTS = (
+    "valid_action",
+    "invalid_action",
+    "deploy_monster",
+    "high_level_summon",
+    "strength_bonus",
+    "deploy_trap",
+    "trap_trigger",
+    "trap_destroyed_bonus",
+    "use_spell",
+    "spell_combo",
+    "attack_destroy",
+    "destroy_strength_bonus",
+    "direct_attack_bonus",
+    "damage_dealt",
+    "damage_taken",
+    "survive_attack",
+    "monster_destroyed",
+    "merge_combine",
+    "merge_strength_bonus",
+    "strategic_toggle",
+    "suboptimal_toggle",
+    "field_advantage",
+    "board_control",
+    "lp_ratio_bonus",
+    "active_play_bonus",
+    "premature_end_penalty",
+    "skip_turn_penalty",
+    "skip_empty_field_penalty",
+    "victory",
+    "defeat",
+    "_clamped_excess",
+    "_clamped_deficit",
+    "other",
+)
+_COMPONENT_INDEX = {name: i for i, name in enumerate(REWARD_COMPONENTS)}
+
+SCALAR_COLUMNS = {
+    "episode": np.int64,
+    "step": np.int32,
+    "player": np.int8,
+    "turn": np.int32,
+    "action": np.int8,
+    "reward": np.float32,
+    "done": np.bool_,
+    "chosen": np.bool_,
+}
+
+
+def has_arrow() -> bool:
+    return pa is not None
+
+
+class EpisodeRecorder:
+    """
+    Streams per-action records to disk in row groups.
+
+    Args:
+        directory: Where recordings are written
+        state_dim: Length of the state vector
+        num_actions: Length of the action mask
+        row_group_size: Rows buffered before a record batch is written
+        use_arrow: Force (True) or disable (False) Arrow output,
+            None picks Arrow when pyarrow is installed
+    """
+
+    def __init__(self, directory, state_dim: int, num_actions: int,
+                 row_group_size: int = 4096,
+                 use_arrow: Optional[bool] = None):
+        self.state_dim = state_dim
+        self.num_actions = num_actions
+        self.row_group_size = row_group_size
+        self.use_arrow = has_arrow() if use_arrow is None else use_arrow
+        if self.use_arrow and not has_arrow():
+            raise ImportError("pyarrow is required for Arrow recordings")
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.now().strftime("%Y%m%d_%H-%M-%S")
+        if self.use_arrow:
+            self.path = directory / f"episodes_{timestamp}.arrow"
+        else:
+            self.path = directory / f"episodes_{timestamp}"
+            self.path.mkdir(parents=True, exist_ok=True)
+
+        self.logger = logging.getLogger("EpisodeRecorder")
+        self.episode = -1
+        self.step = 0
+        self.rows = 0
+        self._chunks = 0
+        self._writer = None
+        self._sink = None
+        self._reset_buffer()
+
+    def _reset_buffer(self):
+        self._buffer: Dict[str, List] = {
+            name: [] for name in (*SCALAR_COLUMNS, "state", "mask",
+                                  "params", "reward_components")
+        }
+
+    def __len__(self):
+        return self.rows + len(self._buffer["episode"])
+
+    def start_episode(self):
+        """Begin an episode, first writing any full row group."""
+        if len(self._buffer["episode"]) >= self.row_group_size:
+            self.flush()
+        self.episode += 1
+        self.step = 0
+
+    @staticmethod
+    def _components(breakdown) -> np.ndarray:
+        components = np.zeros(len(REWARD_COMPONENTS), dtype=np.float32)
+        for name, value in breakdown.components.items():
+            components[_COMPONENT_INDEX.get(name, -1)] += value
+        return components
+
+    def record(self, player_idx: int, turn: int, state, mask,
+               action_idx: int, params, breakdown, done: bool,
+               chosen: bool = True):
+        """Buffer one action."""
+        if self.episode < 0:
+            self.start_episode()
+
+        buf = self._buffer
+        buf["episode"].append(self.episode)
+        buf["step"].append(self.step)
+        buf["player"].append(player_idx)
+        buf["turn"].append(turn)
+        buf["action"].append(action_idx)
+        buf["reward"].append(breakdown.total)
+        buf["done"].append(done)
+        buf["chosen"].append(chosen)
+        buf["state"].append(np.asarray(state, dtype=np.float32))
+        buf["mask"].append(np.asarray(mask, dtype=np.bool_))
+        buf["params"].append(json.dumps(params, default=str))
+        buf["reward_components"].append(self._components(breakdown))
+        self.step += 1
+
+    def record_terminal(self, player_idx: int, breakdown) -> bool:
+        """
+        Add a terminal reward breakdown to the player's last row of the
+        current episode and mark that row done.
+
+        Returns:
+            False if the player has no row in this episode
+        """
+        buf = self._buffer
+        for row in range(len(buf["episode"]) - 1, -1, -1):
+            if buf["episode"][row] != self.episode:
+                break
+            if buf["player"][row] == player_idx:
+                buf["reward"][row] += breakdown.total
+                buf["reward_components"][row] += self._components(breakdown)
+                buf["done"][row] = True
+                return True
+        return False
+
+    def _columns(self) -> Dict[str, np.ndarray]:
+        buf = self._buffer
+        columns = {name: np.asarray(buf[name], dtype=dtype)
+                   for name, dtype in SCALAR_COLUMNS.items()}
+        columns["state"] = np.stack(buf["state"])
+        columns["mask"] = np.stack(buf["mask"])
+        columns["reward_components"] = np.stack(buf["reward_components"])
+        columns["params"] = np.asarray(buf["params"], dtype=np.str_)
+        return columns
+
+    def flush(self):
+        """Write buffered rows as one row group."""
+        n = len(self._buffer["episode"])
+        if n == 0:
+            return
+        columns = self._columns()
+        if self.use_arrow:
+            self._write_arrow(columns)
+        else:
+            self._write_npy(columns)
+        self.rows += n
+        self._chunks += 1
+        self._reset_buffer()
+
+    def _write_arrow(self, columns):
+        arrays = {}
+        for name, values in columns.items():
+            if values.ndim == 2:
+                arrays[name] = pa.FixedSizeListArray.from_arrays(
+                    pa.array(values.reshape(-1)), values.shape[1])
+            else:
+                arrays[name] = pa.array(values)
+        batch = pa.record_batch(arrays)
+        if self._writer is None:
+            self._sink = pa.OSFile(str(self.path), "wb")
+            self._writer = ipc.new_file(self._sink, batch.schema)
+        self._writer.write_batch(batch)
+
+    def _write_npy(self, columns):
+        chunk_dir = self.path / f"chunk_{self._chunks:05d}"
+        chunk_dir.mkdir(parents=True, exist_ok=True)
+        for name, values in columns.items():
+            np.save(chunk_dir / f"{name}.npy", values, allow_pickle=False)
+
+    def close(self):
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._sink.close()
+            self._writer = None
+        self.logger.info(f"Recorded {self.rows} actions to {self.path}")
+
+
+class EpisodeReader:
+    """
+    Memory-mapped reader for files written by `EpisodeRecorder`.
+
+    `batches()` yields one dict of NumPy arrays per row group; fixed
+    width columns (state, mask, reward_components) come back as 2D
+    arrays backed by the mapped file where possible.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        if not self.path.exists():
+            raise FileNotFoundError(f"Recording not found: {self.path}")
+        self.is_arrow = self.path.is_file()
+        if self.is_arrow and not has_arrow():
+            raise ImportError("pyarrow is required to read Arrow recordings")
+
+        if self.is_arrow:
+            self._source = pa.memory_map(str(self.path), "r")
+            self._reader = ipc.open_file(self._source)
+            self.num_batches = self._reader.num_record_batches
+        else:
+            self._chunks = sorted(self.path.glob("chunk_*"))
+            self.num_batches = len(self._chunks)
+
+    def __len__(self):
+        return sum(len(batch["episode"]) for batch in self.batches())
+
+    def read_batch(self, idx: int) -> Dict[str, np.ndarray]:
+        if self.is_arrow:
+            batch = self._reader.get_batch(idx)
+            columns = {}
+            for name, column in zip(batch.schema.names, batch.columns):
+                if isinstance(column.type, pa.FixedSizeListType):
+                    width = column.type.list_size
+                    values = column.flatten().to_numpy(
+                        zero_copy_only=False)
+                    columns[name] = values.reshape(-1, width)
+                elif pa.types.is_string(column.type):
+                    columns[name] = np.asarray(column.to_pylist())
+                else:
+                    columns[name] = column.to_numpy(zero_copy_only=False)
+            return columns
+
+        chunk = self._chunks[idx]
+        return {
+            f.stem: np.load(f, mmap_mode="r", allow_pickle=False)
+            for f in chunk.glob("*.npy")
+        }
+
+    def batches(self) -> Iterator[Dict[str, np.ndarray]]:
+        for idx in range(self.num_batches):
+            yield self.read_batch(idx)
+
+    def read_all(self) -> Dict[str, np.ndarray]:
+        batches = list(self.batches())
+        if not batches:
+            return {}
+        return {name: np.concatenate([b[name] for b in batches])
+                for name in batches[0]}
+
+    def close(self):
+        if self.is_arrow:
+            self._source.close()
+
+
+def find_recordings(directory) -> List[Path]:
+    """All recordings (Arrow files or npy directories) under `directory`."""
+    directory = Path(directory)
+    return sorted(p for p in directory.glob("episodes_*")
+                  if p.suffix == ".arrow" or p.is_dir())
@@ -0,0 +1,362 @@
+"""
+Compact binary game replays with deterministic re-simulation.
+
+A replay stores the episode seed plus the stream of resolved actions;
+everything else (draws, random slots) is reproduced by the seeded engine
+RNG. Layout, little endian:
+
+  header: magic "AFRP", version u8, seed u64, start turn u32,
+          start player u8
+  record: turn offset u16, player << 4 | action u8, param0 i8, param1 i8
+
+Params are stored positionally: hand/field indices as they are, and
+combine pairs (card uuids, which are not reproducible) as positions in
+the player's field list. `PARAM_NONE` marks a missing param.
+
+`ReplaySimulator` rebuilds the `GameState` at any turn by replaying
+through `GameEngine` with rendering off. `build_index` stores an engine
+snapshot every K turns next to the replay, so seeking only replays the
+turns since the nearest snapshot.
+
+Usage:
+  python -m ml.storage.game_replay ml/saves/replays/game_000001.afr --index 20
+  python -m ml.storage.game_replay ml/saves/replays/game_000001.afr --turn 200
+"""
+import argparse
+import logging
+import pickle
+import struct
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+MAGIC = b"AFRP"
+VERSION = 1
+HEADER = struct.Struct("<4sBQIB")
+RECORD = struct.Struct("<HBbb")
+RECORD_DTYPE = np.dtype([("turn", "<u2"), ("actor", "u1"),
+                         ("p0", "i1"), ("p1", "i1")])
+PARAM_NONE = -128
+
+# Param keys per action, in record order (see GameEnv.ACTIONS)
+PARAM_KEYS = {
+    "summon": ("monster",),
+    "cast_spell": ("spell", "target"),
+    "set_trap": ("trap",),
+    "toggle": ("toggle",),
+    "attack": ("attacker", "target"),
+    "end_turn": (),
+    "combine": ("pair",),
+}
+
+
+def _field_position(cards, card_id) -> int:
+    # Same matching as GameState.get_card_by_id, unknown ids stay unknown
+    for pos, card in enumerate(cards):
+        if card.id == card_id:
+            return pos
+    return PARAM_NONE
+
+
+def _clip(value) -> int:
+    if value is None:
+        return PARAM_NONE
+    return max(PARAM_NONE + 1, min(127, int(value)))
+
+
+def encode_params(engine, player, action_name: str,
+                  params: Optional[Dict]) -> Tuple[int, int]:
+    """Encode action params as two int8 values, before the action runs."""
+    if not params:
+        return PARAM_NONE, PARAM_NONE
+
+    if action_name == "combine":
+        pair = params.get("pair")
+        if not pair or len(pair) != 2:
+            return PARAM_NONE, PARAM_NONE
+        cards = engine.game_state.get_player_cards(player)
+        return (_field_position(cards, pair[0]),
+                _field_position(cards, pair[1]))
+
+    values = [_clip(params.get(key)) for key in PARAM_KEYS[action_name]]
+    values += [PARAM_NONE] * (2 - len(values))
+    return values[0], values[1]
+
+
+def decode_params(engine, player, action_name: str,
+                  p0: int, p1: int) -> Optional[Dict]:
+    """Inverse of `encode_params` against the current engine state."""
+    keys = PARAM_KEYS[action_name]
+    if not keys or p0 == PARAM_NONE:
+        return None
+
+    if action_name == "combine":
+        cards = engine.game_state.get_player_cards(player)
+        pair = tuple(cards[p].id if 0 <= p < len(cards) else None
+                     for p in (p0, p1))
+        return {"pair": pair}
+
+    values = (p0, p1)
+    return {key: None if values[i] == PARAM_NONE else values[i]
+            for i, key in enumerate(keys)}
+
+
+class ReplayRecorder:
+    """
+    Records every action `GameEnv` applies, one replay file per game.
+
+    Attach with `env.set_replay_recorder(recorder)`; a game is written
+    when the next one starts or on `close()`.
+
+    Args:
+        directory: Where replay files are written
+    """
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.logger = logging.getLogger("ReplayRecorder")
+        self.prefix = datetime.now().strftime("%Y%m%d_%H-%M-%S")
+        self.games = 0
+        self.paths: List[Path] = []
+        self._header: Optional[bytes] = None
+        self._records = bytearray()
+        self._start_turn = 0
+
+    def start_game(self, engine, seed: int):
+        """Begin a game, right after `engine.reset(seed)`."""
+        self.end_game()
+        tm = engine.turn_manager
+        self._start_turn = tm.turn_count
+        self._header = HEADER.pack(MAGIC, VERSION, seed,
+                                   tm.turn_count, tm.current_player_index)
+
+    def record(self, engine, player, action_name: str,
+               action_idx: int, params: Optional[Dict]):
+        """Append one action, called before it is applied."""
+        if self._header is None:
+            return
+        player_idx = engine.game_state.players.index(player)
+        p0, p1 = encode_params(engine, player, action_name, params)
+        turn = engine.turn_manager.turn_count - self._start_turn
+        self._records += RECORD.pack(
+            turn, player_idx << 4 | action_idx, p0, p1)
+
+    def end_game(self) -> Optional[Path]:
+        """Write the current game, if any."""
+        if self._header is None:
+            return None
+        self.games += 1
+        path = self.directory / f"game_{self.prefix}_{self.games:06d}.afr"
+        with open(path, "wb") as f:
+            f.write(self._header)
+            f.write(self._records)
+        self.paths.append(path)
+        self._header = None
+        self._records = bytearray()
+        return path
+
+    def close(self):
+        self.end_game()
+        self.logger.info(
+            f"Wrote {self.games} replays to {self.directory}")
+
+
+class Replay:
+    """A parsed replay file; `records` is a structured NumPy array."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        data = self.path.read_bytes()
+        magic, version, self.seed, self.start_turn, self.start_player = \
+            HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError(f"Not a replay file: {self.path}")
+        if version != VERSION:
+            raise ValueError(f"Unsupported replay version {version}")
+        self.records = np.frombuffer(data, dtype=RECORD_DTYPE,
+                                     offset=HEADER.size)
+
+    def __len__(self):
+        return len(self.records)
+
+    @property
+    def num_turns(self) -> int:
+        return int(self.records["turn"][-1]) + 1 if len(self) else 1
+
+    def first_record(self, turn: int) -> int:
+        """Index of the first record played in `turn` or later."""
+        return int(np.searchsorted(self.records["turn"], turn, side="left"))
+
+
+class ReplaySimulator:
+    """
+    Re-executes a replay through `GameEngine` with rendering off.
+
+    Args:
+        replay: Replay or path to a replay file
+        index_path: Snapshot index written by `save_index`, defaults to
+            `<replay>.idx` when it exists
+    """
+
+    def __init__(self, replay, index_path=None):
+        from core.handle_game_logic.game_engine import GameEngine
+        from ml.environment.environment import GameEnv
+        from ml.main import new_players
+
+        self.replay = replay if isinstance(replay, Replay) else Replay(replay)
+        self.engine = GameEngine(players=new_players(), verbose=False)
+        self.env = GameEnv(engine=self.engine, render=False)
+        self.logger = logging.getLogger("ReplaySimulator")
+
+        # turn -> (record index, engine snapshot)
+        self.snapshots: Dict[int, Tuple[int, bytes]] = {}
+        self.position = 0
+
+        index_path = Path(index_path) if index_path else \
+            self.replay.path.with_suffix(".idx")
+        if index_path.exists():
+            self.load_index(index_path)
+
+        self.rewind()
+
+    @property
+    def turn(self) -> int:
+        return self.engine.turn_manager.turn_count - self.replay.start_turn
+
+    @property
+    def game_state(self):
+        return self.engine.game_state
+
+    def rewind(self):
+        """Back to the initial position of the game."""
+        replay = self.replay
+        self.engine.reset(replay.seed)
+        tm = self.engine.turn_manager
+        tm.turn_count = replay.start_turn
+        tm.current_player_index = replay.start_player
+        self.engine.start_game()
+        self.position = 0
+
+    def step(self) -> bool:
+        """Apply the next recorded action, False at the end of the replay."""
+        if self.position >= len(self.replay):
+            return False
+        turn, actor, p0, p1 = self.replay.records[self.position].tolist()
+        self._advance_to_turn(turn)
+
+        player = self.engine.game_state.players[actor >> 4]
+        action_name = self.env.ACTIONS[actor & 0x0F]
+        params = decode_params(self.engine, player, action_name, p0, p1)
+        handler = self.env._action_handlers[action_name]
+        try:
+            handler.perform(self.env, player, params)
+        except Exception as e:
+            self.logger.debug(f"Replayed '{action_name}' failed: {e}")
+        self.position += 1
+        return True
+
+    def _advance_to_turn(self, turn: int):
+        while self.turn < turn:
+            self.engine.end_turn()
+
+    def seek(self, turn: int):
+        """
+        Reconstruct the game state at the start of `turn` (0 is the
+        first turn), restoring the nearest indexed snapshot first.
+        """
+        turn = max(0, min(turn, self.replay.num_turns - 1))
+        target = self.replay.first_record(turn)
+
+        start = max((t for t in self.snapshots if t <= turn), default=None)
+        ahead = self.turn <= turn and self.position <= target
+        if not ahead or (start is not None and start > self.turn):
+            if start is None:
+                self.rewind()
+            else:
+                self.position, snapshot = self.snapshots[start]
+                self.engine.restore(snapshot)
+
+        while self.position < target:
+            self.step()
+        self._advance_to_turn(turn)
+        return self.engine.game_state
+
+    def play(self) -> Iterator[int]:
+        """Step through the rest of the replay, yielding record indices."""
+        while self.step():
+            yield self.position - 1
+
+    # -------------------- snapshot index --------------------
+    def build_index(self, every: int = 20):
+        """Replay the whole game once, snapshotting every `every` turns."""
+        self.rewind()
+        self.snapshots = {0: (0, self.engine.snapshot())}
+        for turn in range(every, self.replay.num_turns, every):
+            self.seek(turn)
+            self.snapshots[turn] = (self.position, self.engine.snapshot())
+        self.rewind()
+
+    def save_index(self, path=None) -> Path:
+        path = Path(path) if path else self.replay.path.with_suffix(".idx")
+        with open(path, "wb") as f:
+            pickle.dump({"version": VERSION, "snapshots": self.snapshots},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        return path
+
+    def load_index(self, path):
+        with open(path, "rb") as f:
+            index = pickle.load(f)
+        if index.get("version") != VERSION:
+            raise ValueError(f"Unsupported replay index: {path}")
+        self.snapshots = index["snapshots"]
+
+
+def find_replays(directory) -> List[Path]:
+    """All replay files under `directory`."""
+    return sorted(Path(directory).glob("game_*.afr"))
+
+
+def describe(game_state) -> str:
+    lines = []
+    for player in game_state.players:
+        info = game_state.player_info[player]
+        field = [card.name for card in game_state.get_player_cards(player)]
+        lines.append(
+            f"{player.name}: LP {player.life_points} | "
+            f"hand {len(info['held_cards'])} | "
+            f"graveyard {len(info['graveyard_cards'])} | "
+            f"field {', '.join(field) or '-'}")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("replay", type=Path)
+    parser.add_argument("--turn", type=int, default=None,
+                        help="print the game state at the start of this turn")
+    parser.add_argument("--index", type=int, default=None, metavar="K",
+                        help="write a snapshot index every K turns")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("GameEngine").setLevel(logging.WARNING)
+    sim = ReplaySimulator(args.replay)
+    replay = sim.replay
+    logging.info(f"{args.replay}: seed {replay.seed}, {len(replay)} actions, "
+                 f"{replay.num_turns} turns")
+
+    if args.index:
+        sim.build_index(args.index)
+        logging.info(f"Wrote index to {sim.save_index()}")
+
+    if args.turn is not None:
+        state = sim.seek(args.turn)
+        logging.info(f"Turn {sim.turn}:\n{describe(state)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
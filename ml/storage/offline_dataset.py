@@ -0,0 +1,181 @@
+"""
+Transition dataset over recordings written by `EpisodeRecorder`.
+
+Recordings hold one row per action. Transitions are built by pairing
+each row with the next action of the same player in the same episode;
+the last action of a finished game is terminal and its reward already
+holds the victory/defeat reward (`EpisodeRecorder.record_terminal`).
+Each DataLoader worker
+streams a disjoint set of row groups and yields ready-made minibatches,
+so the main process only moves tensors to the device.
+"""
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+import torch
+from torch.utils.data import IterableDataset, get_worker_info
+
+from ml.storage.episode_recorder import EpisodeReader, find_recordings
+
+
+def build_transitions(columns: Dict[str, np.ndarray], num_rows: int,
+                      player: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """
+    Pair rows into (s, a, r, s', done) transitions.
+
+    Args:
+        columns: Recorded columns, may include look-ahead rows past
+            `num_rows` that are only used as successors
+        num_rows: Rows that may start a transition
+        player: Keep only transitions of this player index
+
+    Returns:
+        Dict of arrays: state, mask, action, reward, next_state,
+        next_mask, done, and chosen (False for random filler actions,
+        True for recordings without that column)
+    """
+    episode = columns["episode"]
+    players = columns["player"]
+    done = np.asarray(columns["done"], dtype=bool)
+    n = len(episode)
+    chosen = np.asarray(columns["chosen"], dtype=bool) \
+        if "chosen" in columns else np.ones(n, dtype=bool)
+
+    order = np.lexsort((columns["step"], players, episode))
+    same = ((episode[order][1:] == episode[order][:-1]) &
+            (players[order][1:] == players[order][:-1]))
+    successor = np.full(n, -1, dtype=np.int64)
+    successor[order[:-1][same]] = order[1:][same]
+
+    # Last move of either player in a finished game is terminal
+    finished = np.isin(episode, episode[done])
+    terminal = done | ((successor < 0) & finished)
+
+    keep = ((successor >= 0) | terminal) & (np.arange(n) < num_rows)
+    if player is not None:
+        keep &= players == player
+
+    idx = np.nonzero(keep)[0]
+    next_idx = np.where(terminal[idx], idx, successor[idx])
+
+    return {
+        "state": np.asarray(columns["state"][idx], dtype=np.float32),
+        "mask": np.asarray(columns["mask"][idx], dtype=bool),
+        "action": np.asarray(columns["action"][idx], dtype=np.int64),
+        "reward": np.asarray(columns["reward"][idx], dtype=np.float32),
+        "next_state": np.asarray(columns["state"][next_idx],
+                                 dtype=np.float32),
+        "next_mask": np.asarray(columns["mask"][next_idx], dtype=bool),
+        "done": terminal[idx].astype(np.float32),
+        "chosen": chosen[idx].astype(np.float32),
+    }
+
+
+class TransitionDataset(IterableDataset):
+    """
+    Streams shuffled minibatches of transitions from recordings.
+
+    Use with `DataLoader(dataset, batch_size=None, num_workers=N)`.
+
+    Args:
+        paths: Recording files/directories, or folders containing them
+        batch_size: Transitions per yielded batch
+        shuffle_rows: Size of the per-worker shuffle buffer
+        player: Only learn from this player's actions
+        seed: Base seed, combined with epoch and worker id
+    """
+
+    def __init__(self, paths, batch_size: int = 512,
+                 shuffle_rows: int = 16384, player: Optional[int] = None,
+                 seed: int = 0):
+        super().__init__()
+        self.batch_size = batch_size
+        self.shuffle_rows = shuffle_rows
+        self.player = player
+        self.seed = seed
+        self.epoch = 0
+
+        self.recordings: List[Path] = []
+        for path in paths:
+            path = Path(path)
+            if path.suffix == ".arrow" or (path / "chunk_00000").exists():
+                self.recordings.append(path)
+            else:
+                self.recordings.extend(find_recordings(path))
+        if not self.recordings:
+            raise FileNotFoundError(f"No recordings found in {paths}")
+
+        # One shard per row group
+        self.shards = []
+        for rec_idx, path in enumerate(self.recordings):
+            reader = EpisodeReader(path)
+            self.shards.extend(
+                (rec_idx, group) for group in range(reader.num_batches))
+            reader.close()
+
+    def set_epoch(self, epoch: int):
+        self.epoch = epoch
+
+    def __iter__(self) -> Iterator[Dict[str, torch.Tensor]]:
+        info = get_worker_info()
+        worker_id, num_workers = (0, 1) if info is None \
+            else (info.id, info.num_workers)
+
+        rng = np.random.default_rng(
+            (self.seed, self.epoch, worker_id))
+        shards = self.shards[worker_id::num_workers]
+        order = rng.permutation(len(shards))
+
+        readers: Dict[int, EpisodeReader] = {}
+        pending: List[Dict[str, np.ndarray]] = []
+        pending_rows = 0
+
+        for i in order:
+            rec_idx, group = shards[i]
+            reader = readers.get(rec_idx)
+            if reader is None:
+                reader = readers[rec_idx] = EpisodeReader(
+                    self.recordings[rec_idx])
+
+            transitions = self._load_group(reader, group)
+            pending.append(transitions)
+            pending_rows += len(transitions["action"])
+
+            if pending_rows >= self.shuffle_rows:
+                rest = yield from self._emit(pending, rng, final=False)
+                pending, pending_rows = [rest], len(rest["action"])
+
+        if pending_rows:
+            yield from self._emit(pending, rng, final=True)
+
+        for reader in readers.values():
+            reader.close()
+
+    def _load_group(self, reader: EpisodeReader, group: int):
+        columns = reader.read_batch(group)
+        num_rows = len(columns["episode"])
+        # Look one row group ahead to find successors crossing the boundary
+        if group + 1 < reader.num_batches:
+            ahead = reader.read_batch(group + 1)
+            columns = {name: np.concatenate([columns[name], ahead[name]])
+                       for name in columns}
+        return build_transitions(columns, num_rows, self.player)
+
+    def _emit(self, pending, rng, final: bool):
+        merged = {name: np.concatenate([p[name] for p in pending])
+                  for name in pending[0]}
+        n = len(merged["action"])
+        perm = rng.permutation(n)
+
+        full = n - n % self.batch_size
+        for start in range(0, full, self.batch_size):
+            idx = perm[start:start + self.batch_size]
+            yield {name: torch.from_numpy(values[idx])
+                   for name, values in merged.items()}
+
+        rest_idx = perm[full:]
+        if final and len(rest_idx):
+            yield {name: torch.from_numpy(values[rest_idx])
+                   for name, values in merged.items()}
+        return {name: values[rest_idx] for name, values in merged.items()}
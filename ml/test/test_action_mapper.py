@@ -0,0 +1,33 @@
+import numpy as np
+
+from core.handle_game_logic.game_engine import GameEngine
+from ml.environment.environment import GameEnv
+from ml.environment.legal_params import LegalParams
+from ml.main import new_players
+from ml.trainer.action_mapper import ActionMapper
+
+
+def test_map_batch_matches_map_on_real_legal_params():
+    env = GameEnv(engine=GameEngine(players=new_players(), verbose=False))
+    mapper = ActionMapper(env)
+    rng = np.random.default_rng(0)
+    combine = env.ACTIONS.index("combine")
+    combines = 0
+
+    for seed in range(4):
+        env.reset(seed)
+        for _ in range(12):
+            env.step()
+            for player_idx in range(2):
+                mask, params = env.get_legal_actions(player_idx)
+                _, legal = env.get_legal_arrays(player_idx)
+                actions = np.flatnonzero(mask)
+                cont = rng.normal(size=(len(actions), env.param_dim))
+
+                batch = mapper.map_batch(
+                    actions, cont, LegalParams.stack([legal] * len(actions)))
+                for i, action in enumerate(actions):
+                    assert batch[i] == mapper.map(
+                        player_idx, action, cont[i], params)
+                combines += int(mask[combine])
+    assert combines > 0
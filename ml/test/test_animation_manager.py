@@ -0,0 +1,85 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from gui.animations.animation import Animation  # noqa: E402
+from gui.animations.death import DeathAnimation  # noqa: E402
+from gui.animations.manager import AnimationManager  # noqa: E402
+
+
+class Sprite:
+    def __init__(self):
+        self.image = pygame.Surface((1, 1))
+
+
+class Step(Animation):
+    """Takes `frames` updates of dt=1 and logs each frame it runs."""
+
+    def __init__(self, name, locks, frames, log):
+        super().__init__(set(locks), frames)
+        self.name = name
+        self.log = log
+
+    def _apply(self, t):
+        self.log.append(self.name)
+
+
+def run(manager, frames):
+    for _ in range(frames):
+        manager.update(1)
+
+
+def test_chained_animations_on_one_sprite_run_in_order():
+    manager, log, sprite = AnimationManager(), [], Sprite()
+    manager.add_animation(Step("first", [sprite], 2, log))
+    manager.add_animation(Step("second", [sprite], 1, log))
+    manager.add_animation(Step("third", [sprite], 1, log))
+
+    run(manager, 2)
+    assert log == ["first", "first"]
+    run(manager, 4)
+    assert log == ["first", "first", "second", "third"]
+    assert not manager.queues and not manager.ready
+
+
+def test_two_lock_animation_waits_for_both_queues():
+    manager, log = AnimationManager(), []
+    attacker, target = Sprite(), Sprite()
+    manager.add_animation(Step("move", [attacker], 1, log))
+    manager.add_animation(Step("place", [target], 3, log))
+    manager.add_animation(Step("attack", [attacker, target], 1, log))
+    manager.add_animation(Step("after", [attacker], 1, log))
+
+    run(manager, 3)
+    # The attacker is free after one frame, but the attack also needs
+    # the target and later attacker animations stay behind it
+    assert log == ["move", "place", "place", "place"]
+    run(manager, 3)
+    assert log[4:] == ["attack", "after"]
+    assert not manager.queues and not manager.ready
+
+
+def test_death_appended_after_other_animations_drains():
+    manager, log = AnimationManager(), []
+    dying, other = Sprite(), Sprite()
+    died = []
+    manager.add_animation(Step("hit", [dying], 2, log))
+    manager.add_animation(DeathAnimation(dying, 1,
+                                         on_finish=lambda: died.append(1)))
+    # Dropped: nothing runs on a sprite after its death, and the other
+    # sprite is not blocked by the dropped animation
+    manager.add_animation(Step("late", [dying], 1, log))
+    manager.add_animation(Step("late_pair", [dying, other], 1, log))
+    manager.add_animation(Step("other", [other], 1, log))
+
+    run(manager, 2)
+    assert log == ["hit", "other", "hit"]
+    assert not died
+    run(manager, 2)
+    assert died == [1]
+    assert dying.image.get_alpha() == 0
+    assert log == ["hit", "other", "hit"]
+    assert not manager.queues and not manager.ready
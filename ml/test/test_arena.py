@@ -0,0 +1,60 @@
+import pytest
+
+from core.handle_game_logic.game_engine import GameEngine
+from ml.arena import MAX_TURNS, RandomBot, fit_elo, play_game, wilson_interval
+from ml.environment.environment import GameEnv
+from ml.main import new_players
+
+
+def test_wilson_interval():
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+    assert wilson_interval(8, 10) == pytest.approx((0.4902, 0.9433),
+                                                   abs=1e-4)
+
+    low, high = wilson_interval(50, 100)
+    assert low < 0.5 < high
+    assert 0.5 - low == pytest.approx(high - 0.5)
+    # More games, tighter interval
+    low_n, high_n = wilson_interval(500, 1000)
+    assert low < low_n < high_n < high
+
+    assert wilson_interval(0, 20)[0] == 0.0
+    assert wilson_interval(20, 20)[1] == 1.0
+
+
+def test_fit_elo_ranks_the_dominant_entrant_first():
+    names = ["strong", "even_a", "even_b"]
+    pair_scores = {
+        (0, 1): (18, 20),
+        (0, 2): (19, 20),
+        (1, 2): (10, 20),
+    }
+    ratings = fit_elo(names, pair_scores)
+    assert max(range(3), key=ratings.__getitem__) == 0
+    assert ratings[0] - max(ratings[1:]) > 200
+    assert ratings[1] == pytest.approx(ratings[2], abs=20)
+    # Ratings are centred on the base rating (geometric mean strength)
+    assert sum(ratings) / 3 == pytest.approx(1500.0)
+
+    # Seat order of a pair does not matter
+    flipped = fit_elo(names, {(1, 0): (2, 20), (2, 0): (1, 20),
+                              (2, 1): (10, 20)})
+    assert flipped == pytest.approx(ratings)
+
+
+def test_random_bots_play_seeded_games_to_a_winner():
+    env = GameEnv(engine=GameEngine(players=new_players(), verbose=False,
+                                    seed=0))
+    results = []
+    for seed in range(4):
+        bots = [RandomBot(seed), RandomBot(seed + 100)]
+        winner, turns = play_game(env, bots, seed=seed)
+        assert winner in (0, 1)
+        assert 0 < turns < MAX_TURNS
+        assert env.engine.game_state.is_game_over()
+        results.append((winner, turns))
+
+    # Same seeds replay the same games, whatever was played before
+    bots = [RandomBot(2), RandomBot(102)]
+    assert play_game(env, bots, seed=2) == results[2]
+    assert len(set(results)) > 1
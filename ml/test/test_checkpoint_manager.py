@@ -0,0 +1,21 @@
+from types import SimpleNamespace
+
+from ml.trainer.checkpoint_manager import CheckpointManager
+
+
+def test_episode_idx_survives_save_and_restore(tmp_path):
+    config = SimpleNamespace(CHECKPOINT_KEEP_LAST=2,
+                             CHECKPOINT_SAVE_BUFFERS=False,
+                             CHECKPOINT_PATH=tmp_path / "checkpoint.pth")
+    manager = CheckpointManager(config, directory=tmp_path / "checkpoints")
+    episode_manager = SimpleNamespace(episode_count=7)
+
+    manager.save(100, [], episode_manager, episode_idx=42)
+    manager.close()
+
+    state = manager.load_latest()
+    assert state["frame_idx"] == 100
+    assert state["episode_idx"] == 42
+    restored = SimpleNamespace()
+    manager.restore(state, [], restored)
+    assert restored.episode_count == 7
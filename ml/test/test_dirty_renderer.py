@@ -0,0 +1,48 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from core.handle_game_logic.game_engine import GameEngine  # noqa: E402
+from gui.effects.manager import EffectManager  # noqa: E402
+from ml.environment.environment import GameEnv  # noqa: E402
+from ml.environment.renderer import Renderer  # noqa: E402
+from ml.main import new_players  # noqa: E402
+
+
+def full_redraw(renderer):
+    reference = pygame.Surface(renderer.screen.get_size())
+    renderer.field_matrix.draw(reference)
+    for sprite in renderer.render_engine.drawables():
+        sprite.draw(reference)
+    EffectManager.draw(reference)
+    return pygame.image.tobytes(reference, "RGB")
+
+
+def test_dirty_frames_match_full_redraws():
+    engine = GameEngine(players=new_players(), verbose=False)
+    env = GameEnv(engine=engine)
+    env.reset(0)
+    renderer = Renderer(engine=engine, train_mode=True, dirty_rects=True)
+
+    for _ in range(6):
+        env.step()
+        renderer.render()
+        assert pygame.image.tobytes(renderer.screen, "RGB") == \
+            full_redraw(renderer)
+
+    # Animations swap in rotated or scaled images and restore the original
+    sprites = list(renderer.render_engine.sprites["matrix"].values()) + \
+        list(renderer.render_engine.sprites["hand"].values())
+    assert sprites
+    for sprite in sprites[:4]:
+        original = sprite.image
+        for angle in (5, 15, 0):
+            sprite.image = pygame.transform.rotate(original, angle) \
+                if angle else original
+            renderer.render()
+            assert pygame.image.tobytes(renderer.screen, "RGB") == \
+                full_redraw(renderer)
+    pygame.quit()
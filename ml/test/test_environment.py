@@ -0,0 +1,32 @@
+from core.handle_game_logic.game_engine import GameEngine
+from ml.environment.environment import GameEnv
+from ml.main import new_players
+
+
+def play_rewards(compiled_turns, seed, rounds=15):
+    """(action, reward) of every action in `rounds` random rounds."""
+    env = GameEnv(engine=GameEngine(players=new_players(), verbose=False),
+                  compiled_turns=compiled_turns)
+    calculator = env.reward_calculator
+    calculate = calculator.calculate_action_reward
+    rewards = []
+
+    def recording(action_name, *args):
+        breakdown = calculate(action_name, *args)
+        rewards.append((action_name, breakdown.total))
+        return breakdown
+
+    calculator.calculate_action_reward = recording
+    env.reset(seed)
+    for _ in range(rounds):
+        _, _, done, _ = env.step()
+        if done:
+            break
+    return rewards
+
+
+def test_compiled_turns_give_the_same_rewards():
+    for seed in range(5):
+        compiled = play_rewards(True, seed)
+        assert len(compiled) > 20
+        assert compiled == play_rewards(False, seed)
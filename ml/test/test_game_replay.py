@@ -0,0 +1,101 @@
+import io
+import pickle
+import uuid
+
+import pytest
+
+from core.handle_game_logic.game_engine import GameEngine
+from ml.environment.environment import GameEnv
+from ml.main import new_players
+from ml.storage.game_replay import Replay, ReplayRecorder, ReplaySimulator
+
+
+class _PlainUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid):
+        return pid
+
+
+def state_tree(snapshot: bytes):
+    """
+    `engine.snapshot()` as nested lists, comparable across engines: card
+    uuids are numbered by first appearance and the process-wide cache
+    versions (bumped by `restore`) are dropped.
+    """
+    uuids, seen = {}, {}
+
+    def plain(obj):
+        if isinstance(obj, uuid.UUID):
+            return "uuid", uuids.setdefault(obj, len(uuids))
+        if id(obj) in seen:
+            return "ref", seen[id(obj)]
+        if isinstance(obj, (dict, list, tuple)) or hasattr(obj, "__dict__"):
+            seen[id(obj)] = len(seen)
+        if isinstance(obj, dict):
+            return [(plain(k), plain(v)) for k, v in obj.items()
+                    if k != "version"]
+        if isinstance(obj, (list, tuple)):
+            return [plain(v) for v in obj]
+        if hasattr(obj, "__dict__"):
+            return type(obj).__name__, plain(vars(obj))
+        return obj
+
+    return plain(_PlainUnpickler(io.BytesIO(snapshot)).load())
+
+
+class SnapshotRecorder(ReplayRecorder):
+    """Also keeps the engine snapshot before the first action of a turn."""
+
+    def start_game(self, engine, seed):
+        super().start_game(engine, seed)
+        self.turn_snapshots = {}
+
+    def record(self, engine, player, action_name, action_idx, params):
+        turn = engine.turn_manager.turn_count - self._start_turn
+        if turn not in self.turn_snapshots:
+            self.turn_snapshots[turn] = engine.snapshot()
+        super().record(engine, player, action_name, action_idx, params)
+
+
+@pytest.fixture(scope="module")
+def games(tmp_path_factory):
+    """(replay path, turn snapshots, final snapshot) of seeded games."""
+    env = GameEnv(engine=GameEngine(players=new_players(), verbose=False,
+                                    seed=0))
+    recorder = SnapshotRecorder(tmp_path_factory.mktemp("replays"))
+    env.set_replay_recorder(recorder)
+    games = []
+    for seed in (3, 11):
+        env.reset(seed)
+        done = False
+        while not done:
+            _, _, done, _ = env.step()
+        snapshots = recorder.turn_snapshots
+        games.append((recorder.end_game(), snapshots,
+                      env.engine.snapshot()))
+    return games
+
+
+def test_full_replay_reproduces_the_recorded_game(games):
+    for path, _, final in games:
+        sim = ReplaySimulator(path)
+        assert sum(1 for _ in sim.play()) == len(Replay(path))
+        assert sim.game_state.is_game_over()
+        assert state_tree(sim.engine.snapshot()) == state_tree(final)
+
+
+def test_seek_through_the_index_matches_every_recorded_turn(games):
+    for path, snapshots, _ in games:
+        sim = ReplaySimulator(path)
+        sim.build_index(every=4)
+        index = sim.save_index()
+        assert len(sim.snapshots) > 2
+
+        sim = ReplaySimulator(path, index_path=index)
+        assert sim.snapshots.keys() == set(range(0, sim.replay.num_turns, 4))
+        # Backwards and forwards, across and within indexed intervals
+        turns = sorted(snapshots)
+        for turn in turns[::-3] + turns[1::4]:
+            sim.seek(turn)
+            assert sim.turn == turn
+            assert state_tree(sim.engine.snapshot()) == \
+                state_tree(snapshots[turn]), f"turn {turn}"
@@ -0,0 +1,118 @@
+import asyncio
+import threading
+
+import numpy as np
+import pytest
+import torch
+
+from core.handle_game_logic.game_engine import GameEngine
+from ml.config import Config
+from ml.environment.environment import GameEnv
+from ml.main import new_players
+from ml.serving import InferenceClient, InferenceService, ServedAIOpponent
+from ml.trainer.agent import Agent
+
+
+@pytest.fixture(scope="module")
+def env():
+    env = GameEnv(engine=GameEngine(players=new_players(), verbose=False,
+                                    seed=0))
+    env.reset(0)
+    return env
+
+
+@pytest.fixture(scope="module")
+def agent(env):
+    torch.manual_seed(0)
+    config = Config()
+    config.DEVICE = "cpu"
+    return Agent(env.state_dim, env.num_actions, env.param_dim, config)
+
+
+def make_service(env, agent, **kwargs):
+    return InferenceService(agent, env.state_dim, env.num_actions,
+                            env.param_dim, **kwargs)
+
+
+def greedy(service, states, masks):
+    actions, _ = service._forward(np.asarray(states, dtype=np.float32),
+                                  np.asarray(masks, dtype=bool))
+    return actions.tolist()
+
+
+def test_concurrent_submits_share_one_batch(env, agent):
+    service = make_service(env, agent, max_delay_ms=500)
+    service.start_background()
+
+    rng = np.random.default_rng(0)
+    states = rng.normal(size=(8, env.state_dim)).astype(np.float32)
+    masks = rng.random((8, env.num_actions)) < 0.5
+    masks[:, 0] = True
+    results = [None] * 8
+    barrier = threading.Barrier(8)
+
+    def work(i):
+        barrier.wait()
+        results[i] = service.submit(states[i], masks[i], timeout=10)
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert [action for action, _ in results] == \
+        greedy(service, states, masks)
+    assert all(params.shape == (env.param_dim,) for _, params in results)
+
+    stats = service.stats()
+    assert stats["batch_size"]["count"] == 1
+    assert stats["batch_size"]["buckets"][8] == 1
+    assert stats["latency_ms"]["count"] == 8
+    assert stats["latency_ms"]["mean"] > 0
+
+
+def test_unix_socket_round_trip_matches_in_process(env, agent, tmp_path):
+    service = make_service(env, agent, max_delay_ms=1)
+    mask, _ = env.get_legal_actions(0)
+    state = env._get_state(env.engine.game_state.players[0])
+
+    async def run():
+        await service.start()
+        await service.serve_unix(tmp_path / "inference.sock")
+        client = InferenceClient(tmp_path / "inference.sock", env.state_dim,
+                                 env.num_actions, env.param_dim)
+        await client.connect()
+        try:
+            remote = await client.infer(state, mask)
+            local = await service.infer(state, mask)
+        finally:
+            await client.close()
+            await service.stop()
+        return remote, local
+
+    (remote_action, remote_params), (local_action, _) = asyncio.run(run())
+    assert remote_action == local_action == greedy(service, [state],
+                                                   [mask])[0]
+    assert remote_params.shape == (env.param_dim,)
+
+
+def test_served_opponent_explores_only_when_not_deterministic(
+        env, agent, monkeypatch):
+    service = make_service(env, agent, max_delay_ms=1)
+    service.start_background()
+    opponent = ServedAIOpponent(env, service)
+    player = env.engine.game_state.players[0]
+    mask, legal_params = env.get_legal_actions(0)
+    state = env._get_state(player)
+
+    action_idx, _ = opponent.get_action(player, 0)
+    assert action_idx == greedy(service, [state], [mask])[0]
+
+    # Force exploration: every call picks a random legal action
+    monkeypatch.setattr("ml.serving.inference_service.random.random",
+                        lambda: 0.0)
+    seen = {opponent.get_action(player, 0, deterministic=False)[0]
+            for _ in range(50)}
+    assert all(mask[action] for action in seen)
+    assert len(seen) > 1 or mask.sum() == 1
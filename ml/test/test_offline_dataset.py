@@ -0,0 +1,98 @@
+import numpy as np
+
+from core.handle_game_logic.game_engine import GameEngine
+from ml.environment.environment import GameEnv
+from ml.main import new_players
+from ml.storage.episode_recorder import (
+    REWARD_COMPONENTS, EpisodeReader, EpisodeRecorder, find_recordings)
+from ml.storage.offline_dataset import build_transitions
+
+END_TURN = GameEnv.ACTIONS.index("end_turn")
+
+
+def record_games(directory, games=2, rounds=3):
+    env = GameEnv(engine=GameEngine(players=new_players(), verbose=False,
+                                    seed=0))
+    recorder = EpisodeRecorder(directory, env.state_dim, env.num_actions,
+                               row_group_size=8, use_arrow=False)
+    env.set_recorder(recorder)
+    for game in range(games):
+        env.reset(game)
+        for _ in range(rounds):
+            env.step({"1": [(END_TURN, {})]})
+        # Player 1 wins on its next turn
+        env.engine.game_state.players[1].life_points = 0
+        _, rewards, done, _ = env.step({"1": [(END_TURN, {})]})
+        assert done and rewards[0] > rewards[1]
+    recorder.close()
+    return EpisodeReader(find_recordings(directory)[0])
+
+
+def test_recorded_episodes_round_trip_through_build_transitions(tmp_path):
+    reader = record_games(tmp_path)
+    columns = reader.read_all()
+    # Row groups end on episode boundaries
+    groups = [set(batch["episode"]) for batch in reader.batches()]
+    assert len(groups) > 1
+    assert all(not a & b for a, b in zip(groups, groups[1:]))
+
+    victory = REWARD_COMPONENTS.index("victory")
+    defeat = REWARD_COMPONENTS.index("defeat")
+    for player, column, sign in ((0, victory, 1), (1, defeat, -1)):
+        rows = np.flatnonzero(columns["player"] == player)
+        transitions = build_transitions(columns, len(columns["episode"]),
+                                        player=player)
+        assert len(transitions["action"]) == len(rows)
+        np.testing.assert_array_equal(transitions["action"],
+                                      columns["action"][rows])
+        np.testing.assert_allclose(transitions["reward"],
+                                   columns["reward"][rows], rtol=1e-6)
+
+        episodes = columns["episode"][rows]
+        last = np.r_[episodes[1:] != episodes[:-1], True]
+        np.testing.assert_array_equal(transitions["done"], last)
+        # The terminal reward sits on the player's last row of each game
+        components = columns["reward_components"][rows]
+        assert np.all(sign * components[last, column] > 0)
+        assert np.all(components[~last, column] == 0)
+
+        # Non-terminal transitions lead to the player's next state
+        np.testing.assert_array_equal(transitions["next_state"][~last],
+                                      columns["state"][rows][1:][~last[:-1]])
+        np.testing.assert_array_equal(transitions["next_state"][last],
+                                      transitions["state"][last])
+
+        # Player 1 got one agent action per turn, player 2 only filler
+        np.testing.assert_array_equal(transitions["chosen"],
+                                      columns["chosen"][rows])
+        assert transitions["chosen"].any() == (player == 0)
+    reader.close()
+
+
+def test_terminal_rewards_close_games_recorded_from_one_seat(tmp_path):
+    # Like main.py: only the AI's turns are recorded and the human
+    # player's winning move never reaches the recorder.
+    env = GameEnv(engine=GameEngine(players=new_players(), verbose=False,
+                                    seed=0))
+    recorder = EpisodeRecorder(tmp_path, env.state_dim, env.num_actions,
+                               use_arrow=False)
+    env.set_recorder(recorder)
+    env.reset(0)
+    ai = env.engine.game_state.players[1]
+    for _ in range(2):
+        if env.engine.turn_manager.get_current_player() != ai:
+            env.engine.end_turn()
+        env.step_evaluation(ai, [(END_TURN, {})], max_actions=1)
+    ai.life_points = 0
+    assert env.engine.game_state.is_game_over()
+    env.terminal_rewards()
+    recorder.close()
+
+    reader = EpisodeReader(find_recordings(tmp_path)[0])
+    columns = reader.read_all()
+    transitions = build_transitions(columns, len(columns["episode"]),
+                                    player=1)
+    np.testing.assert_array_equal(transitions["done"], [0, 1])
+    defeat = REWARD_COMPONENTS.index("defeat")
+    assert columns["reward_components"][-1, defeat] < 0
+    reader.close()
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+import torch
+
+from ml.config import Config
+from ml.league import PolicyPool, pfsp_weights
+from ml.trainer.agent import Agent
+
+
+def make_agent(seed):
+    torch.manual_seed(seed)
+    config = Config()
+    config.DEVICE = "cpu"
+    return Agent(state_dim=8, num_actions=4, param_dim=2, config=config)
+
+
+def test_pfsp_weights():
+    win_rates = [0.0, 0.25, 0.5, 0.75, 1.0]
+
+    hard = pfsp_weights(win_rates, "hard")
+    assert np.all(np.diff(hard) < 0)
+    assert hard[-1] > 0  # fully beaten opponents stay reachable
+    assert pfsp_weights(win_rates, "hard", p=4)[0] > hard[0]
+
+    variance = pfsp_weights(win_rates, "variance")
+    assert variance.argmax() == 2
+    np.testing.assert_allclose(variance, variance[::-1])
+
+    np.testing.assert_allclose(pfsp_weights(win_rates, "uniform"), 0.2)
+    for weighting in ("hard", "variance", "uniform"):
+        assert pfsp_weights(win_rates, weighting).sum() == pytest.approx(1)
+
+    with pytest.raises(ValueError):
+        pfsp_weights(win_rates, "softmax")
+
+
+def test_add_evicts_the_oldest_snapshots(tmp_path):
+    pool = PolicyPool(tmp_path, max_size=2)
+    saved = []
+    agent = make_agent(0)
+    for frame in (100, 200, 300):
+        entry = pool.add(agent, frame, on_saved=saved.append)
+        assert entry["frame"] == frame
+    pool.close()
+
+    assert [entry["version"] for entry in saved] == [1, 2, 3]
+    assert pool.versions == [2, 3]
+    assert not pool.path(1).exists()
+    assert pool.path(2).exists() and pool.path(3).exists()
+
+    pool.record_result(3, score=3.0, games=4)
+    assert pool.win_rate(3) == 0.75
+    assert pool.win_rate(2) == 0.5
+
+    # The index survives a restart and numbering carries on
+    reopened = PolicyPool(tmp_path, max_size=2)
+    assert reopened.versions == [2, 3]
+    assert reopened.win_rate(3) == 0.75
+    reopened.add(agent, 400)
+    reopened.close()
+    assert reopened.versions == [3, 4]
+
+
+def test_load_into_restores_fp16_weights(tmp_path):
+    pool = PolicyPool(tmp_path)
+    source, target = make_agent(0), make_agent(1)
+    version = pool.add(source, 100)["version"]
+    pool.close()
+
+    pool.load_into(version, target)
+    assert not target.dqn.training and not target.policy.training
+    for module in ("dqn", "policy", "pdqn"):
+        expected = getattr(source, module).state_dict()
+        for key, value in getattr(target, module).state_dict().items():
+            if value.is_floating_point():
+                torch.testing.assert_close(
+                    value, expected[key].half().float())
+            else:
+                torch.testing.assert_close(value, expected[key])
@@ -0,0 +1,39 @@
+import threading
+
+from ml.profiler import PhaseProfiler, profiler
+
+
+def test_shared_profiler_is_disabled_by_default():
+    assert not profiler.enabled
+    assert not PhaseProfiler().enabled
+    with PhaseProfiler().span("phase") as span:
+        assert not hasattr(span, "samples")
+
+
+def test_nested_spans_with_the_same_name_are_timed_separately():
+    prof = PhaseProfiler(enabled=True)
+    with prof.span("step"):
+        with prof.span("step"):
+            pass
+    outer, inner = sorted(prof.samples["step"], reverse=True)
+    assert outer >= inner > 0
+    assert prof.summary()["step"]["count"] == 2
+
+
+def test_concurrent_spans_each_record_one_sample():
+    prof = PhaseProfiler(enabled=True)
+    barrier = threading.Barrier(4)
+
+    def work():
+        with prof.span("legal_actions"):
+            barrier.wait()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(prof.samples["legal_actions"]) == 4
+    assert "Profile/legal_actions/mean_ms" in prof.metrics()
+    prof.reset()
+    assert prof.format_table() == "no profiling samples"
@@ -0,0 +1,23 @@
+import torch
+
+from core.handle_game_logic.game_engine import GameEngine
+from ml.environment.environment import GameEnv
+from ml.main import new_players
+from ml.models import DuelingDQN
+from ml.quantization import benchmark, collect_states, quantize_model
+
+
+def test_benchmark_compares_one_action_per_state():
+    torch.manual_seed(0)
+    env = GameEnv(engine=GameEngine(players=new_players(), verbose=False,
+                                    seed=0))
+    states, masks = collect_states(env, num_states=64)
+    assert states.shape == (64, env.state_dim)
+    assert masks.shape == (64, env.num_actions)
+    assert masks.any(dim=1).all()
+
+    model = DuelingDQN(env.state_dim, env.num_actions).eval()
+    results = benchmark(model, quantize_model(model), states, masks,
+                        batch_sizes=(4,), iters=1)
+    assert 0.0 <= results["agreement"] <= 1.0
+    assert set(results["latency"]) == {4}
@@ -0,0 +1,86 @@
+import numpy as np
+
+from core.cards.monster_card import MonsterCard
+from core.handle_game_logic.game_engine import GameEngine
+from ml.environment.environment import GameEnv
+from ml.arena import make_bot, play_game
+from ml.environment.reward_system import (
+    BATCH_COMPONENTS, NO_TOGGLE, BatchRewardCalculator, RewardCalculator,
+    create_enhanced_snapshot)
+from ml.main import new_players
+
+
+def place_monsters(engine, player, attack_points):
+    gs = engine.game_state
+    row = gs.rows - 1
+    monsters = []
+    for col, atk in enumerate(attack_points):
+        monster = MonsterCard(f"m{col}", "", player, attack_points=atk,
+                              defense_points=atk)
+        gs.modify_field("add", monster, (row, col))
+        monsters.append(monster)
+    return monsters
+
+
+def test_spell_combo_matches_monsters_by_field_position():
+    engine = GameEngine(players=new_players(), verbose=False, seed=0)
+    player = engine.game_state.players[0]
+    first, _, last = place_monsters(engine, player, (100, 2000, 1500))
+    before = create_enhanced_snapshot(engine, player)
+
+    # The first monster leaves the field while the spell buffs the last
+    engine.game_state.modify_field("remove", first, first.pos_in_matrix)
+    last.atk += 600
+    after = create_enhanced_snapshot(engine, player)
+
+    calculator = RewardCalculator()
+    breakdown = calculator.calculate_action_reward(
+        "cast_spell", player, None, True, before, after)
+    expected = calculator.config.spell_combo_bonus
+    assert breakdown.components["spell_combo"] == expected
+
+    batch = BatchRewardCalculator(1, GameEnv.ACTIONS)
+    _, components = batch.calculate(
+        [GameEnv.ACTIONS.index("cast_spell")], [True], [before], [after],
+        return_components=True)
+    combo = components[0, BATCH_COMPONENTS.index("spell_combo")]
+    np.testing.assert_allclose(combo, expected)
+
+
+def test_batch_calculator_matches_scalar_rewards_in_real_games():
+    env = GameEnv(engine=GameEngine(players=new_players(), verbose=False,
+                                    seed=0))
+    scalar = env.reward_calculator
+    calls = []
+    calculate = scalar.calculate_action_reward
+
+    def recording(action_name, player, params, success, before, after):
+        triggers = scalar.traps_triggered_this_step
+        breakdown = calculate(action_name, player, params, success,
+                              before, after)
+        calls.append((action_name, params, success, before, after,
+                      triggers, breakdown.total))
+        return breakdown
+
+    scalar.calculate_action_reward = recording
+    # Each game resets the field advantage smoothing
+    reset = scalar.reset_episode_tracking
+    scalar.reset_episode_tracking = lambda: (calls.append(None), reset())
+    bots = [make_bot("heuristic", env), make_bot("random", env, seed=0)]
+    for seed in range(3):
+        play_game(env, bots, max_turns=40, seed=seed)
+    assert {call[0] for call in calls if call} >= {"summon", "attack"}
+
+    # Field advantage smoothing depends on the order, replay it as played
+    batch = BatchRewardCalculator(1, GameEnv.ACTIONS)
+    for call in calls:
+        if call is None:
+            batch.reset()
+            continue
+        name, params, success, before, after, triggers, total = call
+        toggle = (params or {}).get("toggle", NO_TOGGLE)
+        rewards = batch.calculate(
+            [GameEnv.ACTIONS.index(name)], [success], [before], [after],
+            toggle_index=[toggle], trap_triggers=[triggers])
+        np.testing.assert_allclose(rewards[0], total, atol=1e-9,
+                                   err_msg=name)
@@ -13,6 +13,7 @@ from ml.storage import ReplayBuffer, ReservoirBuffer
 from ml.models import DuelingDQN, PDQN, AveragePolicy
 from ml.trainer.buffer_manager import BufferManager
 from ml.utils import update_target
+from ml.profiler import profiler
 
 
 class Agent:
@@ -129,14 +130,17 @@ class Agent:
             self._check_and_reset_weights(self.pdqn.actor, "pdqn.actor")
             self._check_and_reset_weights(self.pdqn.critic, "pdqn.critic")
 
-        rl_loss = self._update_rl_network()
-        sl_loss = self._update_sl_network()
+        with profiler.span("update_rl"):
+            rl_loss = self._update_rl_network()
+        with profiler.span("update_sl"):
+            sl_loss = self._update_sl_network()
 
         self.rl_losses.append(rl_loss.item())
         self.sl_losses.append(sl_loss.item())
 
         if self.use_pdqn:
-            self._update_pdqn_network()
+            with profiler.span("update_pdqn"):
+                self._update_pdqn_network()
 
     @staticmethod
     def _check_and_reset_weights(model, model_name="model"):
@@ -159,7 +163,8 @@ class Agent:
 
     def _update_rl_network(self):
         """Update DQN network."""
-        batch = self.replay_buffer.sample(self.cfg.BATCH_SIZE)
+        with profiler.span("sample"):
+            batch = self.replay_buffer.sample(self.cfg.BATCH_SIZE)
         state, action, reward, next_state, done = batch
 
         # Convert to tensors
@@ -190,7 +195,8 @@ class Agent:
 
     def _update_sl_network(self):
         """Update average policy network."""
-        state, action = self.reservoir.sample(self.cfg.BATCH_SIZE)
+        with profiler.span("sample"):
+            state, action = self.reservoir.sample(self.cfg.BATCH_SIZE)
 
         state = torch.FloatTensor(state).to(self.cfg.DEVICE)
         action = torch.LongTensor(action).to(self.cfg.DEVICE)
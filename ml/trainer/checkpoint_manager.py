@@ -0,0 +1,221 @@
+"""
+Versioned, atomic, non-blocking training checkpoints.
+"""
+import copy
+import logging
+import os
+import random
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import torch
+
+
+OPTIMIZERS = (
+    "rl_optimizer",
+    "sl_optimizer",
+    "pdqn_critic_opt",
+    "pdqn_actor_opt",
+    "pdqn_alpha_opt",
+)
+BUFFERS = ("replay_buffer", "reservoir", "param_buffer")
+
+
+def _to_cpu(obj):
+    """Recursively clone tensors to CPU so training can keep mutating them."""
+    if torch.is_tensor(obj):
+        return obj.detach().to("cpu", copy=True)
+    if isinstance(obj, dict):
+        return {k: _to_cpu(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(_to_cpu(v) for v in obj)
+    return copy.deepcopy(obj)
+
+
+class CheckpointManager:
+    """
+    Saves full training state (networks, optimizers, buffers, RNG and
+    episode counters) as ckpt_<frame>.pth in `directory`.
+
+    The state is copied to CPU on the calling thread, then pickled by a
+    background thread into a temp file that is atomically renamed, so a
+    crash never leaves a half-written checkpoint behind. Only the last
+    `keep_last` checkpoints are kept.
+    """
+
+    PREFIX = "ckpt_"
+
+    def __init__(self, config, directory=None, keep_last=None):
+        self.cfg = config
+        self.directory = Path(directory or config.CHECKPOINT_DIR)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.keep_last = keep_last or config.CHECKPOINT_KEEP_LAST
+        self.save_buffers = config.CHECKPOINT_SAVE_BUFFERS
+        self.logger = logging.getLogger("CheckpointManager")
+
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+
+    # ------------------------------------------------------------------
+    # Saving
+    # ------------------------------------------------------------------
+
+    def save(self, frame_idx: int, agents, episode_manager,
+             episode_idx: int = 0):
+        """
+        Snapshot training state and write it in the background.
+
+        Args:
+            episode_idx: Episodes started so far, the next episode's
+                game seed is derived from it
+        """
+        # At most one write in flight, bounds memory to one extra copy
+        self.wait()
+
+        state = {
+            "frame_idx": frame_idx,
+            "episode_idx": episode_idx,
+            "agents": [self._agent_state(agent) for agent in agents],
+            "episode_manager": copy.deepcopy(episode_manager.__dict__),
+            "rng": self._rng_state(),
+        }
+        # Inference-only export in the save_model layout for AIOpponent
+        export = {}
+        for i, agent_state in enumerate(state["agents"]):
+            export[f"agent_{i}_model"] = agent_state["dqn"]
+            export[f"agent_{i}_policy"] = agent_state["policy"]
+
+        self._thread = threading.Thread(
+            target=self._write,
+            args=(state, export, frame_idx),
+            name="CheckpointWriter",
+            daemon=True
+        )
+        self._thread.start()
+
+    def wait(self):
+        """Block until the pending write (if any) is on disk."""
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._error is not None:
+            error, self._error = self._error, None
+            self.logger.error(f"Previous checkpoint write failed: {error}")
+
+    def close(self):
+        self.wait()
+
+    def _agent_state(self, agent) -> Dict:
+        state = {
+            "dqn": _to_cpu(agent.dqn.state_dict()),
+            "target_dqn": _to_cpu(agent.target_dqn.state_dict()),
+            "policy": _to_cpu(agent.policy.state_dict()),
+            "optimizers": {},
+            "buffers": {},
+            "rl_losses": list(agent.rl_losses),
+            "sl_losses": list(agent.sl_losses),
+        }
+        if agent.use_pdqn:
+            state["pdqn"] = _to_cpu(agent.pdqn.state_dict())
+
+        for name in OPTIMIZERS:
+            if hasattr(agent, name):
+                state["optimizers"][name] = _to_cpu(
+                    getattr(agent, name).state_dict())
+
+        if self.save_buffers:
+            # Transitions are never mutated after push, a shallow copy
+            # of the deque is enough
+            for name in BUFFERS:
+                if hasattr(agent, name):
+                    state["buffers"][name] = list(getattr(agent, name).buffer)
+        return state
+
+    @staticmethod
+    def _rng_state() -> Dict:
+        state = {
+            "python": random.getstate(),
+            "numpy": np.random.get_state(),
+            "torch": torch.get_rng_state(),
+        }
+        if torch.cuda.is_available():
+            state["cuda"] = torch.cuda.get_rng_state_all()
+        return state
+
+    def _write(self, state, export, frame_idx):
+        try:
+            path = self.directory / f"{self.PREFIX}{frame_idx:09d}.pth"
+            self._atomic_save(state, path)
+            self._atomic_save(export, Path(self.cfg.CHECKPOINT_PATH))
+            self._prune()
+            self.logger.info(f"Checkpoint saved to {path}")
+        except BaseException as e:
+            self._error = e
+
+    @staticmethod
+    def _atomic_save(obj, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            torch.save(obj, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _prune(self):
+        for path in self.list_checkpoints()[:-self.keep_last]:
+            path.unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def list_checkpoints(self) -> List[Path]:
+        return sorted(self.directory.glob(f"{self.PREFIX}*.pth"))
+
+    def load_latest(self) -> Optional[Dict]:
+        """Return the newest readable checkpoint, or None."""
+        for path in reversed(self.list_checkpoints()):
+            try:
+                state = torch.load(path, map_location="cpu",
+                                   weights_only=False)
+                self.logger.info(f"Resuming from {path}")
+                return state
+            except Exception as e:
+                self.logger.warning(f"Skipping unreadable {path}: {e}")
+        return None
+
+    def restore(self, state: Dict, agents, episode_manager):
+        """Load networks, optimizers, buffers and episode counters."""
+        for agent, agent_state in zip(agents, state["agents"]):
+            agent.dqn.load_state_dict(agent_state["dqn"])
+            agent.target_dqn.load_state_dict(agent_state["target_dqn"])
+            agent.policy.load_state_dict(agent_state["policy"])
+            if agent.use_pdqn and "pdqn" in agent_state:
+                agent.pdqn.load_state_dict(agent_state["pdqn"])
+
+            for name, opt_state in agent_state["optimizers"].items():
+                if hasattr(agent, name):
+                    getattr(agent, name).load_state_dict(opt_state)
+
+            for name, items in agent_state["buffers"].items():
+                if hasattr(agent, name):
+                    buffer = getattr(agent, name)
+                    buffer.buffer = deque(items, maxlen=buffer.buffer.maxlen)
+
+            agent.rl_losses = list(agent_state["rl_losses"])
+            agent.sl_losses = list(agent_state["sl_losses"])
+
+        episode_manager.__dict__.update(state["episode_manager"])
+
+    @staticmethod
+    def restore_rng(state: Dict):
+        rng = state["rng"]
+        random.setstate(rng["python"])
+        np.random.set_state(rng["numpy"])
+        torch.set_rng_state(rng["torch"])
+        if "cuda" in rng and torch.cuda.is_available():
+            torch.cuda.set_rng_state_all(rng["cuda"])
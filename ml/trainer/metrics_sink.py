@@ -0,0 +1,132 @@
+"""
+Buffered, non-blocking metrics logging.
+
+Metrics are queued on the training thread and written in batches by a
+background thread, either to MLflow (`log_batch`) or to a local JSONL
+file for boxes without a tracking server.
+"""
+import json
+import logging
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# (key, value, timestamp_ms, step)
+MetricRecord = Tuple[str, float, int, int]
+
+
+class MLflowBackend:
+    """Writes batches to an MLflow run with `MlflowClient.log_batch`."""
+
+    MAX_BATCH = 1000  # MLflow limit per log_batch call
+
+    def __init__(self, run_id: str):
+        from mlflow.tracking import MlflowClient
+
+        self.client = MlflowClient()
+        self.run_id = run_id
+
+    def write(self, records: List[MetricRecord]):
+        from mlflow.entities import Metric
+
+        metrics = [Metric(key, float(value), ts, step)
+                   for key, value, ts, step in records]
+        for start in range(0, len(metrics), self.MAX_BATCH):
+            self.client.log_batch(
+                self.run_id, metrics=metrics[start:start + self.MAX_BATCH])
+
+    def close(self):
+        pass
+
+
+class JsonlBackend:
+    """Appends one JSON object per metric to a local file."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def write(self, records: List[MetricRecord]):
+        for key, value, ts, step in records:
+            self._file.write(json.dumps(
+                {"key": key, "value": float(value),
+                 "timestamp": ts, "step": step}) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class NullBackend:
+    def write(self, records: List[MetricRecord]):
+        pass
+
+    def close(self):
+        pass
+
+
+class MetricsSink:
+    """
+    Queue metrics and flush them from a daemon thread every
+    `flush_interval` seconds (or when `max_pending` records pile up).
+    """
+
+    def __init__(self, backend, flush_interval: float = 5.0,
+                 max_pending: int = 1000):
+        self.backend = backend
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self.logger = logging.getLogger("MetricsSink")
+
+        self._queue: "queue.Queue[MetricRecord]" = queue.Queue()
+        self._flush_requested = threading.Event()
+        self._closed = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="MetricsSink", daemon=True)
+        self._thread.start()
+
+    def log(self, metrics: Dict[str, float], step: int):
+        """Queue a dict of metrics for `step`, never blocks on I/O."""
+        ts = int(time.time() * 1000)
+        for key, value in metrics.items():
+            self._queue.put((key, float(value), ts, step))
+        if self._queue.qsize() >= self.max_pending:
+            self._flush_requested.set()
+
+    def flush(self):
+        """Ask the writer thread to write everything queued so far."""
+        self._flush_requested.set()
+
+    def close(self):
+        """Flush remaining metrics and stop the writer thread."""
+        self._closed.set()
+        self._flush_requested.set()
+        self._thread.join()
+        self.backend.close()
+
+    def _run(self):
+        while True:
+            self._flush_requested.wait(self.flush_interval)
+            self._flush_requested.clear()
+            self._drain()
+            if self._closed.is_set():
+                self._drain()
+                return
+
+    def _drain(self):
+        records = []
+        while True:
+            try:
+                records.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if not records:
+            return
+        try:
+            self.backend.write(records)
+        except Exception as e:
+            self.logger.warning(
+                f"Dropped {len(records)} metrics, write failed: {e}")
@@ -5,10 +5,21 @@ MLFlow experiment tracking management.
 import mlflow
 import logging
 
+from ml.trainer.metrics_sink import (
+    MetricsSink,
+    MLflowBackend,
+    JsonlBackend,
+    NullBackend,
+)
+
 
 class MLFlowManager:
     """
-    Manages MLFlow experiment tracking and UI.
+    Manages MLFlow experiment tracking and the buffered metrics sink.
+
+    `config.METRICS_BACKEND` selects where metrics go: "mlflow" (tracking
+    server at `config.MLFLOW_TRACKING_URI`), "jsonl" (local file at
+    `config.METRICS_PATH`, no server needed) or "none".
     """
 
     def __init__(self,
@@ -16,27 +27,47 @@ class MLFlowManager:
                  experiment_name: str = "antfantasy-training"):
         self.experiment_name = experiment_name
         self.cfg = config
-        self._setup_mlflow()
+        self.backend = config.METRICS_BACKEND
+        self.sink = None
+
+        if self.backend == "mlflow":
+            self._setup_mlflow()
 
     def _setup_mlflow(self):
         """Configure MLFlow tracking URI and experiment."""
-        url = "http://localhost:5000"
+        url = self.cfg.MLFLOW_TRACKING_URI
         mlflow.set_tracking_uri(url)
         mlflow.set_experiment(self.experiment_name)
-        logging.info(f"Server is running at {url}")
+        logging.info(f"Tracking metrics at {url}")
 
     def start_run(self):
-        """Start MLFlow run and launch UI."""
-        mlflow.start_run()
+        """Start the run and the background metrics writer."""
+        if self.backend == "mlflow":
+            run = mlflow.start_run()
+            backend = MLflowBackend(run.info.run_id)
+        elif self.backend == "jsonl":
+            backend = JsonlBackend(self.cfg.METRICS_PATH)
+            logging.info(f"Writing metrics to {self.cfg.METRICS_PATH}")
+        elif self.backend == "none":
+            backend = NullBackend()
+        else:
+            raise ValueError(f"Unknown metrics backend: {self.backend}")
+
+        self.sink = MetricsSink(backend, self.cfg.METRICS_FLUSH_INTERVAL)
 
     def log_metrics(self, metrics: dict, step: int):
-        """Log metrics to MLFlow."""
-        mlflow.log_metrics(metrics, step=step)
+        """Queue metrics, written in batches by the sink thread."""
+        self.sink.log(metrics, step)
 
     def log_params(self, params: dict):
         """Log parameters to MLFlow."""
-        mlflow.log_params(params)
+        if self.backend == "mlflow":
+            mlflow.log_params(params)
 
     def end_run(self):
-        """End current MLFlow run."""
-        mlflow.end_run()
+        """Flush pending metrics and end the current run."""
+        if self.sink is not None:
+            self.sink.close()
+            self.sink = None
+        if self.backend == "mlflow":
+            mlflow.end_run()
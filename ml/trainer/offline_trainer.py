@@ -0,0 +1,188 @@
+"""
+Offline training from recorded games, without stepping the engine.
+
+DuelingDQN is trained with conservative Q-learning (CQL) and the
+AveragePolicy with behavior cloning on transitions recorded by
+`EpisodeRecorder` (self-play runs or human-vs-AI games from main.py).
+
+Usage:
+  python -m ml.trainer.offline_trainer ml/saves/episodes
+  python -m ml.trainer.offline_trainer ml/saves/episodes --player 1 --epochs 20
+"""
+import argparse
+import logging
+import time
+from pathlib import Path
+from typing import Dict
+
+import torch
+import torch.nn.functional as F
+import torch.optim as optim
+from torch.utils.data import DataLoader
+
+from ml.config import Config
+from ml.models import DuelingDQN, AveragePolicy
+from ml.storage.offline_dataset import TransitionDataset
+from ml.utils import save_model, set_global_seeds, update_target
+
+
+class OfflineTrainer:
+    """
+    CQL for the DQN and behavior cloning for the average policy.
+
+    Args:
+        dataset: TransitionDataset yielding minibatches
+        state_dim: State vector size
+        num_actions: Number of discrete actions
+        config: Training config (OFFLINE_* settings)
+    """
+
+    def __init__(self, dataset: TransitionDataset, state_dim: int,
+                 num_actions: int, config):
+        self.dataset = dataset
+        self.cfg = config
+        self.device = torch.device(config.DEVICE)
+
+        self.dqn = DuelingDQN(state_dim, num_actions).to(self.device)
+        self.target_dqn = DuelingDQN(state_dim, num_actions).to(self.device)
+        update_target(self.dqn, self.target_dqn)
+        self.policy = AveragePolicy(state_dim, num_actions).to(self.device)
+
+        self.rl_optimizer = optim.Adam(
+            self.dqn.parameters(), lr=config.OFFLINE_LR)
+        self.sl_optimizer = optim.Adam(
+            self.policy.parameters(), lr=config.OFFLINE_LR)
+
+        self.loader = DataLoader(
+            dataset,
+            batch_size=None,
+            num_workers=config.OFFLINE_WORKERS,
+            pin_memory=self.device.type == "cuda",
+            persistent_workers=False,
+        )
+        self.updates = 0
+
+    def train(self, epochs: int):
+        for epoch in range(epochs):
+            self.dataset.set_epoch(epoch)
+            start = time.perf_counter()
+            totals = {"td": 0.0, "cql": 0.0, "bc": 0.0}
+            batches = samples = 0
+
+            for batch in self.loader:
+                losses = self.update(batch)
+                for key in totals:
+                    totals[key] += losses[key]
+                batches += 1
+                samples += len(batch["action"])
+
+            duration = time.perf_counter() - start
+            means = {k: v / max(batches, 1) for k, v in totals.items()}
+            logging.info(
+                f"[Epoch {epoch + 1}/{epochs}] "
+                f"TD={means['td']:.4f} CQL={means['cql']:.4f} "
+                f"BC={means['bc']:.4f} | "
+                f"{samples / max(duration, 1e-9):.0f} samples/s")
+
+    def update(self, batch: Dict[str, torch.Tensor]) -> Dict[str, float]:
+        batch = {k: v.to(self.device, non_blocking=True)
+                 for k, v in batch.items()}
+        td_loss, cql_loss = self._update_rl_network(batch)
+        bc_loss = self._update_sl_network(batch)
+
+        self.updates += 1
+        if self.updates % self.cfg.OFFLINE_TARGET_UPDATE == 0:
+            update_target(self.dqn, self.target_dqn)
+
+        return {"td": td_loss, "cql": cql_loss, "bc": bc_loss}
+
+    def _update_rl_network(self, batch):
+        """Double-DQN TD loss plus the CQL(H) regularizer on legal actions."""
+        state, action, mask = batch["state"], batch["action"], batch["mask"]
+
+        q_values = self.dqn(state)
+        current_q = q_values.gather(1, action.unsqueeze(1)).squeeze(1)
+
+        with torch.no_grad():
+            next_q = self.dqn(batch["next_state"]).masked_fill(
+                ~batch["next_mask"], float('-inf'))
+            next_action = next_q.argmax(dim=1, keepdim=True)
+            next_target = self.target_dqn(batch["next_state"]).gather(
+                1, next_action).squeeze(1)
+            expected_q = batch["reward"] + self.cfg.GAMMA * \
+                next_target * (1 - batch["done"])
+
+        td_loss = F.smooth_l1_loss(current_q, expected_q)
+
+        # Push down Q of unseen legal actions, push up the dataset action
+        legal_q = q_values.masked_fill(~mask, float('-inf'))
+        cql_loss = (torch.logsumexp(legal_q, dim=1) - current_q).mean()
+
+        loss = td_loss + self.cfg.CQL_ALPHA * cql_loss
+        self.rl_optimizer.zero_grad()
+        loss.backward()
+        torch.nn.utils.clip_grad_norm_(self.dqn.parameters(), max_norm=1.0)
+        self.rl_optimizer.step()
+
+        return td_loss.item(), cql_loss.item()
+
+    def _update_sl_network(self, batch):
+        """Behavior cloning of the recorded actions the agent chose."""
+        probs = self.policy(batch["state"])
+        log_probs = probs.gather(1, batch["action"].unsqueeze(1)).clamp(
+            min=1e-8).log().squeeze(1)
+        # Random filler actions are still fine for TD, but not worth imitating
+        chosen = batch["chosen"]
+        loss = -(log_probs * chosen).sum() / chosen.sum().clamp(min=1.0)
+
+        self.sl_optimizer.zero_grad()
+        loss.backward()
+        self.sl_optimizer.step()
+
+        return loss.item()
+
+    def save(self, checkpoint_path, agent_id: int = 0):
+        """Save in the `save_model` layout so AIOpponent can load it."""
+        save_model(logging,
+                   models={f"agent_{agent_id}": self.dqn},
+                   policies={f"agent_{agent_id}": self.policy},
+                   checkpoint_path=checkpoint_path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("recordings", nargs="+", type=Path,
+                        help="recording files or directories")
+    parser.add_argument("--output", type=Path,
+                        default=Config.OFFLINE_CHECKPOINT_PATH)
+    parser.add_argument("--epochs", type=int, default=Config.OFFLINE_EPOCHS)
+    parser.add_argument("--batch-size", type=int,
+                        default=Config.OFFLINE_BATCH_SIZE)
+    parser.add_argument("--player", type=int, default=None,
+                        help="only learn from this player's actions")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(levelname)s] %(message)s",
+        datefmt="%H:%M:%S"
+    )
+    cfg = Config()
+    set_global_seeds(cfg.SEED)
+
+    dataset = TransitionDataset(args.recordings,
+                                batch_size=args.batch_size,
+                                player=args.player,
+                                seed=cfg.SEED)
+    sample = next(iter(dataset))
+    trainer = OfflineTrainer(dataset,
+                             state_dim=sample["state"].shape[1],
+                             num_actions=sample["mask"].shape[1],
+                             config=cfg)
+    trainer.train(args.epochs)
+    trainer.save(args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,6 +6,12 @@ from ml.trainer.action_mapper import ActionMapper
 from ml.trainer.mlflow_manager import MLFlowManager
 from ml.trainer.episode_manager import EpisodeManager
 from ml.trainer.training_loop import TrainingLoop
+from ml.trainer.checkpoint_manager import CheckpointManager
+from ml.league import League
+from ml.storage import EpisodeRecorder
+from ml.storage.game_replay import ReplayRecorder
+from ml.environment.visualizer import Visualizer
+from ml.profiler import profiler
 from ml.utils import (
     set_global_seeds,
     save_model,
@@ -33,8 +39,23 @@ class Trainer:
         self.episode_manager = EpisodeManager(num_agents)
         self.mlflow_manager = MLFlowManager(config)
         self.action_mapper = ActionMapper(env)
-
-        self._load_checkpoints_if_exist()
+        self.league = League(config) if config.LEAGUE_ENABLED else None
+        self.checkpoint_manager = CheckpointManager(config)
+
+        # Prefer a full training checkpoint, fall back to model weights
+        self.resume_state = self.checkpoint_manager.load_latest()
+        if self.resume_state is not None:
+            self.checkpoint_manager.restore(
+                self.resume_state, self.agents, self.episode_manager)
+            # Only the counters and RNG are needed past this point
+            self.resume_state = {
+                "frame_idx": self.resume_state["frame_idx"],
+                # Checkpoints from before episode_idx was saved
+                "episode_idx": self.resume_state.get("episode_idx", 0),
+                "rng": self.resume_state["rng"],
+            }
+        else:
+            self._load_checkpoints_if_exist()
         logging.info(f"Currently running on device: {self.cfg.DEVICE}")
 
     def _initialize_agents(self) -> List[Agent]:
@@ -75,19 +96,79 @@ class Trainer:
     def train(self):
         """Execute the main training loop."""
         set_global_seeds(self.cfg.SEED)
+        profiler.enabled = self.cfg.PROFILE
         self.mlflow_manager.start_run()
 
+        start_frame, start_episode = 1, 0
+        if self.resume_state is not None:
+            self.checkpoint_manager.restore_rng(self.resume_state)
+            start_frame = self.resume_state["frame_idx"] + 1
+            start_episode = self.resume_state["episode_idx"]
+            logging.info(f"Resuming training at frame {start_frame}, "
+                         f"episode {start_episode}")
+
         training_loop = TrainingLoop(
             env=self.env,
             agents=self.agents,
             action_mapper=self.action_mapper,
             episode_manager=self.episode_manager,
-            config=self.cfg
+            config=self.cfg,
+            league=self.league,
+            checkpoint_manager=self.checkpoint_manager,
+            metrics_sink=self.mlflow_manager.sink
         )
 
-        training_loop.run()
+        recorder = self._start_recording()
+        replay_recorder = self._start_replays()
+        visualizer = self._start_visualizer()
+        training_loop.run(start_frame, start_episode)
+        if recorder is not None:
+            recorder.close()
+            self.env.set_recorder(None)
+        if replay_recorder is not None:
+            replay_recorder.close()
+            self.env.set_replay_recorder(None)
+        if visualizer is not None:
+            visualizer.close()
+            self.env.set_visualizer(None)
+        self.checkpoint_manager.close()
+        self.mlflow_manager.end_run()
         self._save_final_models()
 
+        if self.league is not None:
+            self.league.close()
+
+    def _start_recording(self):
+        """Attach an episode recorder to the env if enabled."""
+        if not self.cfg.RECORD_EPISODES:
+            return None
+        recorder = EpisodeRecorder(
+            self.cfg.EPISODES_PATH,
+            self.env.state_dim,
+            self.env.num_actions,
+            row_group_size=self.cfg.RECORD_ROW_GROUP_SIZE
+        )
+        self.env.set_recorder(recorder)
+        return recorder
+
+    def _start_replays(self):
+        """Attach a game replay recorder to the env if enabled."""
+        if not self.cfg.RECORD_REPLAYS:
+            return None
+        recorder = ReplayRecorder(self.cfg.REPLAYS_PATH)
+        self.env.set_replay_recorder(recorder)
+        return recorder
+
+    def _start_visualizer(self):
+        """Attach a live visualizer to the env if enabled."""
+        if not self.cfg.VISUALIZE:
+            return None
+        visualizer = Visualizer(fps=self.cfg.VISUALIZE_FPS,
+                                headless=self.cfg.VISUALIZE_HEADLESS,
+                                video=self.cfg.VISUALIZE_VIDEO)
+        self.env.set_visualizer(visualizer)
+        return visualizer
+
     def _save_final_models(self):
         """Save final trained models."""
         models = {
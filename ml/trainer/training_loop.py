@@ -3,10 +3,14 @@ import random
 import logging
 from typing import List, Dict
 
+import mlflow
+
 from ml.trainer.agent import Agent
 from ml.trainer.action_mapper import ActionMapper
 from ml.trainer.episode_manager import EpisodeManager
 from ml.utils import epsilon_scheduler, log_training_metrics, save_model
+from ml.profiler import profiler
+from core.utils import derive_seed
 
 
 class TrainingLoop:
@@ -15,6 +19,7 @@ class TrainingLoop:
     """
 
     MAX_STEPS_PER_EPISODE = 1000
+    LEAGUE_SEAT = 1  # agent index replaced by pool opponents
 
     def __init__(
         self,
@@ -22,13 +27,26 @@ class TrainingLoop:
         agents: List[Agent],
         action_mapper: ActionMapper,
         episode_manager: EpisodeManager,
-        config
+        config,
+        league=None,
+        checkpoint_manager=None,
+        metrics_sink=None
     ):
         self.env = env
         self.agents = agents
         self.action_mapper = action_mapper
         self.episode_manager = episode_manager
         self.cfg = config
+        self.league = league
+        self.checkpoint_manager = checkpoint_manager
+        self.metrics_sink = metrics_sink
+
+        # Episode counter, each episode gets its own derived game seed
+        self.episode_idx = 0
+
+        # Frozen pool opponent, built on first use
+        self.league_opponent = None
+        self.league_active = False
 
         self.epsilon_scheduler = epsilon_scheduler(
             self.cfg.EPS_START,
@@ -36,12 +54,15 @@ class TrainingLoop:
             self.cfg.EPS_DECAY
         )
 
-    def run(self):
-        """Execute the main training loop."""
-        states = list(self.env.reset())
+    def run(self, start_frame: int = 1, start_episode: int = 0):
+        """Execute the main training loop, `start_episode` continues the
+        per-episode seed sequence of a resumed run."""
+        self.episode_idx = start_episode
+        states = self._reset_env()
+        self._sample_league_opponent()
         start_time = time.time()
 
-        for frame_idx in range(1, self.cfg.MAX_FRAMES + 1):
+        for frame_idx in range(start_frame, self.cfg.MAX_FRAMES + 1):
             epsilon = self.epsilon_scheduler(frame_idx)
 
             # Execute single step
@@ -57,7 +78,13 @@ class TrainingLoop:
             # Handle episode completion
             if done or self._episode_too_long():
                 self._handle_episode_end(done)
-                states = list(self.env.reset())
+                states = self._reset_env()
+                self._sample_league_opponent()
+
+            # Periodic league snapshots
+            if (self.league is not None and
+                    frame_idx % self.cfg.LEAGUE_SNAPSHOT_INTERVAL == 0):
+                self.league.snapshot(self.agents[0], frame_idx)
 
             # Periodic evaluation and checkpointing
             if frame_idx % self.cfg.EVALUATION_INTERVAL == 0:
@@ -65,31 +92,39 @@ class TrainingLoop:
                     frame_idx, duration=time.time()-start_time)
                 start_time = time.time()
 
+    def _reset_env(self) -> List:
+        """Start the next episode with a reproducible per-episode seed."""
+        seed = derive_seed(self.cfg.SEED, self.episode_idx)
+        self.episode_idx += 1
+        return list(self.env.reset(seed=seed))
+
     def _execute_step(self, states: List, epsilon: float):
         """Execute a single training step for all agents."""
         best_response = random.random() >= self.cfg.ETA
 
         # Select actions for all agents
         actions, selected_params = self._select_all_actions(
-            self.agents, states, epsilon, best_response)
+            self._acting_agents(), states, epsilon, best_response)
 
         # Step environment
-        next_states, rewards, done, info = self.env.step(actions)
+        with profiler.span("env_step"):
+            next_states, rewards, done, info = self.env.step(actions)
 
         # Record winner if episode done
         if done:
             self._record_winner()
 
         # Store transitions for all agents
-        self._store_transitions(
-            states,
-            actions,
-            rewards,
-            next_states,
-            done,
-            best_response,
-            selected_params
-        )
+        with profiler.span("buffer_push"):
+            self._store_transitions(
+                states,
+                actions,
+                rewards,
+                next_states,
+                done,
+                best_response,
+                selected_params
+            )
 
         return next_states, done
 
@@ -108,25 +143,26 @@ class TrainingLoop:
             # Get current action mask from environment
             mask, legal_params = self.env.get_legal_actions(agent_idx)
 
-            # Select discrete action
-            discrete_action = agent.select_action_with_mask(
-                state,
-                mask,
-                epsilon,
-                best_response
-            )
-
-            # Select continuous parameters if using PDQN
-            cont_params = agent.select_continuous_params(state)
-            selected_params[agent_idx] = cont_params
-
-            # Map to environment action
-            action_idx, param_dict = self.action_mapper.map(
-                agent_idx,
-                discrete_action,
-                cont_params,
-                legal_params
-            )
+            with profiler.span("action_selection"):
+                # Select discrete action
+                discrete_action = agent.select_action_with_mask(
+                    state,
+                    mask,
+                    epsilon,
+                    best_response
+                )
+
+                # Select continuous parameters if using PDQN
+                cont_params = agent.select_continuous_params(state)
+                selected_params[agent_idx] = cont_params
+
+                # Map to environment action
+                action_idx, param_dict = self.action_mapper.map(
+                    agent_idx,
+                    discrete_action,
+                    cont_params,
+                    legal_params
+                )
 
             # Store for environment (1-indexed players)
             player_id = str(agent_idx + 1)
@@ -146,6 +182,13 @@ class TrainingLoop:
     ):
         """Store transitions in agent buffers."""
         for agent_idx, agent in enumerate(self.agents):
+            # Track episode reward
+            self.episode_manager.add_reward(agent_idx, rewards[agent_idx])
+
+            # Pool opponents are frozen, their experience is not stored
+            if self.league_active and agent_idx == self.LEAGUE_SEAT:
+                continue
+
             # Extract action info for this agent
             player_id = str(agent_idx + 1)
             action_idx, _ = actions[player_id][0]
@@ -167,8 +210,35 @@ class TrainingLoop:
             if not best_response:
                 agent.reservoir.push(states[agent_idx], action_idx)
 
-            # Track episode reward
-            self.episode_manager.add_reward(agent_idx, rewards[agent_idx])
+    def _acting_agents(self) -> List[Agent]:
+        """Agents choosing actions this step, with the pool opponent seated."""
+        if not self.league_active:
+            return self.agents
+        agents = list(self.agents)
+        agents[self.LEAGUE_SEAT] = self.league_opponent
+        return agents
+
+    def _sample_league_opponent(self):
+        """Decide whether the next episode is played against the pool."""
+        self.league_active = False
+        if self.league is None:
+            return
+        if random.random() >= self.cfg.LEAGUE_OPPONENT_PROB:
+            return
+
+        version = self.league.sample_opponent()
+        if version is None:
+            return
+
+        if self.league_opponent is None:
+            self.league_opponent = Agent(
+                state_dim=self.env.state_dim,
+                num_actions=self.env.num_actions,
+                param_dim=self.env.param_dim,
+                config=self.cfg
+            )
+        self.league.pool.load_into(version, self.league_opponent)
+        self.league_active = True
 
     def _record_winner(self):
         """Record the winner of the episode."""
@@ -214,11 +284,28 @@ class TrainingLoop:
             [agent.rl_losses for agent in self.agents],
             [agent.sl_losses for agent in self.agents],
             stats["wins"],
-            self.cfg.UPDATE_TARGET_FREQ,
+            self.cfg.EVALUATION_INTERVAL,
             duration,
-            logging
+            logging,
+            self.metrics_sink
         )
 
+        # Per-phase timings for this interval
+        if profiler.enabled:
+            logging.info(f"Phase timings (frame {frame_idx}):\n"
+                         f"{profiler.format_table()}")
+            if self.metrics_sink is not None:
+                self.metrics_sink.log(profiler.metrics(), frame_idx)
+            else:
+                mlflow.log_metrics(profiler.metrics(), step=frame_idx)
+            profiler.reset()
+
+        if self.checkpoint_manager is not None:
+            self.checkpoint_manager.save(
+                frame_idx, self.agents, self.episode_manager,
+                episode_idx=self.episode_idx)
+            return
+
         # Save models
         models = {
             f"agent_{i}": agent.dqn
@@ -28,9 +28,10 @@ def log_training_metrics(frame_idx,
                          rl_losses,
                          sl_losses,
                          wins,
-                         update_freq,
+                         interval,
                          duration,
-                         logging):
+                         logging,
+                         sink=None):
     def mean_safe(x):
         return np.mean(x) if len(x) > 0 else 0.0
 
@@ -42,8 +43,10 @@ def log_training_metrics(frame_idx,
     p1_sl, p2_sl = map(mean_safe, sl_losses)
     p1_wins, p2_wins = wins
     total_wins = max(p1_wins + p2_wins, 1)
-    fps = int(update_freq/duration)
-    time_left = datetime.timedelta(seconds=int((max_frames-frame_idx)/fps))
+    # Frames per second over the last evaluation interval
+    fps = int(interval / duration) if duration > 0 else 0
+    time_left = datetime.timedelta(
+        seconds=int((max_frames - frame_idx) / max(fps, 1)))
 
     # Console logging
     logging.info(
@@ -60,18 +63,25 @@ def log_training_metrics(frame_idx,
         f"P2 wins={p2_wins} ({p2_wins / total_wins:.2f})"
     )
 
-    # MLflow logging
-    mlflow.log_metric("P1/Reward/Average", p1_avg_reward, step=frame_idx)
-    mlflow.log_metric("P2/Reward/Average", p2_avg_reward, step=frame_idx)
-    mlflow.log_metric("Episode/Length", avg_length, step=frame_idx)
-    mlflow.log_metric("P1/RL_Loss", p1_rl, step=frame_idx)
-    mlflow.log_metric("P1/SL_Loss", p1_sl, step=frame_idx)
-    mlflow.log_metric("P2/RL_Loss", p2_rl, step=frame_idx)
-    mlflow.log_metric("P2/SL_Loss", p2_sl, step=frame_idx)
-    mlflow.log_metric("P1/Wins", p1_wins, step=frame_idx)
-    mlflow.log_metric("P2/Wins", p2_wins, step=frame_idx)
-    mlflow.log_metric("P1/WinRate", p1_wins / total_wins, step=frame_idx)
-    mlflow.log_metric("P2/WinRate", p2_wins / total_wins, step=frame_idx)
+    # Metrics logging, batched through the sink when one is given
+    metrics = {
+        "P1/Reward/Average": p1_avg_reward,
+        "P2/Reward/Average": p2_avg_reward,
+        "Episode/Length": avg_length,
+        "P1/RL_Loss": p1_rl,
+        "P1/SL_Loss": p1_sl,
+        "P2/RL_Loss": p2_rl,
+        "P2/SL_Loss": p2_sl,
+        "P1/Wins": p1_wins,
+        "P2/Wins": p2_wins,
+        "P1/WinRate": p1_wins / total_wins,
+        "P2/WinRate": p2_wins / total_wins,
+        "FPS": fps,
+    }
+    if sink is not None:
+        sink.log(metrics, frame_idx)
+    else:
+        mlflow.log_metrics(metrics, step=frame_idx)
 
     # Reset buffers for next interval
     for buf in [*rewards, *rl_losses, *sl_losses, lengths]: